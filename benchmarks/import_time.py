@@ -0,0 +1,64 @@
+"""
+Mede o tempo de importação dos módulos de entrada do crawler.
+
+    python -m benchmarks.import_time [--repeat 5]
+
+Cada importação roda num interpretador novo, para não aproveitar módulos já
+carregados, e a tabela mostra a mediana e quais dependências pesadas o
+módulo acabou trazendo. Os scrapers entram por último: é o custo que o
+registro adia até o primeiro uso de cada site.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+MODULES = (
+    "src.storage",
+    "src.config",
+    "src.scrapers.registry",
+    "src.crawler_manager",
+    "main",
+    "src.scrapers.imdb_scraper",
+    "src.scrapers.lettr_scraper",
+    "src.scrapers.rott_scraper",
+)
+
+HEAVY = ("bs4", "lxml", "selenium", "playwright", "pandas", "rapidfuzz", "requests")
+
+PROBE = """
+import importlib, json, sys, time
+t0 = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - t0
+print(json.dumps([elapsed, [m for m in {heavy!r} if m in sys.modules]]))
+"""
+
+
+def measure(module: str, repeat: int) -> tuple[list[float], list[str]]:
+    times = []
+    heavy = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY)],
+                             capture_output=True, text=True, check=True).stdout
+        elapsed, heavy = json.loads(out.strip().splitlines()[-1])
+        times.append(elapsed)
+    return times, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="interpretadores novos por módulo")
+    args = parser.parse_args()
+
+    print(f"{'módulo':30s} {'mediana':>10s} {'mínimo':>10s}  dependências pesadas")
+    for module in MODULES:
+        times, heavy = measure(module, args.repeat)
+        print(f"{module:30s} {statistics.median(times) * 1000:8.1f} ms {min(times) * 1000:8.1f} ms  "
+              f"{', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Compara os backends de parsing sobre páginas gravadas com `main.py --record`.
+
+    python -m benchmarks.parser_backends gravacao/ [--repeat 5] [--threads 3] [--processes 2]
+
+Paridade: roda os extratores estáticos de cada site sobre as páginas de
+filme gravadas com cada backend, com a árvore inteira e só com os nós
+declarados em PAGE_TARGETS, e aponta os campos que divergem da referência
+(primeiro backend, árvore inteira).
+Vazão: mede páginas/s e MB/s montando a árvore de todas as páginas, numa
+thread e em várias (para ver o efeito do GIL), também nos dois modos.
+Pool: extrai as páginas de filme com extract_page() nas threads e pelo pool
+de processos (`--processes`), com as métricas do pool.
+"""
+import argparse
+import contextlib
+import io
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.data_structures.periodic_queue import PeriodicQueue
+from src.data_structures.url import URL, URLType
+from src.data_structures.movie import Movie
+from src.network.http_client import HttpClient
+from src.network.replay import ReplayStore
+from src.parse_pool import ParsePool
+from src.parsing import PARSER_BACKENDS, TargetFilter, make_soup
+from src.scrapers.imdb_scraper import IMDBScraper
+from src.scrapers.lettr_scraper import LettrScraper
+from src.scrapers.rott_scraper import RottScraper
+from src.storage import Storage
+
+
+# Páginas principais de filme de cada site
+MOVIE_PAGES = {
+    URLType.IMDB: re.compile(r"^https://www\.imdb\.com/title/tt\d+/$"),
+    URLType.ROTT: re.compile(r"^https://www\.rottentomatoes\.com/m/[^/]+$"),
+    URLType.LTTR: re.compile(r"^https://letterboxd\.com/film/[^/]+/$"),
+}
+
+
+def movie_fields(movie: Movie) -> dict:
+    fields = {}
+    for name, value in vars(movie).items():
+        if isinstance(value, list):
+            value = [vars(item) if hasattr(item, "__dict__") else item for item in value]
+        fields[name] = value
+    return fields
+
+
+def extract(site: URLType, url: str, backend: str, targeted: bool, store: ReplayStore) -> dict | None:
+    """Roda os extratores estáticos do site sobre a página gravada."""
+    http = HttpClient(replay=store)
+    queue = PeriodicQueue(0)
+    if site == URLType.IMDB:
+        scraper = IMDBScraper(queue, Storage(), http_client=http)
+    elif site == URLType.ROTT:
+        scraper = RottScraper(queue, Storage(), http_client=http)
+    else:
+        scraper = LettrScraper(queue, Storage(), http_client=http)
+    scraper.parser_backend = backend
+    scraper.targeted_parsing = targeted
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if site == URLType.IMDB:
+            # o IMDB não separa a etapa estática; o Selenium fica de fora
+            page = scraper.extract_page(url, scraper.fetch(url).content)
+            if page is None:
+                return None
+            movie, fields = page
+            scraper.scrapUsrReviews(URL(url, site), movie)
+            scraper.scrapCritReviews(URL(url, site), movie)
+            scraper.enqueue_new_movies(fields["new_movies"], URLType.IMDB)
+        elif site == URLType.ROTT:
+            result = scraper.scrap_static(URL(url, site))
+            movie = result[1] if result is not None else None
+        else:
+            movie = scraper.scrap_static(URL(url, site))
+        new_urls = sorted(item.get_url() for item in queue.pending())
+    scraper.close()
+
+    if movie is None:
+        return None
+    fields = movie_fields(movie)
+    fields["novas urls"] = new_urls
+    return fields
+
+
+def check_parity(store: ReplayStore, pages: list[tuple[str, bytes]]) -> int:
+    divergences = 0
+    checked = 0
+    for url, _ in pages:
+        site = next((s for s, pattern in MOVIE_PAGES.items() if pattern.match(url)), None)
+        if site is None:
+            continue
+        checked += 1
+        modes = [(backend, targeted) for backend in PARSER_BACKENDS for targeted in (False, True)]
+        results = {mode: extract(site, url, mode[0], mode[1], store) for mode in modes}
+        reference_mode = modes[0]
+        reference = results[reference_mode]
+        for mode, fields in results.items():
+            if mode == reference_mode:
+                continue
+            label = f"{mode[0]}{' (alvos)' if mode[1] else ''}"
+            if (reference is None) != (fields is None):
+                divergences += 1
+                print(f"[PARIDADE] {url}: {reference_mode[0]} e {label} discordam se a página é um filme")
+                continue
+            if reference is None:
+                continue
+            for name in reference:
+                if reference[name] != fields[name]:
+                    divergences += 1
+                    print(f"[PARIDADE] {url}: campo '{name}' difere entre {reference_mode[0]} e {label}")
+    print(f"Paridade: {checked} páginas de filme verificadas, {divergences} divergências")
+    return divergences
+
+
+def page_filter_for(url: str):
+    if MOVIE_PAGES[URLType.IMDB].match(url):
+        return IMDBScraper.PAGE_TARGETS
+    if MOVIE_PAGES[URLType.ROTT].match(url):
+        return RottScraper.PAGE_TARGETS
+    if MOVIE_PAGES[URLType.LTTR].match(url):
+        return LettrScraper.PAGE_TARGETS
+    return None
+
+
+def measure_throughput(pages: list[tuple[str, bytes]], repeat: int, threads: int) -> None:
+    total_mb = sum(len(body) for _, body in pages) / (1024 * 1024)
+    print(f"\nVazão sobre {len(pages)} páginas ({total_mb:.1f} MB), {repeat} repetições")
+    filters = {}
+    for url, _ in pages:
+        targets = page_filter_for(url)
+        if targets:
+            filters[url] = TargetFilter(t for group in targets.values() for t in group)
+    for backend in PARSER_BACKENDS:
+        for targeted in (False, True):
+            for workers in sorted({1, threads}):
+                jobs = [(body, filters.get(url) if targeted else None) for url, body in pages] * repeat
+                t0 = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for _ in executor.map(lambda job: make_soup(job[0], backend, job[1]), jobs):
+                        pass
+                elapsed = time.perf_counter() - t0
+                mode = "alvos" if targeted else "inteira"
+                print(f"{backend:12s} {mode:8s} threads={workers}  {len(jobs) / elapsed:8.1f} páginas/s  "
+                      f"{total_mb * repeat / elapsed:6.1f} MB/s")
+
+
+def measure_pool(pages: list[tuple[str, bytes]], repeat: int, threads: int, processes: int, batch: int) -> None:
+    jobs = []
+    for url, body in pages:
+        site = next((s for s, pattern in MOVIE_PAGES.items() if pattern.match(url)), None)
+        if site is not None:
+            jobs.append((site, url, body))
+    if not jobs:
+        return
+    jobs *= repeat
+    print(f"\nExtração de {len(jobs)} páginas de filme com {threads} threads")
+    scrapers = {
+        URLType.IMDB: IMDBScraper(PeriodicQueue(0), Storage()),
+        URLType.ROTT: RottScraper(PeriodicQueue(0), Storage()),
+        URLType.LTTR: LettrScraper(PeriodicQueue(0), Storage()),
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for _ in executor.map(lambda job: scrapers[job[0]].extract_page(job[1], job[2]), jobs):
+                pass
+        elapsed = time.perf_counter() - t0
+    print(f"{'threads':24s} {len(jobs) / elapsed:8.1f} páginas/s")
+
+    pool = ParsePool(processes, batch)
+    # aquece o pool: cada processo importa os scrapers na primeira página
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(processes):
+            pool.extract(*jobs[0])
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for _ in executor.map(lambda job: pool.extract(*job), jobs):
+                pass
+        elapsed = time.perf_counter() - t0
+    print(f"{f'processos={processes} lote={batch}':24s} {len(jobs) / elapsed:8.1f} páginas/s")
+    pool.print_metrics()
+    pool.close()
+    for scraper in scrapers.values():
+        scraper.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridade e vazão dos backends de parsing")
+    parser.add_argument("recording", help="diretório gravado com main.py --record")
+    parser.add_argument("--repeat", type=int, default=3, help="vezes que cada página é parseada na vazão")
+    parser.add_argument("--threads", type=int, default=3, help="threads na medição concorrente")
+    parser.add_argument("--processes", type=int, default=2, help="processos do pool de parsing")
+    parser.add_argument("--batch", type=int, default=8, help="páginas por lote do pool de parsing")
+    args = parser.parse_args()
+
+    store = ReplayStore(args.recording, "replay")
+    pages = store.http_pages()
+    if not pages:
+        print("Nenhuma página HTTP na gravação.")
+        return
+    check_parity(store, pages)
+    measure_throughput(pages, args.repeat, args.threads)
+    measure_pool(pages, args.repeat, args.threads, args.processes, args.batch)
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Memória e precisão do conjunto de URLs vistas.
+
+    python -m benchmarks.seen_set [--urls 1000000] [--error-rate 0.001]
+
+Insere URLs canônicas sintéticas no SeenSet (filtros de Bloom) e num `set`
+de objetos URL, como a fila fazia antes, e compara a memória por milhão de
+URLs e o tempo de inserção. A taxa de falsos positivos é medida consultando
+a mesma quantidade de URLs que nunca foram inseridas.
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.data_structures.seen_set import SeenSet
+from src.data_structures.url import URL, URLType
+
+
+def imdb_urls(start: int, count: int):
+    for i in range(start, start + count):
+        yield f"https://www.imdb.com/title/tt{i:07d}/"
+
+
+def measure(label: str, build, count: int) -> None:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    container = build()
+    elapsed = time.perf_counter() - t0
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:24s} {memory / count * 1_000_000 / (1024 * 1024):8.1f} MB/milhão  "
+          f"{count / elapsed:10.0f} inserções/s")
+    return container
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=1_000_000, help="URLs inseridas")
+    parser.add_argument("--error-rate", type=float, default=0.001, help="taxa de falsos positivos dos filtros")
+    args = parser.parse_args()
+
+    def build_seen():
+        # a confirmação na coleta é da fronteira; aqui só os filtros contam
+        seen = SeenSet(capacity=100_000, error_rate=args.error_rate, exact=lambda key: False)
+        for url in imdb_urls(0, args.urls):
+            seen.add(url)
+        return seen
+
+    def build_set():
+        return {URL(url, URLType.IMDB) for url in imdb_urls(0, args.urls)}
+
+    print(f"{args.urls} URLs")
+    seen = measure("SeenSet (Bloom)", build_seen, args.urls)
+    measure("set de URL", build_set, args.urls)
+
+    false_positives = sum(seen.maybe_contains(url) for url in imdb_urls(args.urls, args.urls))
+    print(f"Falsos positivos:        {false_positives / args.urls:.4%} (configurado {args.error_rate:.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,104 @@
 from src.crawler_manager import CrawlerManager
+from src.config import CrawlerConfig, PARSER_BACKENDS, DEFAULT_BACKEND
+from src.data_structures.url import URLType
+import argparse
 import socket
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Crawler de filmes (IMDB, Rotten Tomatoes e Letterboxd)")
+    parser.add_argument("--engine", choices=CrawlerConfig.ENGINES, default="threads",
+                        help="threads: uma thread por site; async: vários filmes simultâneos por site")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="filmes simultâneos por site no motor async")
+    parser.add_argument("--imdb-workers", type=int, help="workers do IMDB (padrão 1)")
+    parser.add_argument("--lettr-workers", type=int, help="workers do Letterboxd (padrão 3)")
+    parser.add_argument("--rott-workers", type=int, help="workers do Rotten Tomatoes (padrão 3)")
+    parser.add_argument("--rate-limit", type=float, default=2.0,
+                        help="requisições por segundo permitidas para cada host")
+    parser.add_argument("--rate-burst", type=int, default=5,
+                        help="rajada máxima de requisições seguidas para cada host")
+    parser.add_argument("--cache-dir", default=".cache/http",
+                        help="diretório do cache de respostas HTTP")
+    parser.add_argument("--cache-max-mb", type=int, default=512,
+                        help="tamanho máximo do cache de respostas, em MB")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="busca todas as páginas na rede, sem o cache em disco")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default=DEFAULT_BACKEND,
+                        help="backend do BeautifulSoup usado nas páginas")
+    parser.add_argument("--full-parse", action="store_true",
+                        help="monta a árvore inteira das páginas em vez de só os nós usados")
+    parser.add_argument("--max-usr-reviews", type=int, default=100,
+                        help="máximo de reviews de usuários lidas por filme")
+    parser.add_argument("--max-crit-reviews", type=int, default=100,
+                        help="máximo de reviews de críticos lidas por filme")
+    parser.add_argument("--reviews-file", default="reviews.jsonl",
+                        help="arquivo JSON Lines onde as reviews são gravadas durante a coleta")
+    parser.add_argument("--review-sample", type=int, default=10,
+                        help="reviews de cada tipo mantidas em movies.json junto com o filme")
+    parser.add_argument("--no-reviews-file", action="store_true",
+                        help="mantém todas as reviews lidas nos filmes, sem o arquivo de reviews")
+    parser.add_argument("--parse-processes", type=int, default=0,
+                        help="processos que parseiam as páginas de filme (0: parseia nas threads dos scrapers)")
+    parser.add_argument("--parse-batch", type=int, default=8,
+                        help="máximo de páginas enviadas juntas para um processo de parsing")
+    parser.add_argument("--frontier", default=".crawl/frontier.sqlite3",
+                        help="banco SQLite da fronteira, usado para retomar um crawl interrompido")
+    parser.add_argument("--fresh", action="store_true",
+                        help="descarta a fronteira e os filmes de execuções anteriores e começa das sementes")
+    parser.add_argument("--no-frontier", action="store_true",
+                        help="mantém a fronteira só em memória, sem retomar execuções anteriores")
+    parser.add_argument("--fifo", action="store_true",
+                        help="busca as URLs na ordem em que foram descobertas, sem prioridade")
+    parser.add_argument("--cross-site-weight", type=float, default=4.0,
+                        help="peso, na prioridade, de cada outro site que já tem o filme")
+    parser.add_argument("--no-cross-seeding", action="store_true",
+                        help="não procura os filmes coletados nos outros sites")
+    parser.add_argument("--cross-search", action="store_true",
+                        help="procura os filmes coletados também na busca do IMDB")
+    parser.add_argument("--queue-window", type=int, default=5000,
+                        help="URLs de cada fila mantidas em memória; o excedente vai para o disco (0: sem limite)")
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument("--record", metavar="DIR",
+                        help="grava todas as respostas consumidas pelos scrapers em DIR")
+    replay.add_argument("--replay", metavar="DIR",
+                        help="reproduz uma gravação de DIR, sem acessar a rede")
+    return parser.parse_args()
+
+
 def main():
-    crawler = CrawlerManager()
+    args = parse_args()
+    workers = {
+        URLType.IMDB: args.imdb_workers,
+        URLType.LTTR: args.lettr_workers,
+        URLType.ROTT: args.rott_workers,
+    }
+    config = CrawlerConfig(
+        engine=args.engine,
+        async_concurrency=args.concurrency,
+        workers_per_site={site: n for site, n in workers.items() if n is not None},
+        rate_limit=args.rate_limit,
+        rate_burst=args.rate_burst,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_max_mb=args.cache_max_mb,
+        replay_mode="record" if args.record else "replay" if args.replay else None,
+        replay_dir=args.record or args.replay or ".replay",
+        parser_backend=args.parser,
+        targeted_parsing=not args.full_parse,
+        review_caps={"usr": args.max_usr_reviews, "crit": args.max_crit_reviews},
+        review_sample=args.review_sample,
+        reviews_path=None if args.no_reviews_file else args.reviews_file,
+        parse_processes=args.parse_processes,
+        parse_batch=args.parse_batch,
+        frontier_path=None if args.no_frontier else args.frontier,
+        fresh_crawl=args.fresh,
+        priority_scheduling=not args.fifo,
+        priority_weights={"cross_site": args.cross_site_weight},
+        cross_site_seeding=not args.no_cross_seeding,
+        cross_site_search=args.cross_search,
+        queue_window=args.queue_window or None,
+    )
+    crawler = CrawlerManager(config)
     crawler.run()
 
 if __name__ == "__main__":
@@ -13,4 +108,4 @@ if __name__ == "__main__":
         return [response for response in responses if response[0] == socket.AF_INET]
     socket.getaddrinfo = new_getaddrinfo
 
-    main()
\ No newline at end of file
+    main()
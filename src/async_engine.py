@@ -0,0 +1,110 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
+
+from playwright.async_api import async_playwright
+
+from src.scrapers.scraper import Scraper
+from src.data_structures.url import URLType
+
+
+class AsyncCrawlEngine:
+    """
+    Motor de crawling baseado em asyncio.
+
+    Em vez de uma thread por site processando um filme de cada vez, cada site
+    ganha `concurrency` tarefas consumindo a mesma fila, repartidas entre os
+    workers do site e com um único contexto do navegador por site. As etapas
+    dinâmicas usam a API assíncrona do Playwright, com um único navegador
+    compartilhado, e as etapas estáticas reaproveitam os extratores síncronos
+    rodando em threads, com as subpáginas buscadas em paralelo pelo plano de
+    cada filme.
+    """
+
+    def __init__(self, scrapers: list[Scraper], concurrency: int = 4, headless: bool = True, replay=None) -> None:
+        self.scrapers = scrapers
+        self.concurrency = concurrency
+        self.headless = headless
+        self.replay = replay
+
+    def run(self) -> None:
+        asyncio.run(self._main())
+
+    def _tasks_by_site(self) -> dict[URLType, list[Scraper]]:
+        """Scraper de cada uma das `concurrency` tarefas de cada site, em rodízio entre os workers do site."""
+        by_site = {}
+        for scraper in self.scrapers:
+            by_site.setdefault(scraper.SITE, []).append(scraper)
+        return {site: [workers[i % len(workers)] for i in range(self.concurrency)]
+                for site, workers in by_site.items()}
+
+    async def _main(self) -> None:
+        loop = asyncio.get_running_loop()
+        tasks = self._tasks_by_site()
+        # etapas estáticas e Selenium rodam em threads; uma por tarefa basta
+        executor = ThreadPoolExecutor(max_workers=self.concurrency * len(tasks))
+        loop.set_default_executor(executor)
+
+        for scraper in self.scrapers:
+            # cada filme simultâneo pode ter até 4 subpáginas em voo
+            movies = sum(task is scraper for site_tasks in tasks.values() for task in site_tasks)
+            scraper.resize_fetch_executor(max(1, movies * 4))
+            scraper.mark_started()
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            try:
+                workers = []
+                for site_tasks in tasks.values():
+                    # os workers de um site compartilham cabeçalhos e política de bloqueio
+                    first = site_tasks[0]
+                    context = await browser.new_context(extra_http_headers=first.headers)
+                    if self.replay is not None:
+                        await self.replay.install_async(context)
+                    if first.request_policy is not None:
+                        await first.request_policy.install_async(context)
+                    workers.extend(self._worker(scraper, context) for scraper in site_tasks)
+                await asyncio.gather(*workers)
+            finally:
+                await browser.close()
+
+        for scraper in self.scrapers:
+            scraper.mark_finished()
+            scraper.close()
+
+    async def _worker(self, scraper: Scraper, context) -> None:
+        while scraper.running:
+            url = await self._next_url(scraper)
+            if url is None:
+                continue
+
+            # mede tempo por filme
+            start = time.perf_counter()
+            scraper.start_fetch_plan(url)
+            try:
+                resposta = await scraper.scrap_movie_async(url, context)
+            except Exception as e:
+                scraper._errors += 1
+                print(f"[ERROR] Falha inesperada ao processar a URL {url.get_url()}. Erro: {e}")
+                resposta = 1
+            finally:
+                scraper.finish_fetch_plan()
+            # com fronteira, finish() grava no SQLite; fora do loop para não parar as outras tarefas
+            await asyncio.to_thread(scraper.periodic_queue.finish, url, resposta == 0)
+
+            if resposta == 0:
+                scraper.record_scrap_time(time.perf_counter() - start)
+
+    async def _next_url(self, scraper: Scraper):
+        # a fila é bloqueante; consulta sem bloquear para não prender threads do executor.
+        # Mesmo assim get() pode esperar o intervalo mínimo, recarregar URLs do
+        # disco e gravar na fronteira, então roda numa thread
+        try:
+            url = await asyncio.to_thread(scraper.periodic_queue.get, False)
+        except Empty:
+            await asyncio.sleep(0.2)
+            return None
+        if url.get_type() == URLType.END:
+            return None
+        return url
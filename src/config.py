@@ -0,0 +1,109 @@
+from src.data_structures.url import URLType
+
+
+# Tree builders do BeautifulSoup aceitos pelos scrapers (ver src/parsing.py).
+# Ficam aqui para que a configuração não precise carregar o bs4.
+PARSER_BACKENDS = ("lxml", "html.parser")
+DEFAULT_BACKEND = "lxml"
+
+
+class CrawlerConfig:
+    """Parâmetros de execução do crawler."""
+
+    ENGINES = ("threads", "async")
+
+    def __init__(self, engine: str = "threads", async_concurrency: int = 4,
+                 workers_per_site: dict[URLType, int] | None = None,
+                 rate_limit: float = 2.0, rate_burst: int = 5,
+                 host_rate_limits: dict[str, tuple[float, int]] | None = None,
+                 cache_dir: str | None = ".cache/http", cache_max_mb: int = 512,
+                 replay_mode: str | None = None, replay_dir: str = ".replay",
+                 parser_backend: str = DEFAULT_BACKEND, targeted_parsing: bool = True,
+                 review_caps: dict[str, int] | None = None, review_sample: int = 10,
+                 reviews_path: str | None = "reviews.jsonl",
+                 parse_processes: int = 0, parse_batch: int = 8,
+                 frontier_path: str | None = ".crawl/frontier.sqlite3", fresh_crawl: bool = False,
+                 priority_scheduling: bool = True, priority_weights: dict[str, float] | None = None,
+                 cross_site_seeding: bool = True, cross_site_search: bool = False,
+                 queue_window: int | None = 5000, spill_dir: str = ".crawl/spill",
+                 backpressure_links: int = 4) -> None:
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor desconhecido: {engine}. Opções: {', '.join(self.ENGINES)}")
+        # "threads": uma thread por site; "async": N filmes simultâneos por site num loop asyncio
+        self.engine = engine
+        # Filmes processados ao mesmo tempo por site no motor asyncio
+        self.async_concurrency = async_concurrency
+        # Workers consumindo a mesma fila de cada site. Letterboxd e Rotten
+        # Tomatoes passam a maior parte do tempo esperando o navegador.
+        self.workers_per_site = {URLType.IMDB: 1, URLType.LTTR: 3, URLType.ROTT: 3}
+        if workers_per_site:
+            self.workers_per_site.update(workers_per_site)
+        for site, workers in self.workers_per_site.items():
+            if workers < 1:
+                raise ValueError(f"O site {site.name} precisa de pelo menos 1 worker")
+        if rate_limit <= 0 or rate_burst < 1:
+            raise ValueError("O limite de requisições precisa ser positivo e a rajada de pelo menos 1")
+        # Requisições por segundo e rajada máxima por host, somando todos os workers
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        # Limites específicos por host, p.ex. {"www.imdb.com": (1.0, 3)}
+        self.host_rate_limits = dict(host_rate_limits or {})
+        # Cache de respostas em disco; None desliga
+        self.cache_dir = cache_dir
+        self.cache_max_mb = cache_max_mb
+        if replay_mode not in (None, "record", "replay"):
+            raise ValueError(f"Modo de gravação desconhecido: {replay_mode}. Opções: record, replay")
+        # "record" grava tudo o que os scrapers consomem em `replay_dir`;
+        # "replay" serve a gravação de volta, sem acessar a rede
+        self.replay_mode = replay_mode
+        self.replay_dir = replay_dir
+        # No replay o crawler termina quando as filas ficam vazias por este tempo
+        self.replay_idle_timeout = 10.0
+        if parser_backend not in PARSER_BACKENDS:
+            raise ValueError(f"Parser desconhecido: {parser_backend}. Opções: {', '.join(PARSER_BACKENDS)}")
+        # Backend do BeautifulSoup usado por todos os scrapers
+        self.parser_backend = parser_backend
+        # Parseia só os nós que os extratores declaram em PAGE_TARGETS
+        self.targeted_parsing = targeted_parsing
+        # Máximo de reviews lidas por filme de cada tipo ("usr" e "crit"),
+        # seguindo a paginação dos sites
+        self.review_caps = {"usr": 100, "crit": 100}
+        if review_caps:
+            self.review_caps.update(review_caps)
+        if any(cap < 0 for cap in self.review_caps.values()) or review_sample < 0:
+            raise ValueError("Os limites de reviews não podem ser negativos")
+        # Reviews gravadas em JSON Lines à medida que são coletadas; None desliga
+        # e os filmes passam a guardar todas as reviews lidas
+        self.reviews_path = reviews_path
+        # Reviews de cada tipo mantidas no filme quando há o arquivo de reviews
+        self.review_sample = review_sample
+        if parse_processes < 0 or parse_batch < 1:
+            raise ValueError("O pool de parsing não pode ter processos negativos e os lotes precisam de pelo menos 1 página")
+        # Processos que parseiam as páginas de filme enquanto as threads só
+        # buscam os bytes; 0 parseia na própria thread do scraper
+        self.parse_processes = parse_processes
+        # Máximo de páginas enviadas juntas para um processo do pool
+        self.parse_batch = parse_batch
+        # Fronteira persistente em SQLite; uma execução interrompida continua
+        # de onde parou. None mantém as filas só em memória
+        self.frontier_path = frontier_path
+        # Descarta a fronteira e os filmes gravados e começa das sementes
+        self.fresh_crawl = fresh_crawl
+        # Filas retiradas por prioridade, favorecendo títulos já coletados em
+        # outros sites (ver src/priority.py); False volta à ordem de chegada
+        self.priority_scheduling = priority_scheduling
+        # Pesos da prioridade: "cross_site", "popularity" e "depth"
+        self.priority_weights = dict(priority_weights or {})
+        # Procura cada filme armazenado nos outros sites pelo slug do título
+        # e o coloca nas filas (ver src/cross_seeding.py)
+        self.cross_site_seeding = cross_site_seeding
+        # Usa também a busca de sugestões do IMDB, que não tem slugs
+        self.cross_site_search = cross_site_search
+        if queue_window is not None and queue_window < 4:
+            raise ValueError("A janela das filas precisa de pelo menos 4 URLs")
+        # URLs de cada fila mantidas em memória; o excedente de menor
+        # prioridade vai para segmentos em `spill_dir`. None não limita
+        self.queue_window = queue_window
+        self.spill_dir = spill_dir
+        # Links de "more like this" enfileirados por filme enquanto uma fila transborda
+        self.backpressure_links = backpressure_links
@@ -1,72 +1,243 @@
+import os
 import threading
+import time
 
 from src.data_structures.periodic_queue import PeriodicQueue
 from src.storage import Storage
-from src.scrapers.imdb_scraper import IMDBScraper
-from src.scrapers.lettr_scraper import LettrScraper
-from src.scrapers.rott_scraper import RottScraper
+from src.scrapers import registry
 from src.observers import Observer
+from src.network.browser_pool import BrowserPool
+from src.network.driver_pool import WebDriverPool
+from src.network.http_client import HttpClient
+from src.network.rate_limiter import RateLimiter
+from src.network.response_cache import ResponseCache
+from src.network.request_policy import RequestPolicy
+from src.network.replay import ReplayStore
+from src.config import CrawlerConfig
+from src.review_sink import ReviewSink
+from src.parse_pool import ParsePool
+from src.frontier_store import FrontierStore
+from src.priority import PriorityScorer
+from src.cross_seeding import CrossSiteSeeder
 from typing import override
 from src.data_structures.url import URL, URLType
 
-from src.data_structures.url import URL, URLType
-
 
 class CrawlerManager(Observer):
 
-    def __init__(self) -> None:
+    def __init__(self, config: CrawlerConfig | None = None) -> None:
         super().__init__()
-        self.imdb_url_queue = PeriodicQueue(0)
-        self.lettr_url_queue = PeriodicQueue(0)
-        self.rott_url_queue = PeriodicQueue(0)
-        self.imdb_url_queue.put(URL("https://www.imdb.com/title/tt0133093/", URLType.IMDB))
-        self.lettr_url_queue.put(URL("https://letterboxd.com/film/the-matrix/", URLType.LTTR))
-        self.rott_url_queue.put( URL("https://www.rottentomatoes.com/m/matrix", URLType.ROTT))
+        self.config = config if config is not None else CrawlerConfig()
+        # Filas com uma janela limitada em memória e o excedente em disco
+        window = self.config.queue_window
+        spill = self.config.spill_dir
+        self.imdb_url_queue = PeriodicQueue(0, window=window, spill_dir=os.path.join(spill, "imdb"))
+        self.lettr_url_queue = PeriodicQueue(0, window=window, spill_dir=os.path.join(spill, "lettr"))
+        self.rott_url_queue = PeriodicQueue(0, window=window, spill_dir=os.path.join(spill, "rott"))
         self.storage = Storage()
         self.storage.attach(self)
+        # Ordem das filas: filmes que completam os já coletados nos outros sites primeiro
+        self.scorer = None
+        if self.config.priority_scheduling:
+            self.scorer = PriorityScorer(self.storage, self.config.priority_weights)
+            self.scorer.queues = self._queues()
+            for url_queue in self.scorer.queues.values():
+                url_queue.scorer = self.scorer
+            self.storage.scorer = self.scorer
+        workers = self.config.workers_per_site
+        # Gravação ou reprodução de tudo o que os scrapers consomem da rede
+        self.replay = None
+        if self.config.replay_mode is not None:
+            self.replay = ReplayStore(self.config.replay_dir, self.config.replay_mode)
+        replaying = self.replay is not None and self.replay.replaying
+        # Navegadores aquecidos compartilhados pelos scrapers que usam Playwright
+        self.browser_pool = BrowserPool(max_leases=workers[URLType.LTTR] + workers[URLType.ROTT], replay=self.replay)
+        # ChromeDrivers reaproveitados pelo IMDB para as plataformas de streaming
+        self.driver_pool = WebDriverPool(max_drivers=workers[URLType.IMDB], replay=self.replay)
+        # Limite de requisições por host, compartilhado por todos os workers.
+        # A reprodução não acessa a rede, então não há o que limitar.
+        self.rate_limiter = None
+        if not replaying:
+            self.rate_limiter = RateLimiter(self.config.rate_limit, self.config.rate_burst,
+                                            self.config.host_rate_limits)
+        # Cache de respostas em disco, compartilhado entre execuções
+        self.response_cache = None
+        if self.config.cache_dir is not None and not replaying:
+            self.response_cache = ResponseCache(self.config.cache_dir, self.config.cache_max_mb * 1024 * 1024)
+        # Reviews vão para o disco conforme são lidas, em vez de ficarem nos filmes
+        self.review_sink = None
+        if self.config.reviews_path is not None:
+            self.review_sink = ReviewSink(self.config.reviews_path)
+        # Processos que extraem as páginas de filme fora do GIL das threads
+        self.parse_pool = None
+        if self.config.parse_processes > 0:
+            self.parse_pool = ParsePool(self.config.parse_processes, self.config.parse_batch,
+                                        parser_backend=self.config.parser_backend,
+                                        targeted_parsing=self.config.targeted_parsing)
         self.mutex = threading.Lock()
         self.mutex.acquire()
 
+        # Fronteira em disco: retoma as filas e os filmes de uma execução
+        # interrompida. Gravação e reprodução sempre começam do zero.
+        self.frontier = None
+        if self.config.frontier_path is not None and self.config.replay_mode is None:
+            self.frontier = FrontierStore(self.config.frontier_path, fresh=self.config.fresh_crawl)
+            self._resume()
+        # Filmes armazenados são procurados nos outros sites. Só depois da
+        # retomada, para os filmes recarregados não serem semeados de novo.
+        self.seeder = None
+        if self.config.cross_site_seeding:
+            http = HttpClient(rate_limiter=self.rate_limiter, cache=self.response_cache, replay=self.replay)
+            self.seeder = CrossSiteSeeder(self._queues(), self.storage, http, search=self.config.cross_site_search)
+            self.seeder.frontier = self.frontier
+            self.storage.seeder = self.seeder
+        self.imdb_url_queue.put(URL("https://www.imdb.com/title/tt0133093/", URLType.IMDB))
+        self.lettr_url_queue.put(URL("https://letterboxd.com/film/the-matrix/", URLType.LTTR))
+        self.rott_url_queue.put( URL("https://www.rottentomatoes.com/m/matrix", URLType.ROTT))
+
+    def _queues(self) -> dict[URLType, PeriodicQueue]:
+        return {URLType.IMDB: self.imdb_url_queue, URLType.LTTR: self.lettr_url_queue,
+                URLType.ROTT: self.rott_url_queue}
+
+    def _resume(self) -> None:
+        recovered = self.frontier.recover()
+        # os filmes voltam antes das filas, para as URLs retomadas serem
+        # priorizadas com os títulos já coletados
+        movies = self.frontier.movies()
+        self.storage.frontier = self.frontier
+        self.storage.restore(movies)
+        pending = sum(q.resume(self.frontier, site) for site, q in self._queues().items())
+        if pending or movies:
+            print(f"[INFO] Retomando o crawl de {self.config.frontier_path}: {len(movies)} filmes já coletados, "
+                  f"{pending} URLs na fila ({recovered} interrompidas ou com falha voltaram para a fila)")
+
     @override
     def update(self) -> None:
         if self.mutex.locked():
             self.mutex.release()
 
+    def _create_workers(self) -> dict[URLType, list]:
+        # Todos os workers de um site consomem a mesma fila e compartilham as
+        # sessões HTTP e a política de bloqueio de requisições do navegador.
+        # As classes vêm do registro, que só importa o módulo de cada scraper aqui.
+        factories = {
+            URLType.IMDB: lambda cls, http, policy: cls(self.imdb_url_queue, self.storage, self.driver_pool, http),
+            URLType.LTTR: lambda cls, http, policy: cls(self.lettr_url_queue, self.storage, self.browser_pool, http, policy),
+            URLType.ROTT: lambda cls, http, policy: cls(self.rott_url_queue, self.storage, self.browser_pool, http, policy),
+        }
+        workers = {}
+        for site, factory in factories.items():
+            cls = registry.scraper_class(site)
+            http = HttpClient(rate_limiter=self.rate_limiter, cache=self.response_cache, replay=self.replay)
+            allowed_hosts = getattr(cls, "ALLOWED_HOSTS", None)
+            policy = RequestPolicy(allowed_hosts) if allowed_hosts else None
+            workers[site] = [factory(cls, http, policy) for _ in range(self.config.workers_per_site[site])]
+            for worker in workers[site]:
+                worker.parser_backend = self.config.parser_backend
+                worker.targeted_parsing = self.config.targeted_parsing
+                worker.review_caps = dict(self.config.review_caps)
+                worker.review_sample = self.config.review_sample
+                worker.review_sink = self.review_sink
+                worker.parse_pool = self.parse_pool
+                worker.backpressure_links = self.config.backpressure_links
+            self.storage.enroll_new_scraper(site)
+        return workers
+
     def run(self):
         # Creates all scrapers
-        imdb_scraper = IMDBScraper(self.imdb_url_queue, self.storage)
-        lettr_scraper = LettrScraper(self.lettr_url_queue, self.storage)
-        rott_scraper = RottScraper(self.rott_url_queue, self.storage)
+        workers = self._create_workers()
 
-        self.storage.enroll_new_scraper(URLType.IMDB)
-        self.storage.enroll_new_scraper(URLType.LTTR)
-        self.storage.enroll_new_scraper(URLType.ROTT)
+        scrapers = [scraper for site_workers in workers.values() for scraper in site_workers]
+        if self.config.engine == "async":
+            self._run_async(scrapers)
+        else:
+            self._run_threads(scrapers)
+        
+        for site_workers in workers.values():
+            type(site_workers[0]).print_site_metrics(site_workers)
+            if site_workers[0].request_policy is not None:
+                site_workers[0].request_policy.print_metrics(site_workers[0].name)
+        for site, url_queue in self._queues().items():
+            url_queue.print_seen_metrics(site.name)
+            url_queue.print_window_metrics(site.name)
+        self.storage.print_overlap_metrics()
+        if self.seeder is not None:
+            # antes da fronteira, que ainda recebe as URLs das consultas em andamento
+            self.seeder.close()
+            self.seeder.print_metrics()
+        self.browser_pool.print_metrics()
+        self.driver_pool.print_metrics()
+        if self.rate_limiter is not None:
+            self.rate_limiter.print_metrics()
+        self.driver_pool.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.replay is not None:
+            self.replay.print_metrics()
+            self.replay.close()
+        if self.review_sink is not None:
+            self.review_sink.print_metrics()
+            self.review_sink.close()
+        if self.parse_pool is not None:
+            self.parse_pool.print_metrics()
+            self.parse_pool.close()
+        if self.frontier is not None:
+            self.frontier.print_metrics()
+            self.frontier.close()
+        for url_queue in self._queues().values():
+            url_queue.close()
+        
+        self.storage.dump_to_json()
 
-        # Creates a thread for each scraper
-        imdb_thread = threading.Thread(target=imdb_scraper.run)
-        lettr_thread = threading.Thread(target=lettr_scraper.run)
-        rott_thread = threading.Thread(target=rott_scraper.run)
+    def _run_threads(self, scrapers):
+        # Creates a thread for each worker
+        threads = [threading.Thread(target=scraper.run) for scraper in scrapers]
 
         # Start all threads
-        imdb_thread.start()
-        lettr_thread.start()
-        rott_thread.start()
+        for thread in threads:
+            thread.start()
 
         # Wait for storage notification
-        self.mutex.acquire()
+        self._wait_for_end()
 
         # Request scrapers to stop
-        imdb_scraper.stop()
-        lettr_scraper.stop()
-        rott_scraper.stop()
+        for scraper in scrapers:
+            scraper.stop()
 
         # Espera a thread for each scraper
-        imdb_thread.join()
-        lettr_thread.join()
-        rott_thread.join()
-        
-        imdb_scraper.print_metrics()
-        lettr_scraper.print_metrics()
-        rott_scraper.print_metrics()
-        
-        self.storage.dump_to_json()
+        for thread in threads:
+            thread.join()
+
+    def _run_async(self, scrapers):
+        # O loop asyncio roda numa thread própria; a principal espera o Storage
+        from src.async_engine import AsyncCrawlEngine
+        engine = AsyncCrawlEngine(scrapers, concurrency=self.config.async_concurrency, replay=self.replay)
+        engine_thread = threading.Thread(target=engine.run)
+        engine_thread.start()
+
+        # Wait for storage notification
+        self._wait_for_end()
+
+        # Request scrapers to stop
+        for scraper in scrapers:
+            scraper.stop()
+
+        engine_thread.join()
+
+    def _wait_for_end(self):
+        if self.replay is None or not self.replay.replaying:
+            self.mutex.acquire()
+            return
+
+        # Na reprodução a gravação pode acabar antes do limite do Storage: o
+        # crawl termina quando todas as filas ficam vazias por um tempo
+        queues = (self.imdb_url_queue, self.lettr_url_queue, self.rott_url_queue)
+        idle_since = None
+        while not self.mutex.acquire(timeout=0.5):
+            if all(q.empty() for q in queues):
+                if idle_since is None:
+                    idle_since = time.monotonic()
+                elif time.monotonic() - idle_since >= self.config.replay_idle_timeout:
+                    return
+            else:
+                idle_since = None
@@ -0,0 +1,224 @@
+"""
+Semeadura entre sites.
+
+Um filme coletado num site só entra em `movies_united.json` completo se os
+outros dois sites também o coletarem, e pelos links de "more like this" isso
+é questão de sorte. Quando o Storage guarda um filme, o semeador monta as
+URLs prováveis do mesmo filme nos outros sites e as coloca nas filas:
+
+- Rotten Tomatoes e Letterboxd pelo slug do título, com e sem o ano
+  ("dune_2021", "dune-2021");
+- IMDB, cujas URLs têm um id, pela busca de sugestões do site (opcional).
+
+Cada candidata é confirmada com um GET antes de entrar na fila, e o
+resultado (inclusive "não existe") fica num cache, em memória e na fronteira
+em SQLite quando há uma, para não repetir a consulta. As URLs entram com o
+título do filme e profundidade 0, então o PriorityScorer as coloca à frente
+das descobertas por links.
+"""
+import json
+import re
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from src.data_structures.movie import Movie
+from src.data_structures.url import URL, URLType
+from src.network.http_client import HttpClient
+from src.priority import title_key
+
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+IMDB_SEARCH = "https://v3.sg.media-imdb.com/suggestion/x/{}.json"
+
+_YEAR = re.compile(r"\b(18\d\d|19\d\d|20\d\d)\b")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(title: str | None, separator: str) -> str | None:
+    """Slug no formato dos sites: minúsculas sem acentos, pontuação vira `separator`."""
+    if not title:
+        return None
+    text = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode().lower()
+    text = text.replace("'", "").replace("&", " and ")
+    slug = _NON_ALNUM.sub(separator, text).strip(separator)
+    return slug or None
+
+
+def release_year(movie: Movie) -> str | None:
+    match = _YEAR.search(movie.get_release_date() or "")
+    return match.group(1) if match else None
+
+
+def rott_candidates(title: str, year: str | None) -> list[str]:
+    # o RT costuma tirar o artigo inicial ("the_matrix" é "matrix")
+    slug = slugify(title, "_")
+    if slug is None:
+        return []
+    slugs = [f"{slug}_{year}"] if year else []
+    short = re.sub(r"^(the|a|an)_", "", slug)
+    slugs += [slug, short] if short != slug else [slug]
+    return [f"https://www.rottentomatoes.com/m/{s}" for s in slugs]
+
+
+def lettr_candidates(title: str, year: str | None) -> list[str]:
+    slug = slugify(title, "-")
+    if slug is None:
+        return []
+    slugs = [f"{slug}-{year}", slug] if year else [slug]
+    return [f"https://letterboxd.com/film/{s}/" for s in slugs]
+
+
+CANDIDATES = {URLType.ROTT: rott_candidates, URLType.LTTR: lettr_candidates}
+
+
+class CrossSiteSeeder:
+
+    def __init__(self, queues: dict, storage, http_client: HttpClient | None = None,
+                 search: bool = False, workers: int = 2) -> None:
+        self.queues = queues
+        self.storage = storage
+        self.http = http_client if http_client is not None else HttpClient()
+        # Busca o IMDB pelas sugestões do site; sem ela só RT e Letterboxd são semeados
+        self.search = search
+        # Fronteira (FrontierStore) que guarda o cache das consultas entre execuções, se houver
+        self.frontier = None
+        # As consultas saem fora das threads dos scrapers, que só enfileiram o filme
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seeder")
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Métricas
+        self._movies = 0
+        self._lookups = 0
+        self._cache_hits = 0
+        self._found = 0
+        self._enqueued = 0
+        self._errors = 0
+
+    def movie_stored(self, movie: Movie, site: URLType) -> None:
+        title = movie.get_title()
+        if not title:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            self._movies += 1
+            self._executor.submit(self._seed, title, release_year(movie), site)
+
+    def _seed(self, title: str, year: str | None, site: URLType) -> None:
+        key = title_key(title)
+        known = self.storage.sites_with_title(key) if key is not None else frozenset()
+        for target, url_queue in self.queues.items():
+            if target == site or target in known:
+                continue
+            try:
+                url_str = self._find(target, title, year)
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                print(f"[ERROR] Falha ao procurar '{title}' no {target.name}. Erro: {e}")
+                continue
+            if url_str is None:
+                continue
+            url = URL(url_str, target, title=title)
+            if url_queue.seen(url.get_url()):
+                continue
+            url_queue.put(url)
+            with self._lock:
+                self._enqueued += 1
+
+    def _known(self, site: URLType, url_str: str) -> bool:
+        return self.queues[site].seen(URL(url_str, site).get_url())
+
+    def _find(self, site: URLType, title: str, year: str | None) -> str | None:
+        if site == URLType.IMDB:
+            if not self.search:
+                return None
+            return self._cached(f"IMDB:{title_key(title)}:{year}", self._search_imdb, title, year)
+        for candidate in CANDIDATES[site](title, year):
+            # uma candidata que já passou pela fila não precisa ser confirmada
+            if self._known(site, candidate):
+                return None
+            url_str = self._cached(candidate, self._exists, candidate)
+            if url_str is not None:
+                return url_str
+        return None
+
+    def _cached(self, key: str, lookup, *args) -> str | None:
+        with self._lock:
+            if key in self._cache:
+                self._cache_hits += 1
+                return self._cache[key]
+        if self.frontier is not None:
+            found, url_str = self.frontier.lookup(key)
+            if found:
+                with self._lock:
+                    self._cache[key] = url_str
+                    self._cache_hits += 1
+                return url_str
+
+        with self._lock:
+            self._lookups += 1
+        url_str, definitive = lookup(*args)
+        # falhas de rede não entram no cache, só respostas do site
+        if definitive:
+            with self._lock:
+                self._cache[key] = url_str
+                if url_str is not None:
+                    self._found += 1
+            if self.frontier is not None:
+                self.frontier.save_lookup(key, url_str)
+        return url_str
+
+    def _exists(self, url_str: str) -> tuple[str | None, bool]:
+        response = self.http.get(url_str, headers=HEADERS)
+        if response.ok:
+            # redirecionamentos ("the_matrix" -> "matrix") levam à URL real do filme
+            return response.url or url_str, True
+        return None, response.status_code in (404, 410)
+
+    def _search_imdb(self, title: str, year: str | None) -> tuple[str | None, bool]:
+        response = self.http.get(IMDB_SEARCH.format(quote(title)), headers=HEADERS)
+        if not response.ok:
+            return None, False
+        key = title_key(title)
+        for result in json.loads(response.content).get("d", []):
+            if not str(result.get("id", "")).startswith("tt") or title_key(result.get("l")) != key:
+                continue
+            if year is not None and str(result.get("y")) != year:
+                continue
+            return f"https://www.imdb.com/title/{result['id']}/", True
+        return None, True
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def print_metrics(self) -> None:
+        with self._lock:
+            movies = self._movies
+            lookups = self._lookups
+            cache_hits = self._cache_hits
+            found = self._found
+            enqueued = self._enqueued
+            errors = self._errors
+
+        print("\n========== MÉTRICAS DA SEMEADURA ENTRE SITES ==========")
+        print(f"Filmes semeados:          {movies}")
+        print(f"Consultas aos sites:      {lookups} ({found} encontradas)")
+        print(f"Acertos no cache:         {cache_hits}")
+        print(f"URLs enfileiradas:        {enqueued}")
+        print(f"Erros:                    {errors}")
+        print("==========================================\n")
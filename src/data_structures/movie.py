@@ -1,7 +1,6 @@
 from src.data_structures.review import Review
 from src.data_structures.plataform import Plataform
-from rapidfuzz import fuzz
-import pandas as pd
+from src.normalization import earliest_date
 
 
 class Movie:
@@ -37,6 +36,7 @@ class Movie:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Movie):
             return NotImplemented
+        from rapidfuzz import fuzz  # só carregado quando filmes são comparados
         similarity = fuzz.ratio(self.title.lower(), other.title.lower())
         limiar = 80
         return similarity >= limiar
@@ -47,6 +47,7 @@ class Movie:
         return not self.__eq__(other)
     
     def similar(self, a, b):
+        from rapidfuzz import fuzz
         similarity = fuzz.ratio(a.lower(), b.lower())
         limiar = 80
         return similarity >= limiar
@@ -86,13 +87,7 @@ class Movie:
                 self.add_genre(genre_other)
 
         # realease dates
-        format = "%Y-%m-%d"
-        release_date_t = pd.to_datetime([self.get_release_date(), other.get_release_date()], format=format, errors="coerce")
-        min_date = release_date_t.min()
-        if pd.isna(min_date):
-            self.set_release_date(None)   # ou "", ou não setar
-        else:
-            self.set_release_date(min_date.strftime("%Y-%m-%d"))
+        self.set_release_date(earliest_date(self.get_release_date(), other.get_release_date()))
         
         # synopsis
         if self.get_synopsis() and other.get_synopsis():
@@ -1,29 +1,265 @@
+import heapq
+import itertools
+import math
 import time
 import queue
 import threading
 
+from src.data_structures.seen_set import SeenSet
+from src.data_structures.spill_segments import SpillSegments
+from src.data_structures.url import URL, URLType
+
 
 class PeriodicQueue(queue.Queue):
-    def __init__(self, min_interval: float, *args, **kwargs) -> None:
+    """
+    Fila de URLs de um site, retirada em ordem de prioridade (maior primeiro,
+    e na ordem de chegada entre iguais). Sem `scorer` todas as URLs têm
+    prioridade 0 e a fila se comporta como FIFO.
+
+    Com `window`, no máximo `window` URLs ficam em memória. Ao passar disso,
+    as de menor prioridade descem para segmentos em `spill_dir` até a janela
+    voltar a 3/4, e voltam em lotes quando ela cai abaixo de 1/4, com a
+    prioridade recalculada e a ordem de chegada original. Uma URL que chega
+    enquanto há URLs em disco e não passa na frente delas vai direto para o
+    fim do disco, então a ordem entre iguais se mantém. Enquanto há URLs em
+    disco a fila sinaliza `backpressure()` para quem enfileira.
+    """
+
+    def __init__(self, min_interval: float, *args, window: int | None = None, spill_dir: str | None = None,
+                 **kwargs) -> None:
+        self.window = window
+        self._spill = SpillSegments(spill_dir) if window is not None and spill_dir is not None else None
         super().__init__(*args, **kwargs)
         self._min_interval = min_interval
-        self._last_dequeue_time = 0.0
+        self._next_dequeue_time = 0.0
         self._lock = threading.Lock()
-        self._seen_items = set()
-    
+        # URLs canônicas já vistas, num filtro de Bloom (ver seen_set.py)
+        self._seen_items = SeenSet()
+        # Fronteira persistente (FrontierStore) que acompanha o estado das URLs, se houver
+        self.frontier = None
+        # PriorityScorer que dá a prioridade de cada URL (ver src/priority.py), se houver
+        self.scorer = None
+
+        # Métricas da janela
+        self._depth_sum = 0
+        self._depth_samples = 0
+        self._depth_max = 0
+        self._spill_events = 0
+
+    # Heap de entradas [-prioridade, ordem de chegada, url, chaves de título].
+    # Uma URL reavaliada ganha uma entrada nova e a antiga fica com url None,
+    # descartada quando chega ao topo.
+    def _init(self, maxsize):
+        self.queue = []
+        self._size = 0
+        self._order = itertools.count()
+        # menor chave (-prioridade, ordem) que desceu para o disco desde que ele esvaziou
+        self._spill_floor = None
+        # url -> entrada atual, e chave de título -> urls na fila com essa chave
+        self._entries = {}
+        self._by_key = {}
+
+    def _qsize(self):
+        return self._size + (len(self._spill) if self._spill is not None else 0)
+
+    def _put(self, item):
+        if self._spill_floor is not None and (-item.priority, math.inf) > self._spill_floor:
+            # chegou depois e não passa na frente do que está em disco: vai para o fim dele
+            self._spill.append([self._record(item, next(self._order))])
+        else:
+            self._push(item)
+            if self._spill is not None and self._size > self.window:
+                self._spill_lowest()
+        self._depth_sum += self._size
+        self._depth_samples += 1
+        self._depth_max = max(self._depth_max, self._size)
+
+    def _push(self, item, order: int | None = None):
+        keys = ()
+        if self.scorer is not None and item.get_type() != URLType.END:
+            keys = tuple(self.scorer.keys(item))
+        entry = [-item.priority, next(self._order) if order is None else order, item, keys]
+        heapq.heappush(self.queue, entry)
+        self._size += 1
+        if item.get_type() != URLType.END:
+            self._entries[item.get_url()] = entry
+            for key in keys:
+                self._by_key.setdefault(key, set()).add(item.get_url())
+
+    def _get(self):
+        if self._spill is not None and self._size <= self.window // 4 and len(self._spill) > 0:
+            self._refill()
+        while True:
+            _, _, item, keys = heapq.heappop(self.queue)
+            if item is not None:
+                break
+        self._size -= 1
+        if item.get_type() != URLType.END:
+            del self._entries[item.get_url()]
+            for key in keys:
+                urls = self._by_key[key]
+                urls.discard(item.get_url())
+                if not urls:
+                    del self._by_key[key]
+        return item
+
+    def _spill_lowest(self) -> None:
+        # a lista ordenada já é um heap válido
+        entries = sorted(entry for entry in self.queue if entry[2] is not None)
+        keep = self.window * 3 // 4
+        self.queue = entries[:keep]
+        records = []
+        floor = tuple(entries[keep][:2])
+        if self._spill_floor is None or floor < self._spill_floor:
+            self._spill_floor = floor
+        for _, order, item, keys in entries[keep:]:
+            del self._entries[item.get_url()]
+            for key in keys:
+                urls = self._by_key[key]
+                urls.discard(item.get_url())
+                if not urls:
+                    del self._by_key[key]
+            records.append(self._record(item, order))
+        self._size = len(self.queue)
+        self._spill.append(records)
+        self._spill_events += 1
+
+    @staticmethod
+    def _record(item, order: int) -> dict:
+        return {"url": item.get_url(), "site": item.get_type().value, "depth": item.depth,
+                "title": item.title, "popularity": item.popularity, "order": order}
+
+    def _refill(self) -> None:
+        # as URLs voltam com a prioridade recalculada: os títulos coletados
+        # enquanto elas estavam em disco contam. A ordem de chegada original
+        # volta junto, para que o desempate (e a FIFO sem scorer) não mude
+        for record in self._spill.read(self.window // 2):
+            url = URL(record["url"], URLType(record["site"]), depth=record["depth"], title=record["title"],
+                      popularity=record["popularity"])
+            self._prioritize(url)
+            self._push(url, record["order"])
+        if len(self._spill) == 0:
+            self._spill_floor = None
+
+    def _prioritize(self, item) -> None:
+        if self.scorer is not None:
+            item.priority = self.scorer.score(item)
+
     def put(self, item):
-        if item not in self._seen_items:
+        if self._seen_items.add(item.get_url()):
+            self._prioritize(item)
+            if self.frontier is not None:
+                self.frontier.add(item)
             super().put(item)
-            self._seen_items.add(item)
+
+    def put_marker(self, item):
+        """Enfileira um item de controle sem passar pelo conjunto de itens já vistos."""
+        # marcadores passam na frente das URLs para os workers pararem logo
+        item.priority = math.inf
+        super().put(item)
 
     def get(self, block=True, timeout=None):
+        # Reserva o horário da retirada sob o lock e espera fora dele, para que
+        # um consumidor dormindo não bloqueie os outros nem quem enfileira.
         with self._lock:
             now = time.monotonic()
-            elapsed = now - self._last_dequeue_time
-            if elapsed < self._min_interval:
-                time.sleep(self._min_interval - elapsed)
-            self._last_dequeue_time = time.monotonic()
+            slot = max(now, self._next_dequeue_time)
+            self._next_dequeue_time = slot + self._min_interval
+
+        if slot > now:
+            time.sleep(slot - now)
 
         item = super().get(block=block, timeout=timeout)
+        if self.frontier is not None and item.get_type() != URLType.END:
+            self.frontier.start(item)
 
         return item
+
+    def rescore(self, key: str, score) -> int:
+        """
+        Recalcula com `score(url)` a prioridade das URLs na fila que têm a
+        chave de título `key`. Retorna quantas mudaram de prioridade.
+        """
+        changed = 0
+        with self.mutex:
+            for url_str in list(self._by_key.get(key, ())):
+                entry = self._entries[url_str]
+                item = entry[2]
+                priority = score(item)
+                if priority == item.priority:
+                    continue
+                item.priority = priority
+                entry[2] = None
+                new_entry = [-priority, next(self._order), item, entry[3]]
+                heapq.heappush(self.queue, new_entry)
+                self._entries[url_str] = new_entry
+                changed += 1
+        return changed
+
+    def backpressure(self) -> bool:
+        """Se a janela em memória transbordou e há URLs esperando em disco."""
+        return self._spill is not None and len(self._spill) > 0
+
+    def pending(self) -> list:
+        """URLs na janela em memória, na ordem em que seriam retiradas."""
+        with self.mutex:
+            entries = sorted(entry for entry in self.queue if entry[2] is not None)
+        return [entry[2] for entry in entries]
+
+    def finish(self, item, ok: bool) -> None:
+        """Registra o fim do processamento de um item retirado da fila."""
+        if self.frontier is not None:
+            self.frontier.finish(item, ok)
+
+    def seen(self, url_str: str) -> bool:
+        """Se a URL canônica já passou pela fila."""
+        return url_str in self._seen_items
+
+    def seen_count(self) -> int:
+        return len(self._seen_items)
+
+    def print_seen_metrics(self, name: str) -> None:
+        self._seen_items.print_metrics(name)
+
+    def print_window_metrics(self, name: str) -> None:
+        with self.mutex:
+            size = self._size
+            samples = self._depth_samples
+            depth_avg = self._depth_sum / samples if samples > 0 else 0.0
+            depth_max = self._depth_max
+            spill_events = self._spill_events
+        spilled = len(self._spill) if self._spill is not None else 0
+
+        print(f"\n========== FILA ({name}) ==========")
+        print(f"URLs em memória:          {size}" + (f" (janela de {self.window})" if self.window else ""))
+        print(f"Profundidade média/máx.:  {depth_avg:.1f} / {depth_max}")
+        if self._spill is not None:
+            written, read, bytes_written = self._spill.stats()
+            print(f"URLs em disco:            {spilled}")
+            print(f"Transbordos:              {spill_events} ({written} URLs, {bytes_written / 1024:.1f} KB escritos)")
+            print(f"URLs recarregadas:        {read}")
+        print("==========================================\n")
+
+    def close(self) -> None:
+        """Apaga os segmentos em disco; as URLs que restavam continuam na fronteira, se houver."""
+        if self._spill is not None:
+            self._spill.close()
+        self._seen_items.close()
+
+    def resume(self, frontier, site) -> int:
+        """
+        Passa a registrar as URLs em `frontier` e retoma o que uma execução
+        anterior deixou: todas as URLs já registradas do site contam como
+        vistas e as que não foram concluídas voltam para a fila.
+        """
+        # um "talvez visto" do filtro é confirmado no banco, então as URLs já
+        # registradas não precisam ir para a tabela de chaves do SeenSet
+        self._seen_items.exact = frontier.contains
+        for url_str in frontier.known_urls(site):
+            self._seen_items.add(url_str)
+        self.frontier = frontier
+        pending = frontier.pending_urls(site)
+        for url in pending:
+            self._prioritize(url)
+            super().put(url)
+        return len(pending)
@@ -1,5 +1,3 @@
-from rapidfuzz import fuzz
-
 class Plataform:
     
     def __init__(self, plataform: str, link:str):
@@ -19,6 +17,7 @@ class Plataform:
     def __eq__(self, other):
         if not isinstance(other, Plataform):
             return NotImplemented
+        from rapidfuzz import fuzz  # só carregado quando plataformas são comparadas
         limiar = 0.8
         similarity = fuzz.ratio(self.plataform.lower(), other.plataform.lower())
         return similarity >= limiar
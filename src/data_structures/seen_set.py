@@ -0,0 +1,179 @@
+import hashlib
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom de tamanho fixo: `capacity` itens com taxa de falsos
+    positivos `error_rate`. Ocupa cerca de 1,8 MB por milhão de itens a 0,1%.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # hashing duplo: as k posições saem de dois hashes de 64 bits
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._array[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            self._array[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def size_bytes(self) -> int:
+        return len(self._array)
+
+
+class KeyTable:
+    """
+    Tabela de chaves num SQLite temporário, apagado no close(). É a
+    confirmação exata do SeenSet quando não há fronteira: só é consultada
+    nos "talvez visto" do filtro, então o custo fica nas escritas.
+    """
+
+    COMMIT_EVERY = 10_000
+
+    def __init__(self) -> None:
+        fd, self.path = tempfile.mkstemp(prefix="seen-", suffix=".sqlite3")
+        os.close(fd)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # arquivo descartável: sem journal nem fsync
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE keys (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        self._pending = 0
+
+    def add(self, key: str) -> None:
+        self._conn.execute("INSERT OR IGNORE INTO keys VALUES (?)", (key,))
+        self._pending += 1
+        if self._pending >= self.COMMIT_EVERY:
+            self._conn.commit()
+            self._pending = 0
+
+    def __contains__(self, key: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM keys WHERE key = ?", (key,)).fetchone() is not None
+
+    def close(self) -> None:
+        self._conn.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class SeenSet:
+    """
+    Conjunto de URLs já vistas com memória limitada.
+
+    As chaves (URLs canônicas) vão para filtros de Bloom; quando o filtro
+    atual enche, um novo com o dobro da capacidade é criado, mantendo a taxa
+    de falsos positivos. Um "talvez visto" do filtro é confirmado em `exact`
+    (p.ex. a fronteira em SQLite), que responde se a chave existe de fato.
+    Sem `exact`, as chaves também vão para uma KeyTable em disco, que faz a
+    confirmação no lugar dela; nenhuma URL nova é descartada por engano.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001, exact=None) -> None:
+        self.error_rate = error_rate
+        self.exact = exact
+        self._filters = [BloomFilter(capacity, error_rate)]
+        self._lock = threading.Lock()
+        # confirmação das chaves adicionadas sem `exact`, criada na primeira delas
+        self._keys = None
+
+        # Métricas
+        self._added = 0
+        self._duplicates = 0
+        self._exact_lookups = 0
+        self._false_positives = 0
+
+    def _maybe_seen(self, key: str) -> bool:
+        return any(key in bloom for bloom in self._filters)
+
+    def _confirm(self, key: str) -> bool:
+        if self.exact is not None and self.exact(key):
+            return True
+        return self._keys is not None and key in self._keys
+
+    def _insert(self, key: str) -> None:
+        current = self._filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * 2, self.error_rate)
+            self._filters.append(current)
+        current.add(key)
+
+    def add(self, key: str) -> bool:
+        """Adiciona a chave; retorna False se ela já tinha sido vista."""
+        with self._lock:
+            if self._maybe_seen(key):
+                self._exact_lookups += 1
+                if self._confirm(key):
+                    self._duplicates += 1
+                    return False
+                self._false_positives += 1
+            self._insert(key)
+            if self.exact is None:
+                if self._keys is None:
+                    self._keys = KeyTable()
+                self._keys.add(key)
+            self._added += 1
+            return True
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._maybe_seen(key) and self._confirm(key)
+
+    def maybe_contains(self, key: str) -> bool:
+        """Resposta só dos filtros de Bloom, sem a confirmação exata."""
+        with self._lock:
+            return self._maybe_seen(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._added
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(bloom.size_bytes() for bloom in self._filters)
+
+    def print_metrics(self, name: str) -> None:
+        with self._lock:
+            added = self._added
+            duplicates = self._duplicates
+            lookups = self._exact_lookups
+            false_positives = self._false_positives
+            size = sum(bloom.size_bytes() for bloom in self._filters)
+            filters = len(self._filters)
+            capacity = sum(bloom.capacity for bloom in self._filters)
+
+        print(f"\n========== URLS VISTAS ({name}) ==========")
+        print(f"URLs distintas:           {added}")
+        print(f"Repetidas descartadas:    {duplicates}")
+        print(f"Memória dos filtros:      {size / 1024:.1f} KB em {filters} filtro(s)")
+        print(f"Memória por milhão:       {size / capacity * 1_000_000 / (1024 * 1024):.2f} MB "
+              f"(a {self.error_rate:.2%} de falsos positivos)")
+        print(f"Confirmações exatas:      {lookups} ({false_positives} falsos positivos do filtro"
+              + (", chaves em disco)" if self.exact is None else ")"))
+        print("==========================================\n")
+
+    def close(self) -> None:
+        """Apaga a tabela de chaves em disco, se houver."""
+        with self._lock:
+            if self._keys is not None:
+                self._keys.close()
+                self._keys = None
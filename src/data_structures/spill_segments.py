@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import threading
+
+
+class SpillSegments:
+    """
+    Fila FIFO de registros em disco, usada pela PeriodicQueue para as URLs
+    que não cabem na janela em memória.
+
+    Os registros são anexados em JSON Lines a segmentos de até `segment_size`
+    linhas e lidos do segmento mais antigo para o mais novo; um segmento
+    totalmente lido é apagado. Nada é reescrito no lugar, então uma queda
+    deixa no máximo segmentos órfãos, descartados na próxima abertura (as URLs
+    continuam na fronteira em SQLite).
+    """
+
+    def __init__(self, directory: str, segment_size: int = 10_000) -> None:
+        self.directory = directory
+        self.segment_size = segment_size
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # segmentos como [caminho, linhas escritas]; o último recebe as escritas
+        self._segments = []
+        self._next_segment = 0
+        self._writer = None
+        self._reader = None
+        self._count = 0
+
+        # Métricas
+        self._written = 0
+        self._read = 0
+        self._bytes_written = 0
+
+    def _open_segment(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        path = os.path.join(self.directory, f"segment-{self._next_segment:06d}.jsonl")
+        self._next_segment += 1
+        self._writer = open(path, "a", encoding="utf-8")
+        self._segments.append([path, 0])
+
+    def append(self, records: list[dict]) -> None:
+        with self._lock:
+            for record in records:
+                if not self._segments or self._segments[-1][1] >= self.segment_size:
+                    self._open_segment()
+                line = json.dumps(record, ensure_ascii=False) + "\n"
+                self._writer.write(line)
+                self._segments[-1][1] += 1
+                self._bytes_written += len(line)
+            if self._writer is not None:
+                self._writer.flush()
+            self._count += len(records)
+            self._written += len(records)
+
+    def read(self, count: int) -> list[dict]:
+        """Retira até `count` registros, na ordem em que foram escritos."""
+        records = []
+        with self._lock:
+            while len(records) < count and self._count > 0:
+                path, lines = self._segments[0]
+                if self._reader is None:
+                    self._reader = open(path, "r", encoding="utf-8")
+                line = self._reader.readline()
+                if line:
+                    records.append(json.loads(line))
+                    self._count -= 1
+                    continue
+                # segmento lido até o fim; o que ainda recebe escritas só fecha se já encheu
+                if len(self._segments) == 1 and lines < self.segment_size:
+                    break
+                self._reader.close()
+                self._reader = None
+                if len(self._segments) == 1:
+                    self._writer.close()
+                    self._writer = None
+                os.remove(path)
+                self._segments.pop(0)
+            self._read += len(records)
+        return records
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    def stats(self) -> tuple[int, int, int]:
+        """(registros escritos, registros lidos de volta, bytes escritos)."""
+        with self._lock:
+            return self._written, self._read, self._bytes_written
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in (self._writer, self._reader):
+                if handle is not None:
+                    handle.close()
+            self._writer = None
+            self._reader = None
+            self._segments = []
+            self._count = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -1,3 +1,4 @@
+import re
 from enum import Enum
 
 
@@ -8,20 +9,51 @@ class URLType(Enum):
     LTTR = 2
 
 
+# Forma canônica das páginas de filme de cada site: host, parâmetros de
+# rastreamento ("?ref_=..."), barra final e subpáginas do mesmo filme
+# ("/reviews", "/usuario/film/...") levam à mesma URL
+_CANONICAL = {
+    URLType.IMDB: (re.compile(r"^https?://(?:www\.|m\.)?imdb\.com/(?:[a-z]{2}/)?title/(tt\d+)", re.IGNORECASE),
+                   "https://www.imdb.com/title/{}/"),
+    URLType.ROTT: (re.compile(r"^https?://(?:www\.)?rottentomatoes\.com/m/([^/?#]+)", re.IGNORECASE),
+                   "https://www.rottentomatoes.com/m/{}"),
+    URLType.LTTR: (re.compile(r"^https?://(?:www\.)?letterboxd\.com/(?:[^/?#]+/)?film/([^/?#]+)", re.IGNORECASE),
+                   "https://letterboxd.com/film/{}/"),
+}
+
+
+def canonical_url(url_str: str, type: URLType) -> str:
+    """URL canônica do filme (id "tt..." do IMDB, slug do RT ou do Letterboxd); outras ficam como estão."""
+    rule = _CANONICAL.get(type)
+    if rule is None:
+        return url_str
+    pattern, template = rule
+    match = pattern.match(url_str.strip())
+    return template.format(match.group(1).lower()) if match else url_str
+
+
 class URL:
-    def __init__(self, url_str: str, type: URLType) -> None: 
-        self.url_str = url_str
+    def __init__(self, url_str: str, type: URLType, depth: int = 0, title: str | None = None,
+                 popularity: int | None = None) -> None:
+        self.url_str = canonical_url(url_str, type)
         self.type = type
-    
+        # Sinais usados para priorizar a URL na fila (ver src/priority.py):
+        # distância até as sementes, título do link, se havia, e avaliações do
+        # filme onde o link apareceu
+        self.depth = depth
+        self.title = title
+        self.popularity = popularity
+        self.priority = 0.0
+
     def get_url(self) -> str:
         return self.url_str
-    
+
     def get_type(self) -> URLType:
         return self.type
-    
+
     def __str__(self):
         return f"URLType: {self.url_str}, {self.type}"
-    
+
     def __eq__(self, other):
         if not isinstance(other, URL):
             return NotImplemented
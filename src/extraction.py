@@ -0,0 +1,136 @@
+"""
+Schemas declarativos de extração.
+
+Um schema lista os campos de uma página: de onde cada um vem (seletor CSS ou
+caminho no JSON-LD), como o valor bruto é normalizado e em qual setter do
+Movie ele é guardado. Os seletores são compilados uma vez, quando o schema é
+criado, e `Scraper.extract_fields()` roda os campos medindo o tempo de cada
+um. Trocar um seletor é mexer só no schema do site (src/scrapers/schemas.py).
+"""
+import json
+
+import soupsieve
+
+
+class Field:
+    """
+    Um campo do schema.
+
+    - `css`: seletor aplicado à página (ou ao nó de `scope`, se dado);
+      `attr` lê um atributo em vez do texto, e `getter` recebe o nó e
+      devolve o valor bruto, para campos que combinam mais de uma parte.
+    - `json`: caminho separado por pontos no JSON da página. Ao passar por
+      uma lista, o resto do caminho é aplicado a cada item.
+    - `many`: lista com todos os valores; `normalize` é aplicado a cada item
+      e itens que viram listas são achatados, os que viram None são descartados.
+    - `setter`: método do Movie que recebe o valor, se não for vazio.
+    - `required`: sem ele a página não é um filme.
+    """
+
+    def __init__(self, name: str, css: str | None = None, json: str | None = None, attr: str | None = None,
+                 scope: str | None = None, many: bool = False, normalize=None, setter: str | None = None,
+                 required: bool = False, label: str | None = None, getter=None) -> None:
+        if (css is None) == (json is None):
+            raise ValueError(f"O campo {name} precisa de exatamente um entre css e json")
+        self.name = name
+        self.css = css
+        self.json = json
+        self.attr = attr
+        self.getter = getter
+        self.scope = scope
+        self.many = many
+        self.normalize = normalize
+        self.setter = setter
+        self.required = required
+        # nome usado nas mensagens de erro
+        self.label = label or name
+        self.extract = self._compile()
+
+    def _compile(self):
+        """Monta a função (página, json) -> valor do campo."""
+        if self.json is not None:
+            path = tuple(self.json.split("."))
+
+            def read(site, data):
+                return self._finish(_walk(data, path))
+            return read
+
+        scope = soupsieve.compile(self.scope) if self.scope else None
+        pattern = soupsieve.compile(self.css)
+        attr = self.attr
+        getter = self.getter
+
+        def value(tag):
+            if getter is not None:
+                return getter(tag)
+            return tag.get(attr) if attr else tag.get_text(strip=True)
+
+        def read(site, data):
+            root = scope.select_one(site) if scope is not None else site
+            if root is None:
+                return [] if self.many else None
+            if self.many:
+                return self._finish([value(tag) for tag in pattern.select(root)])
+            tag = pattern.select_one(root)
+            return self._finish(value(tag) if tag is not None else None)
+        return read
+
+    def _finish(self, raw):
+        if self.many:
+            if raw is None:
+                return []
+            items = raw if isinstance(raw, list) else [raw]
+            values = []
+            for item in items:
+                if isinstance(item, str):
+                    item = item.strip()
+                if self.normalize is not None and item not in (None, ""):
+                    item = self.normalize(item)
+                if isinstance(item, list):
+                    values.extend(item)
+                elif item not in (None, ""):
+                    values.append(item)
+            return values
+        if isinstance(raw, str):
+            raw = raw.strip()
+        if raw in (None, ""):
+            return None
+        return self.normalize(raw) if self.normalize is not None else raw
+
+
+def _walk(data, path: tuple[str, ...]):
+    for i, key in enumerate(path):
+        if data is None:
+            return None
+        if isinstance(data, list):
+            return [value for item in data
+                    if (value := _walk(item, path[i:])) is not None]
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+class Schema:
+    """Campos de uma página e, se algum vier do JSON, o script que o contém."""
+
+    def __init__(self, fields: list[Field], json_script: str | None = None) -> None:
+        names = [field.name for field in fields]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Campos repetidos no schema: {names}")
+        self.fields = fields
+        self._json_script = soupsieve.compile(json_script) if json_script else None
+
+    def load_json(self, site):
+        """JSON da página, ou None se o schema não usa ou a página não tem."""
+        if self._json_script is None:
+            return None
+        tag = self._json_script.select_one(site)
+        if tag is None or not tag.string:
+            return None
+        # o Letterboxd envolve o JSON-LD em comentários CDATA
+        raw = tag.string.replace("/* <![CDATA[ */", "").replace("/* ]]> */", "").strip()
+        return json.loads(raw) if raw else None
+
+    def field(self, name: str) -> Field:
+        return next(field for field in self.fields if field.name == name)
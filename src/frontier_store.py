@@ -0,0 +1,238 @@
+"""
+Fronteira do crawl persistida em SQLite.
+
+Cada URL descoberta vira uma linha com o seu estado: "queued" quando entra na
+fila, "in-flight" quando um worker a pega e "done" ou "failed" quando o filme
+termina. Os filmes coletados também são guardados, para que uma execução
+retomada não perca o que as URLs concluídas produziram.
+
+As escritas ficam num buffer e vão para o banco numa única transação quando
+o buffer enche ou um filme termina, então as URLs de "more like this" de um
+filme são gravadas junto com o seu estado final. O banco roda em modo WAL,
+e uma queda no meio do crawl deixa no máximo os filmes em andamento para
+trás: ao retomar, os "in-flight" voltam para a fila.
+"""
+import os
+import pickle
+import sqlite3
+import time
+from threading import Lock
+
+from src.data_structures.movie import Movie
+from src.data_structures.url import URL, URLType
+
+
+STATES = ("queued", "in-flight", "done", "failed")
+
+
+class FrontierStore:
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS urls (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL UNIQUE,
+        site INTEGER NOT NULL,
+        state TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        updated REAL NOT NULL,
+        depth INTEGER NOT NULL DEFAULT 0,
+        title TEXT,
+        popularity INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS urls_site_state ON urls (site, state, seq);
+    CREATE TABLE IF NOT EXISTS movies (
+        url TEXT PRIMARY KEY,
+        site INTEGER NOT NULL,
+        data BLOB NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS lookups (
+        key TEXT PRIMARY KEY,
+        url TEXT
+    );
+    """
+
+    # Colunas acrescentadas depois da primeira versão da tabela, para abrir
+    # fronteiras gravadas por versões anteriores
+    ADDED_COLUMNS = {"depth": "INTEGER NOT NULL DEFAULT 0", "title": "TEXT", "popularity": "INTEGER"}
+
+    def __init__(self, path: str = ".crawl/frontier.sqlite3", batch_size: int = 200,
+                 max_attempts: int = 3, fresh: bool = False) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        # URLs que falharam voltam para a fila ao retomar até esta quantidade de tentativas
+        self.max_attempts = max_attempts
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # com WAL, NORMAL só arrisca a última transação numa queda de energia
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(urls)")}
+        for name, declaration in self.ADDED_COLUMNS.items():
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE urls ADD COLUMN {name} {declaration}")
+        if fresh:
+            with self._conn:
+                self._conn.execute("DELETE FROM urls")
+                self._conn.execute("DELETE FROM movies")
+        self._new_urls = []
+        self._new_keys = set()
+        self._state_updates = []
+        self._movies = []
+        self._lookups = []
+
+        # Métricas
+        self._inserted = 0
+        self._transactions = 0
+        self._flush_times = []
+        self._resumed = 0
+
+    def add(self, url: URL) -> None:
+        """Registra uma URL descoberta como "queued"."""
+        with self._lock:
+            self._new_urls.append((url.get_url(), url.get_type().value, "queued", time.time(),
+                                   url.depth, url.title, url.popularity))
+            self._new_keys.add(url.get_url())
+            if len(self._new_urls) >= self.batch_size:
+                self._flush()
+
+    def contains(self, url_str: str) -> bool:
+        """Se a URL já foi registrada; confirma os "talvez visto" do filtro de Bloom das filas."""
+        with self._lock:
+            if url_str in self._new_keys:
+                return True
+            row = self._conn.execute("SELECT 1 FROM urls WHERE url = ?", (url_str,)).fetchone()
+        return row is not None
+
+    def start(self, url: URL) -> None:
+        """Marca a URL como pega por um worker."""
+        with self._lock:
+            self._state_updates.append(("in-flight", 1, time.time(), url.get_url()))
+
+    def finish(self, url: URL, ok: bool) -> None:
+        """Marca a URL como concluída ou com falha e grava tudo o que estava no buffer."""
+        with self._lock:
+            self._state_updates.append(("done" if ok else "failed", 0, time.time(), url.get_url()))
+            self._flush()
+
+    def save_movie(self, movie: Movie, site: URLType) -> None:
+        """Guarda o filme coletado; vai para o banco junto com o estado da sua URL."""
+        data = pickle.dumps(movie)
+        with self._lock:
+            self._movies.append((movie.get_url()[0], site.value, data))
+
+    def lookup(self, key: str) -> tuple[bool, str | None]:
+        """Resultado guardado de uma consulta da semeadura entre sites: (encontrado no cache, URL ou None)."""
+        with self._lock:
+            for saved_key, url_str in self._lookups:
+                if saved_key == key:
+                    return True, url_str
+            row = self._conn.execute("SELECT url FROM lookups WHERE key = ?", (key,)).fetchone()
+        return (True, row[0]) if row is not None else (False, None)
+
+    def save_lookup(self, key: str, url_str: str | None) -> None:
+        with self._lock:
+            self._lookups.append((key, url_str))
+
+    def _flush(self) -> None:
+        if not (self._new_urls or self._state_updates or self._movies or self._lookups):
+            return
+        t0 = time.perf_counter()
+        with self._conn:
+            # as inserções vêm antes, porque os estados podem ser de URLs ainda no buffer
+            if self._new_urls:
+                cursor = self._conn.executemany(
+                    "INSERT OR IGNORE INTO urls (url, site, state, updated, depth, title, popularity) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", self._new_urls)
+                self._inserted += max(cursor.rowcount, 0)
+            if self._state_updates:
+                self._conn.executemany(
+                    "UPDATE urls SET state = ?, attempts = attempts + ?, updated = ? WHERE url = ?",
+                    self._state_updates)
+            if self._movies:
+                self._conn.executemany("INSERT OR REPLACE INTO movies (url, site, data) VALUES (?, ?, ?)",
+                                       self._movies)
+            if self._lookups:
+                self._conn.executemany("INSERT OR REPLACE INTO lookups (key, url) VALUES (?, ?)", self._lookups)
+        self._new_urls = []
+        self._new_keys = set()
+        self._state_updates = []
+        self._movies = []
+        self._lookups = []
+        self._transactions += 1
+        self._flush_times.append(time.perf_counter() - t0)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def recover(self) -> int:
+        """
+        Prepara a retomada: URLs que estavam "in-flight" quando o crawl parou,
+        e as que falharam menos de `max_attempts` vezes, voltam para "queued".
+        """
+        with self._lock:
+            self._flush()
+            with self._conn:
+                cursor = self._conn.execute(
+                    "UPDATE urls SET state = 'queued' WHERE state = 'in-flight' "
+                    "OR (state = 'failed' AND attempts < ?)", (self.max_attempts,))
+            return max(cursor.rowcount, 0)
+
+    def known_urls(self, site: URLType) -> list[str]:
+        """Todas as URLs do site já registradas, em qualquer estado."""
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute("SELECT url FROM urls WHERE site = ?", (site.value,)).fetchall()
+        return [url for (url,) in rows]
+
+    def pending_urls(self, site: URLType) -> list[URL]:
+        """URLs do site ainda na fila, na ordem em que foram descobertas, com os dados usados na prioridade."""
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute("SELECT url, depth, title, popularity FROM urls "
+                                      "WHERE site = ? AND state = 'queued' ORDER BY seq", (site.value,)).fetchall()
+        self._resumed += len(rows)
+        return [URL(url, site, depth=depth, title=title, popularity=popularity)
+                for url, depth, title, popularity in rows]
+
+    def movies(self) -> list[tuple[URLType, Movie]]:
+        """Filmes coletados pelas execuções anteriores."""
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute("SELECT site, data FROM movies").fetchall()
+        return [(URLType(site), pickle.loads(data)) for site, data in rows]
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM urls GROUP BY state").fetchall()
+        counts = {state: 0 for state in STATES}
+        counts.update(rows)
+        return counts
+
+    def print_metrics(self) -> None:
+        counts = self.counts()
+        with self._lock:
+            inserted = self._inserted
+            transactions = self._transactions
+            flush_times = list(self._flush_times)
+            resumed = self._resumed
+
+        print("\n========== MÉTRICAS DA FRONTEIRA ==========")
+        print(f"Arquivo:                  {self.path}")
+        print(f"URLs retomadas da fila:   {resumed}")
+        print(f"URLs novas gravadas:      {inserted}")
+        print("Estados:                  " + ", ".join(f"{state}={counts[state]}" for state in STATES))
+        if transactions > 0:
+            print(f"Transações:               {transactions} "
+                  f"(média de {sum(flush_times) / transactions * 1000:.2f} ms)")
+        print("==========================================\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._conn.close()
@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from threading import Lock
+
+
+
+class _BrowserSlot:
+    """Navegador e contexto mantidos aquecidos para uma única thread."""
+
+    def __init__(self, playwright, browser) -> None:
+        self.playwright = playwright
+        self.browser = browser
+        self.context = None
+        self.context_key = None
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """
+    Pool de navegadores Playwright de longa duração.
+
+    A API síncrona do Playwright só pode ser usada pela thread que a iniciou,
+    então cada thread mantém o seu próprio navegador e contexto aquecidos.
+    O pool limita quantas páginas podem estar emprestadas ao mesmo tempo e
+    recicla o navegador depois de `max_pages_per_browser` páginas ou quando
+    a memória dos seus processos passa de `max_memory_mb`.
+    """
+
+    def __init__(self, max_leases: int = 4, max_pages_per_browser: int = 50,
+                 max_memory_mb: float | None = 1024, headless: bool = True, replay=None) -> None:
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+        self.headless = headless
+        # Gravação/reprodução das requisições dos contextos (ReplayStore), se houver
+        self.replay = replay
+        self._semaphore = threading.BoundedSemaphore(max_leases)
+        self._local = threading.local()
+        self._lock = Lock()
+
+        # Métricas
+        self._launches = 0
+        self._recycles = 0
+        self._pages_served = 0
+        self._wait_times = []
+
+    @contextmanager
+    def lease_page(self, extra_http_headers: dict | None = None, request_policy=None):
+        """Empresta uma página nova de um contexto aquecido da thread atual."""
+        with self.lease_pages(1, extra_http_headers, request_policy) as pages:
+            yield pages[0]
+
+    @contextmanager
+    def lease_pages(self, count: int, extra_http_headers: dict | None = None, request_policy=None):
+        """
+        Empresta `count` páginas do mesmo contexto, para navegações em paralelo.
+        Se `request_policy` for dada, ela intercepta as requisições do contexto.
+        """
+        t0 = time.perf_counter()
+        self._semaphore.acquire()
+        try:
+            slot = self._get_slot()
+            context = self._get_context(slot, extra_http_headers, request_policy)
+            pages = [context.new_page() for _ in range(count)]
+            with self._lock:
+                self._wait_times.append(time.perf_counter() - t0)
+            try:
+                yield pages
+            finally:
+                slot.pages_served += count
+                with self._lock:
+                    self._pages_served += count
+                for page in pages:
+                    try:
+                        page.close()
+                    except Exception:
+                        pass
+                self._maybe_recycle(slot)
+        finally:
+            self._semaphore.release()
+
+    def close_thread(self) -> None:
+        """Fecha o navegador da thread atual. Deve ser chamado pela thread dona."""
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            return
+        self._local.slot = None
+        self._close_browser(slot)
+        try:
+            slot.playwright.stop()
+        except Exception:
+            pass
+
+    def _get_slot(self) -> _BrowserSlot:
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            # o Playwright só é carregado quando algum worker pede um navegador
+            from playwright.sync_api import sync_playwright
+            playwright = sync_playwright().start()
+            slot = _BrowserSlot(playwright, self._launch(playwright))
+            self._local.slot = slot
+        elif not slot.browser.is_connected():
+            # navegador caiu: descarta e sobe outro na mesma instância do Playwright
+            self._close_browser(slot)
+            slot.browser = self._launch(slot.playwright)
+        return slot
+
+    def _launch(self, playwright):
+        browser = playwright.chromium.launch(headless=self.headless)
+        with self._lock:
+            self._launches += 1
+        return browser
+
+    def _get_context(self, slot: _BrowserSlot, extra_http_headers: dict | None, request_policy=None):
+        key = (tuple(sorted((extra_http_headers or {}).items())), id(request_policy))
+        if slot.context is None or slot.context_key != key:
+            if slot.context is not None:
+                try:
+                    slot.context.close()
+                except Exception:
+                    pass
+            slot.context = slot.browser.new_context(extra_http_headers=extra_http_headers)
+            if self.replay is not None:
+                self.replay.install(slot.context)
+            if request_policy is not None:
+                request_policy.install(slot.context)
+            slot.context_key = key
+        return slot.context
+
+    def _maybe_recycle(self, slot: _BrowserSlot) -> None:
+        recycle = not slot.browser.is_connected()
+        if not recycle and slot.pages_served >= self.max_pages_per_browser:
+            recycle = True
+        if not recycle and self.max_memory_mb is not None:
+            recycle = self._browser_memory_mb(slot) > self.max_memory_mb
+        if recycle:
+            self._close_browser(slot)
+            slot.browser = self._launch(slot.playwright)
+            with self._lock:
+                self._recycles += 1
+
+    def _close_browser(self, slot: _BrowserSlot) -> None:
+        try:
+            slot.browser.close()
+        except Exception:
+            pass
+        slot.context = None
+        slot.context_key = None
+        slot.pages_served = 0
+
+    def _browser_memory_mb(self, slot: _BrowserSlot) -> float:
+        """Soma o RSS de todos os processos do navegador (somente Linux)."""
+        try:
+            session = slot.browser.new_browser_cdp_session()
+            try:
+                info = session.send("SystemInfo.getProcessInfo")
+            finally:
+                session.detach()
+        except Exception:
+            return 0.0
+
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        total = 0
+        for process in info.get("processInfo", []):
+            try:
+                with open(f"/proc/{process['id']}/statm") as f:
+                    total += int(f.read().split()[1]) * page_size
+            except (OSError, KeyError, ValueError, IndexError):
+                continue
+        return total / (1024 * 1024)
+
+    def print_metrics(self) -> None:
+        """Imprime métricas do pool de navegadores."""
+        with self._lock:
+            wait_times = list(self._wait_times)
+            launches = self._launches
+            recycles = self._recycles
+            pages_served = self._pages_served
+
+        print("\n========== MÉTRICAS DO POOL DE NAVEGADORES ==========")
+        print(f"Navegadores iniciados:    {launches}")
+        print(f"Navegadores reciclados:   {recycles}")
+        print(f"Páginas emprestadas:      {pages_served}")
+        if wait_times:
+            print(f"Espera média no pool:     {sum(wait_times)/len(wait_times):.4f} s")
+            print(f"Espera máxima no pool:    {max(wait_times):.4f} s")
+        print("=====================================================\n")
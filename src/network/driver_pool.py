@@ -0,0 +1,142 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from threading import Lock
+
+
+
+class WebDriverPool:
+    """
+    Pool de ChromeDrivers reaproveitados entre filmes.
+
+    Os drivers ficam abertos e são emprestados para um worker de cada vez.
+    Antes de emprestar e ao devolver, o driver passa por uma verificação de
+    saúde; se o Chrome tiver caído, ele é descartado e um novo é iniciado.
+    """
+
+    def __init__(self, max_drivers: int = 2, page_load_timeout: float = 30,
+                 startup_timeout: float = 20, replay=None) -> None:
+        self.page_load_timeout = page_load_timeout
+        self.startup_timeout = startup_timeout
+        # Gravação/reprodução dos DOMs renderizados (ReplayStore), se houver
+        self.replay = replay
+        self._idle = queue.LifoQueue()
+        self._semaphore = threading.BoundedSemaphore(max_drivers)
+        self._lock = Lock()
+
+        # Métricas
+        self._created = 0
+        self._restarts = 0
+        self._borrows = 0
+        self._wait_times = []
+
+    @contextmanager
+    def borrow(self):
+        """Empresta um driver saudável; ele volta para o pool ao sair do bloco."""
+        t0 = time.perf_counter()
+        self._semaphore.acquire()
+        driver = None
+        try:
+            driver = self._take_healthy()
+            with self._lock:
+                self._borrows += 1
+                self._wait_times.append(time.perf_counter() - t0)
+            yield driver
+        finally:
+            try:
+                if driver is not None:
+                    if self._is_healthy(driver):
+                        self._idle.put(driver)
+                    else:
+                        self._discard(driver)
+                        with self._lock:
+                            self._restarts += 1
+            finally:
+                self._semaphore.release()
+
+    def navigate(self, driver, url: str) -> None:
+        """Abre `url` no driver, ou o DOM gravado dela no modo replay."""
+        if self.replay is not None and self.replay.replaying:
+            driver.get(self.replay.dom_file_url(url))
+        else:
+            driver.get(url)
+
+    def snapshot(self, driver, url: str) -> None:
+        """No modo record, guarda o DOM renderizado que o driver tem agora."""
+        if self.replay is not None and self.replay.recording:
+            self.replay.record_dom(url, driver.page_source)
+
+    def close(self) -> None:
+        """Encerra todos os drivers ociosos."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def _take_healthy(self):
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            return self._create()
+        if self._is_healthy(driver):
+            return driver
+        self._discard(driver)
+        with self._lock:
+            self._restarts += 1
+        return self._create()
+
+    def _create(self):
+        # o Selenium só é carregado quando o primeiro driver é criado
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        options = Options()
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/120.0.0.0 Safari/537.36")
+        options.add_argument("--lang=en-US")
+        options.add_argument("--headless")  # roda sem abrir janela
+        # devolve o controle no DOMContentLoaded; quem usa o driver espera o que precisa
+        options.page_load_strategy = "eager"
+
+        service = Service()
+        service.startup_timeout = self.startup_timeout
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        with self._lock:
+            self._created += 1
+        return driver
+
+    def _is_healthy(self, driver) -> bool:
+        from selenium.common.exceptions import WebDriverException
+        try:
+            return driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def print_metrics(self) -> None:
+        """Imprime métricas do pool de drivers."""
+        with self._lock:
+            wait_times = list(self._wait_times)
+            created = self._created
+            restarts = self._restarts
+            borrows = self._borrows
+
+        print("\n========== MÉTRICAS DO POOL DE WEBDRIVERS ==========")
+        print(f"Drivers iniciados:        {created}")
+        print(f"Drivers reiniciados:      {restarts}")
+        print(f"Empréstimos:              {borrows}")
+        if wait_times:
+            print(f"Espera média no pool:     {sum(wait_times)/len(wait_times):.4f} s")
+            print(f"Espera máxima no pool:    {max(wait_times):.4f} s")
+        print("====================================================\n")
@@ -0,0 +1,36 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+
+
+class FetchPlan:
+    """
+    Plano de requisições de um filme.
+
+    Assim que a URL principal é conhecida, as subpáginas declaradas pelo site
+    são disparadas em paralelo. Quando o extrator pede uma delas, recebe a
+    resposta já em andamento em vez de abrir uma requisição nova, de modo que
+    o filme espera apenas pela subpágina mais lenta.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor) -> None:
+        self._executor = executor
+        self._pending: dict[str, Future] = {}
+        self._lock = Lock()
+
+    def add(self, url: str, fn, *args, **kwargs) -> None:
+        with self._lock:
+            if url not in self._pending:
+                self._pending[url] = self._executor.submit(fn, *args, **kwargs)
+
+    def take(self, url: str) -> Future | None:
+        """Retira do plano a requisição de `url`, se ela foi planejada."""
+        with self._lock:
+            return self._pending.pop(url, None)
+
+    def cancel(self) -> None:
+        """Cancela o que ainda não começou e esquece o restante."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            future.cancel()
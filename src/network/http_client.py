@@ -0,0 +1,178 @@
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.network.rate_limiter import RateLimiter
+from src.network.response_cache import ResponseCache
+from src.network.replay import ReplayStore
+
+
+class HttpClient:
+    """
+    Camada de sessões HTTP com keep-alive, uma sessão por host.
+
+    Cada host ganha uma `requests.Session` com um pool de até `pool_size`
+    conexões, timeout padrão e retentativas com backoff para erros
+    transitórios. As conexões são reaproveitadas entre as páginas de um
+    mesmo site, evitando um handshake TCP+TLS por requisição. Com um
+    `rate_limiter`, cada requisição espera a vez do seu host antes de sair,
+    inclusive as repetições de respostas 429 e 5xx.
+    Com um `cache`, respostas ainda válidas são servidas do disco sem ir à
+    rede, e as vencidas são revalidadas com uma requisição condicional.
+    Com um `replay`, as respostas são gravadas ou servidas da gravação.
+    """
+
+    # Respostas repetidas com backoff, respeitando o Retry-After
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, pool_size: int = 10, timeout: float | tuple = (5, 30),
+                 retries: int = 3, backoff_factor: float = 0.5,
+                 rate_limiter: RateLimiter | None = None, cache: ResponseCache | None = None,
+                 replay: ReplayStore | None = None) -> None:
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # Teto para o Retry-After pedido pelo site, em segundos
+        self.max_retry_after = 60.0
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.replay = replay
+        self._sessions = {}
+        self._adapters = []
+        self._lock = Lock()
+
+        # Métricas do cache
+        self._cache_hits = 0
+        self._cache_revalidated = 0
+        self._cache_misses = 0
+
+    def get(self, url: str, headers: dict | None = None, **kwargs) -> requests.Response:
+        if self.replay is None:
+            return self._get_cached(url, headers, **kwargs)
+        if self.replay.replaying:
+            return self.replay.replay_http(url)
+        response = self._get_cached(url, headers, **kwargs)
+        self.replay.record_http(url, response)
+        return response
+
+    def _get_cached(self, url: str, headers: dict | None, **kwargs) -> requests.Response:
+        if self.cache is None:
+            return self._get(url, headers, **kwargs)
+
+        entry = self.cache.lookup(url)
+        if entry is not None and entry.is_fresh():
+            cached = self.cache.load(entry)
+            if cached is not None:
+                self._count_cache("_cache_hits")
+                return cached
+
+        if entry is not None and entry.can_revalidate():
+            conditional = dict(headers or {})
+            conditional.update(entry.validator_headers())
+            response = self._get(url, conditional, **kwargs)
+            if response.status_code == 304:
+                self.cache.refresh(entry, response)
+                cached = self.cache.load(entry)
+                if cached is not None:
+                    self._count_cache("_cache_revalidated")
+                    return cached
+                # corpo sumiu do disco: busca de novo sem condicionais
+                response = self._get(url, headers, **kwargs)
+        else:
+            response = self._get(url, headers, **kwargs)
+
+        self._count_cache("_cache_misses")
+        self.cache.store(url, response)
+        return response
+
+    def _get(self, url: str, headers: dict | None, **kwargs) -> requests.Response:
+        # As respostas 429/5xx são repetidas aqui, e não pelo Retry do
+        # adapter, para que cada nova tentativa também espere a vez do host
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._session_for(url)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            response = session.get(url, headers=headers, **kwargs)
+            if response.status_code not in self.RETRY_STATUSES or attempt >= self.retries:
+                return response
+            delay = self._retry_delay(response, attempt)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Espera antes de repetir: o Retry-After do site, se houver, ou backoff exponencial."""
+        backoff = self.backoff_factor * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return backoff
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return backoff
+        return min(max(delay, 0.0), self.max_retry_after)
+
+    def _count_cache(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _session_for(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                # o adapter só repete falhas de conexão; status é com o _get
+                retry = Retry(
+                    total=self.retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=(),
+                    respect_retry_after_header=False,
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+                self._adapters.append(adapter)
+        return session
+
+    def connection_stats(self) -> tuple[int, int]:
+        """Retorna (conexões novas, requisições em conexões reaproveitadas)."""
+        new_connections = 0
+        requests_sent = 0
+        with self._lock:
+            adapters = list(self._adapters)
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                new_connections += pool.num_connections
+                requests_sent += pool.num_requests
+        return new_connections, max(requests_sent - new_connections, 0)
+
+    def cache_stats(self) -> tuple[int, int, int]:
+        """Retorna (acertos, revalidados com 304, faltas) do cache de respostas."""
+        with self._lock:
+            return self._cache_hits, self._cache_revalidated, self._cache_misses
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from threading import Lock
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Balde de tokens com reabastecimento contínuo.
+
+    O saldo pode ficar negativo: cada reserva pega o próximo token livre e
+    recebe quanto tempo falta até ele existir, então quem chega primeiro é
+    atendido primeiro sem que ninguém precise dormir segurando um lock.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos esperar antes de usá-lo."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Limitador de requisições por host, compartilhado por todos os workers.
+
+    Cada host tem o seu balde (`rate` requisições por segundo, com rajadas de
+    até `burst`). É aplicado na camada de HTTP e nas navegações dos
+    navegadores, e registra quanto tempo as requisições ficaram esperando.
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 5,
+                 host_limits: dict[str, tuple[float, int]] | None = None) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.host_limits = dict(host_limits or {})
+        self._buckets = {}
+        self._lock = Lock()
+
+        # Métricas por host: [requisições, requisições que esperaram, tempo total esperando]
+        self._stats = {}
+
+    def reserve(self, url: str) -> float:
+        host = (urlsplit(url).hostname or "").lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            delay = bucket.reserve()
+            stats = self._stats.setdefault(host, [0, 0, 0.0])
+            stats[0] += 1
+            if delay > 0:
+                stats[1] += 1
+                stats[2] += delay
+        return delay
+
+    def acquire(self, url: str) -> float:
+        """Bloqueia até o host de `url` liberar uma requisição."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def print_metrics(self) -> None:
+        """Imprime quanto cada host foi limitado."""
+        with self._lock:
+            stats = {host: list(values) for host, values in self._stats.items()}
+
+        print("\n========== MÉTRICAS DO LIMITADOR DE REQUISIÇÕES ==========")
+        for host, (requests, throttled, waited) in sorted(stats.items()):
+            print(f"{host:30s} requisições={requests} limitadas={throttled} espera total={waited:.2f} s")
+        print("==========================================================\n")
@@ -0,0 +1,217 @@
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from threading import Lock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class ReplayMissError(requests.exceptions.ConnectionError):
+    """Requisição sem gravação correspondente no modo replay."""
+
+
+class ReplayStore:
+    """
+    Gravação e reprodução de tudo o que os scrapers consomem da rede.
+
+    No modo "record" as respostas HTTP, as respostas recebidas pelos
+    navegadores do Playwright e os DOMs renderizados pelo ChromeDriver são
+    guardados num SQLite em `<diretório>/replay.sqlite3`. No modo "replay"
+    tudo é servido de volta dessa gravação, sem acesso à rede, para que a
+    mesma coleta possa ser repetida e medida de forma determinística.
+    """
+
+    MODES = ("record", "replay")
+
+    # Os corpos são guardados já decodificados, então esses cabeçalhos não valem mais
+    DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+    SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+
+    def __init__(self, directory: str, mode: str) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de gravação desconhecido: {mode}. Opções: {', '.join(self.MODES)}")
+        self.directory = directory
+        self.mode = mode
+        os.makedirs(directory, exist_ok=True)
+        self._snapshots_dir = tempfile.mkdtemp(prefix="replay-dom-")
+        self._lock = Lock()
+        self._db = sqlite3.connect(os.path.join(directory, "replay.sqlite3"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " kind TEXT NOT NULL,"
+            " method TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " status INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " PRIMARY KEY (kind, method, url))"
+        )
+        self._db.commit()
+
+        # Métricas
+        self._recorded = 0
+        self._served = 0
+        self._misses = 0
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _save(self, kind: str, method: str, url: str, status: int, headers: dict, body: bytes) -> None:
+        headers = {name: value for name, value in headers.items() if name.lower() not in self.DROPPED_HEADERS}
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, method, url, status, json.dumps(headers), body)
+            )
+            self._db.commit()
+            self._recorded += 1
+
+    def _load(self, kind: str, method: str, url: str):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, headers, body FROM responses WHERE kind = ? AND method = ? AND url = ?",
+                (kind, method, url)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._served += 1
+        status, headers, body = row
+        return status, json.loads(headers), body
+
+    # --> HTTP (HttpClient)
+
+    def record_http(self, url: str, response: requests.Response) -> None:
+        self._save("http", "GET", url, response.status_code, dict(response.headers), response.content)
+
+    def replay_http(self, url: str) -> requests.Response:
+        stored = self._load("http", "GET", url)
+        if stored is None:
+            raise ReplayMissError(f"Sem gravação para {url}")
+        status, headers, body = stored
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        return response
+
+    def http_pages(self) -> list[tuple[str, bytes]]:
+        """Todas as respostas HTTP 200 gravadas, como (url, corpo)."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT url, body FROM responses WHERE kind = 'http' AND status = 200 ORDER BY url"
+            ).fetchall()
+
+    # --> Navegadores do Playwright
+
+    def install(self, context) -> None:
+        """
+        Grava ou reproduz as requisições de um BrowserContext da API síncrona.
+        Deve ser instalado antes da política de bloqueio, para que requisições
+        bloqueadas nem cheguem aqui.
+        """
+        context.route("**/*", self._handle)
+
+    async def install_async(self, context) -> None:
+        await context.route("**/*", self._handle_async)
+
+    def _handle(self, route, request) -> None:
+        try:
+            if self.replaying:
+                stored = self._load("browser", request.method, request.url)
+                if stored is None:
+                    route.abort()
+                    return
+                status, headers, body = stored
+                route.fulfill(status=status, headers=headers, body=body)
+            else:
+                response = route.fetch()
+                body = response.body()
+                self._save("browser", request.method, request.url, response.status, response.headers, body)
+                route.fulfill(response=response, body=body)
+        except Exception as e:
+            # a rota precisa ser resolvida, senão a requisição fica pendente
+            # até a navegação estourar o tempo
+            try:
+                if self.replaying:
+                    route.abort()
+                else:
+                    route.continue_()
+            except Exception:
+                pass  # já resolvida, ou a página fechou
+            print(f"[ERROR] Falha ao {'reproduzir' if self.replaying else 'gravar'} a requisição "
+                  f"{request.url}. Erro: {e}")
+
+    async def _handle_async(self, route, request) -> None:
+        try:
+            if self.replaying:
+                stored = self._load("browser", request.method, request.url)
+                if stored is None:
+                    await route.abort()
+                    return
+                status, headers, body = stored
+                await route.fulfill(status=status, headers=headers, body=body)
+            else:
+                response = await route.fetch()
+                body = await response.body()
+                self._save("browser", request.method, request.url, response.status, response.headers, body)
+                await route.fulfill(response=response, body=body)
+        except Exception as e:
+            try:
+                if self.replaying:
+                    await route.abort()
+                else:
+                    await route.continue_()
+            except Exception:
+                pass
+            print(f"[ERROR] Falha ao {'reproduzir' if self.replaying else 'gravar'} a requisição "
+                  f"{request.url}. Erro: {e}")
+
+    # --> DOM renderizado pelo ChromeDriver
+
+    def record_dom(self, url: str, html: str) -> None:
+        # os scripts sairiam re-renderizando a página na reprodução
+        self._save("dom", "GET", url, 200, {"Content-Type": "text/html; charset=utf-8"},
+                   self.SCRIPT_RE.sub("", html).encode("utf-8"))
+
+    def dom_file_url(self, url: str) -> str:
+        """Escreve o DOM gravado num arquivo local e retorna a URL file:// dele."""
+        stored = self._load("dom", "GET", url)
+        if stored is None:
+            raise ReplayMissError(f"Sem DOM gravado para {url}")
+        path = os.path.join(self._snapshots_dir, f"{abs(hash(url))}.html")
+        with open(path, "wb") as f:
+            f.write(stored[2])
+        return "file://" + path
+
+    def print_metrics(self) -> None:
+        with self._lock:
+            recorded = self._recorded
+            served = self._served
+            misses = self._misses
+
+        print("\n========== MÉTRICAS DE GRAVAÇÃO/REPRODUÇÃO ==========")
+        print(f"Modo:                     {self.mode}")
+        if self.recording:
+            print(f"Respostas gravadas:       {recorded}")
+        else:
+            print(f"Respostas reproduzidas:   {served}")
+            print(f"Sem gravação:             {misses}")
+        print("=====================================================\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
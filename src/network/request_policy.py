@@ -0,0 +1,217 @@
+import inspect
+import time
+from threading import Lock
+from urllib.parse import urlsplit
+
+
+class RequestPolicy:
+    """
+    Política de interceptação de requisições de um contexto do Playwright.
+
+    Os extratores só leem alguns nós do DOM, então imagens, mídia e fontes são
+    abortadas, assim como qualquer requisição para hosts fora da lista de
+    permitidos do site (anúncios, analytics, pixels de rastreamento).
+
+    Para estimar a economia, uma a cada `baseline_every` páginas carrega
+    completa: nela são medidos o tamanho das respostas que seriam bloqueadas e
+    o tempo de carregamento, comparados depois com as páginas enxutas. O
+    tamanho é o do corpo recebido (`request.sizes()`); o `content-length` só
+    entra quando ele não está disponível, e as respostas sem nenhum dos dois
+    aparecem nas métricas.
+    """
+
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack", "manifest", "ping"})
+
+    def __init__(self, allowed_hosts: tuple[str, ...], blocked_resource_types: frozenset[str] | None = None,
+                 baseline_every: int | None = 25) -> None:
+        # Um host é permitido se for igual a um dos sufixos ou subdomínio dele
+        self.allowed_hosts = tuple(host.lower() for host in allowed_hosts)
+        self.blocked_resource_types = (blocked_resource_types if blocked_resource_types is not None
+                                       else self.BLOCKED_RESOURCE_TYPES)
+        self.baseline_every = baseline_every
+        # página da amostra completa -> ouvinte de "response" registrado nela
+        self._baseline_pages = {}
+        self._lock = Lock()
+
+        # Métricas
+        self._pages = 0
+        self._blocked = {}
+        self._lean_load_times = []
+        self._baseline_load_times = []
+        self._baseline_bytes = {}
+        self._baseline_unsized = 0
+
+    def is_allowed_host(self, url: str) -> bool:
+        host = (urlsplit(url).hostname or "").lower()
+        return any(host == allowed or host.endswith("." + allowed) for allowed in self.allowed_hosts)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document" and url.startswith(("about:", "data:")):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return not self.is_allowed_host(url)
+
+    def block_reason(self, resource_type: str, url: str) -> str:
+        return resource_type if resource_type in self.blocked_resource_types else "terceiros"
+
+    # --> Instalação nos contextos
+
+    def install(self, context) -> None:
+        """Intercepta as requisições de um BrowserContext da API síncrona."""
+        context.route("**/*", self._handle)
+
+    async def install_async(self, context) -> None:
+        """Intercepta as requisições de um BrowserContext da API assíncrona."""
+        await context.route("**/*", self._handle_async)
+
+    def _handle(self, route, request) -> None:
+        try:
+            if self._blocks(request):
+                route.abort()
+            else:
+                route.fallback()
+        except Exception:
+            pass  # página fechada enquanto a requisição estava pendente
+
+    async def _handle_async(self, route, request) -> None:
+        try:
+            if self._blocks(request):
+                await route.abort()
+            else:
+                await route.fallback()
+        except Exception:
+            pass
+
+    def _blocks(self, request) -> bool:
+        resource_type = request.resource_type
+        url = request.url
+        if not self.should_block(resource_type, url) or self._is_baseline_request(request):
+            return False
+        reason = self.block_reason(resource_type, url)
+        with self._lock:
+            self._blocked[reason] = self._blocked.get(reason, 0) + 1
+        return True
+
+    def _is_baseline_request(self, request) -> bool:
+        if not self._baseline_pages:
+            return False
+        try:
+            return request.frame.page in self._baseline_pages
+        except Exception:
+            return False  # requisições de service workers não têm frame
+
+    # --> Acompanhamento das páginas
+
+    def start_page(self, page) -> None:
+        """Chamado antes da navegação; decide se a página é uma amostra completa."""
+        with self._lock:
+            self._pages += 1
+            baseline = self.baseline_every is not None and self._pages % self.baseline_every == 1
+            if baseline:
+                # na API assíncrona o tamanho da resposta é aguardado num ouvinte assíncrono
+                listener = (self._on_baseline_response_async if inspect.iscoroutinefunction(page.goto)
+                            else self._on_baseline_response)
+                self._baseline_pages[page] = listener
+        if baseline:
+            page.on("response", listener)
+            # uma página fechada no meio da navegação não volta para finish_page()
+            page.once("close", self.abandon_page)
+
+    def finish_page(self, page, elapsed: float) -> None:
+        """Registra o tempo até o DOM carregado de uma página iniciada por start_page()."""
+        with self._lock:
+            baseline = page in self._baseline_pages
+            if baseline:
+                self._baseline_load_times.append(elapsed)
+            else:
+                self._lean_load_times.append(elapsed)
+        if baseline:
+            self.abandon_page(page)
+
+    def abandon_page(self, page) -> None:
+        """
+        Encerra a amostra completa de uma página sem registrar o tempo, p.ex.
+        quando a navegação falhou. As páginas do pool são reaproveitadas, e uma
+        amostra que ficasse aberta deixaria as próximas navegações sem bloqueio.
+        """
+        with self._lock:
+            listener = self._baseline_pages.pop(page, None)
+        if listener is None:
+            return
+        try:
+            page.remove_listener("response", listener)
+            page.remove_listener("close", self.abandon_page)
+        except Exception:
+            pass  # já removidos, ou a página fechou
+
+    def _baseline_reason(self, response) -> str | None:
+        # só o que não é bloqueado sempre gera resposta; o resto é a economia
+        request = response.request
+        if not self.should_block(request.resource_type, request.url):
+            return None
+        return self.block_reason(request.resource_type, request.url)
+
+    def _on_baseline_response(self, response) -> None:
+        reason = self._baseline_reason(response)
+        if reason is None:
+            return
+        try:
+            sizes = response.request.sizes()
+        except Exception:
+            sizes = None  # requisição que falhou ou página fechada
+        self._record_baseline(reason, response, sizes)
+
+    async def _on_baseline_response_async(self, response) -> None:
+        reason = self._baseline_reason(response)
+        if reason is None:
+            return
+        try:
+            sizes = await response.request.sizes()
+        except Exception:
+            sizes = None
+        self._record_baseline(reason, response, sizes)
+
+    def _record_baseline(self, reason: str, response, sizes: dict | None) -> None:
+        # respostas chunked não têm content-length; sem sizes() elas ficam sem tamanho
+        size = sizes.get("responseBodySize") if sizes else None
+        if size is None or size < 0:
+            try:
+                size = int(response.headers["content-length"])
+            except (KeyError, ValueError):
+                size = None
+        with self._lock:
+            if size is None:
+                self._baseline_unsized += 1
+                return
+            total, count = self._baseline_bytes.get(reason, (0, 0))
+            self._baseline_bytes[reason] = (total + size, count + 1)
+
+    def print_metrics(self, name: str) -> None:
+        """Imprime bloqueios e a economia estimada a partir das amostras completas."""
+        with self._lock:
+            blocked = dict(self._blocked)
+            lean = list(self._lean_load_times)
+            baseline = list(self._baseline_load_times)
+            baseline_bytes = dict(self._baseline_bytes)
+            unsized = self._baseline_unsized
+
+        print(f"\n========== MÉTRICAS DE BLOQUEIO DO {name} ==========")
+        print(f"Páginas enxutas:          {len(lean)}")
+        print(f"Páginas completas (amostra): {len(baseline)}")
+        bytes_saved = 0
+        for reason, count in sorted(blocked.items()):
+            total, samples = baseline_bytes.get(reason, (0, 0))
+            estimate = total / samples * count if samples else 0
+            bytes_saved += estimate
+            print(f"{reason:25s} bloqueadas={count} economia estimada={estimate / 1024:.1f} KB")
+        if lean:
+            print(f"Bytes economizados/página: {bytes_saved / len(lean) / 1024:.1f} KB (estimativa)")
+        if unsized:
+            print(f"Respostas sem tamanho:    {unsized} na amostra, fora da estimativa")
+        if lean and baseline:
+            lean_avg = sum(lean) / len(lean)
+            baseline_avg = sum(baseline) / len(baseline)
+            print(f"Carregamento médio:       {lean_avg:.4f} s enxuta, {baseline_avg:.4f} s completa")
+            print(f"Tempo economizado/página: {baseline_avg - lean_avg:.4f} s")
+        print("===================================================\n")
@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from threading import Lock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class CachedEntry:
+    """Metadados de uma resposta guardada no cache."""
+
+    def __init__(self, url, body_hash, headers, etag, last_modified, stored_at, size, resource_type, ttl) -> None:
+        self.url = url
+        self.body_hash = body_hash
+        self.headers = headers
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+        self.size = size
+        self.resource_type = resource_type
+        self.ttl = ttl
+
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def validator_headers(self) -> dict:
+        """Cabeçalhos de requisição condicional para revalidar a entrada."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache de respostas HTTP em disco, endereçado por conteúdo.
+
+    Os corpos ficam em `<diretório>/blobs`, nomeados pelo SHA-256, e um índice
+    SQLite associa cada URL ao seu corpo, validadores (ETag e Last-Modified),
+    tipo de recurso e horários de gravação e de último acesso. Cada tipo de
+    recurso tem a sua validade; entradas vencidas são revalidadas com uma
+    requisição condicional quando o servidor forneceu validadores. Acima de
+    `max_bytes` as entradas menos acessadas recentemente são descartadas.
+    """
+
+    # Validade padrão por tipo de recurso, em segundos
+    DEFAULT_TTLS = {
+        "title": 24 * 3600,
+        "reviews": 6 * 3600,
+        "cast": 7 * 24 * 3600,
+        "other": 24 * 3600,
+    }
+
+    # Cabeçalhos de resposta preservados junto com o corpo
+    KEPT_HEADERS = ("Content-Type", "Content-Encoding", "ETag", "Last-Modified")
+
+    def __init__(self, directory: str = ".cache/http", max_bytes: int = 512 * 1024 * 1024,
+                 ttls: dict[str, float] | None = None) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._blobs_dir = os.path.join(directory, "blobs")
+        os.makedirs(self._blobs_dir, exist_ok=True)
+        self._lock = Lock()
+        self._db = sqlite3.connect(os.path.join(directory, "index.sqlite3"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " url TEXT PRIMARY KEY,"
+            " body_hash TEXT NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " stored_at REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " resource_type TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_body_hash ON entries(body_hash)")
+        self._db.commit()
+        # Bytes dos corpos guardados, somados só na abertura e mantidos a cada gravação e remoção
+        self._total = self._sum_bytes()
+
+        # Métricas
+        self._evictions = 0
+
+    @staticmethod
+    def classify(url: str) -> str:
+        """Tipo de recurso da URL, usado para escolher a validade da entrada."""
+        path = url.lower()
+        if "review" in path:
+            return "reviews"
+        if "cast-and-crew" in path or "fullcredits" in path or "/crew" in path:
+            return "cast"
+        if "/title/" in path or "/m/" in path or "/film/" in path:
+            return "title"
+        return "other"
+
+    def lookup(self, url: str) -> CachedEntry | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body_hash, headers, etag, last_modified, stored_at, size, resource_type"
+                " FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body_hash, headers, etag, last_modified, stored_at, size, resource_type = row
+        if not os.path.exists(self._blob_path(body_hash)):
+            self.remove(url)
+            return None
+        ttl = self.ttls.get(resource_type, self.ttls["other"])
+        return CachedEntry(url, body_hash, json.loads(headers), etag, last_modified,
+                           stored_at, size, resource_type, ttl)
+
+    def load(self, entry: CachedEntry) -> requests.Response | None:
+        """Monta um `requests.Response` com o corpo guardado e marca o acesso."""
+        try:
+            with open(self._blob_path(entry.body_hash), "rb") as f:
+                body = f.read()
+        except OSError:
+            self.remove(entry.url)
+            return None
+        with self._lock:
+            self._db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), entry.url))
+            self._db.commit()
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry.url
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        return response
+
+    def refresh(self, entry: CachedEntry, response: requests.Response) -> None:
+        """Renova a validade de uma entrada confirmada por uma resposta 304."""
+        etag = response.headers.get("ETag", entry.etag)
+        last_modified = response.headers.get("Last-Modified", entry.last_modified)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET stored_at = ?, last_access = ?, etag = ?, last_modified = ? WHERE url = ?",
+                (now, now, etag, last_modified, entry.url)
+            )
+            self._db.commit()
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """Guarda uma resposta 200, a menos que o servidor proíba."""
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(body_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{id(body)}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+
+        headers = {name: response.headers[name] for name in self.KEPT_HEADERS if name in response.headers}
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute("SELECT body_hash, size FROM entries WHERE url = ?", (url,)).fetchone()
+            if not self._blob_in_use(body_hash):
+                self._total += len(body)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body_hash, json.dumps(headers), response.headers.get("ETag"),
+                 response.headers.get("Last-Modified"), now, now, len(body), self.classify(url))
+            )
+            if previous is not None and previous[0] != body_hash:
+                self._drop_blob_if_unused(*previous)
+            self._evict()
+            self._db.commit()
+
+    def remove(self, url: str) -> None:
+        with self._lock:
+            row = self._db.execute("SELECT body_hash, size FROM entries WHERE url = ?", (url,)).fetchone()
+            self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+            if row is not None:
+                self._drop_blob_if_unused(*row)
+            self._db.commit()
+
+    def total_bytes(self) -> int:
+        """Bytes ocupados pelos corpos guardados (corpos repetidos contam uma vez)."""
+        with self._lock:
+            return self._total
+
+    def _sum_bytes(self) -> int:
+        row = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT size FROM entries GROUP BY body_hash)"
+        ).fetchone()
+        return row[0]
+
+    def _evict(self) -> None:
+        # Chamado com o lock: remove as entradas acessadas há mais tempo até
+        # caber no limite, em lotes pelo índice de last_access
+        while self._total > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT url, body_hash, size FROM entries ORDER BY last_access LIMIT 32").fetchall()
+            if not rows:
+                break
+            for url, body_hash, size in rows:
+                if self._total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._drop_blob_if_unused(body_hash, size)
+                self._evictions += 1
+
+    def _blob_in_use(self, body_hash: str) -> bool:
+        row = self._db.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone()
+        return row is not None
+
+    def _drop_blob_if_unused(self, body_hash: str, size: int) -> None:
+        # Corpos são compartilhados entre URLs com o mesmo conteúdo; só apaga o último
+        if self._blob_in_use(body_hash):
+            return
+        self._total -= size
+        try:
+            os.remove(self._blob_path(body_hash))
+        except OSError:
+            pass
+
+    def _blob_path(self, body_hash: str) -> str:
+        return os.path.join(self._blobs_dir, body_hash[:2], body_hash)
+
+    def evictions(self) -> int:
+        with self._lock:
+            return self._evictions
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,163 @@
+"""
+Normalização de datas e durações extraídas das páginas.
+
+Os formatos que os sites usam de verdade ("Mar 31, 1999", "31 Mar 1999",
+"PT2H16M", "2h 16m"...) são resolvidos em Python puro. Só o que sobra vai para
+o pandas, de uma vez para toda a lista, então quem tem vários valores (as
+reviews de uma página, as datas de lançamento de um filme) deve normalizá-los
+juntos. O pandas só é importado se algum valor precisar dele.
+"""
+import re
+from datetime import date, datetime, timedelta
+
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Formatos tentados em ordem antes de cair no pandas
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%m/%d/%Y",
+    "%b %d %Y",
+)
+
+_ISO_DURATION = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$", re.IGNORECASE)
+_TEXT_DURATION = re.compile(r"^(?:(\d+)\s*h(?:ours?|rs?)?)?\s*(?:(\d+)\s*m(?:in(?:utes?|s)?)?)?$", re.IGNORECASE)
+_RELATIVE_DATE = re.compile(r"^(\d+)\s*([mhdw])$")
+_MONTH_DAY = re.compile(r"^[a-z]{3} \d{1,2}$", re.IGNORECASE)
+
+_RELATIVE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_date(raw: str | None, formats: tuple[str, ...] = DATE_FORMATS) -> date | None:
+    """Caminho rápido de uma data; None se não estiver em nenhum formato conhecido."""
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        # ISO com ou sem horário ("2024-01-02T10:00:00Z")
+        return datetime.fromisoformat(raw.replace("Z", "+00:00")).date()
+    except ValueError:
+        pass
+    for fmt in formats:
+        try:
+            return datetime.strptime(raw, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_dates(values: list[str | None], formats: tuple[str, ...] = DATE_FORMATS) -> list[str | None]:
+    """Datas como "AAAA-MM-DD", na mesma ordem; None onde não foi possível converter."""
+    result = []
+    pending = []
+    for i, raw in enumerate(values):
+        parsed = parse_date(raw, formats)
+        if parsed is None and raw and raw.strip():
+            pending.append(i)
+        result.append(parsed.strftime(DATE_FORMAT) if parsed is not None else None)
+
+    if pending:
+        import pandas as pd
+        parsed = pd.to_datetime([values[i].strip() for i in pending], format="mixed", errors="coerce")
+        for i, value in zip(pending, parsed):
+            if not pd.isna(value):
+                result[i] = value.strftime(DATE_FORMAT)
+    return result
+
+
+def normalize_date(raw: str | None, formats: tuple[str, ...] = DATE_FORMATS) -> str | None:
+    return normalize_dates([raw], formats)[0]
+
+
+def normalize_relative_dates(values: list[str | None], now: datetime | None = None) -> list[str | None]:
+    """
+    Datas de reviews que podem ser relativas ("47m", "2h", "1d", "3w"), sem
+    ano ("Nov 27", assumindo o último ano em que a data não fica no futuro)
+    ou absolutas ("09/27/2024").
+    """
+    now = now if now is not None else datetime.now()
+    result = [None] * len(values)
+    absolute = []
+    for i, raw in enumerate(values):
+        if not raw:
+            continue
+        s = raw.strip().lower()
+        match = _RELATIVE_DATE.match(s)
+        if match:
+            delta = timedelta(**{_RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+            result[i] = (now - delta).strftime(DATE_FORMAT)
+        elif _MONTH_DAY.match(s):
+            absolute.append((i, f"{s}, {now.year}"))
+        else:
+            absolute.append((i, s))
+
+    if absolute:
+        normalized = normalize_dates([raw for _, raw in absolute])
+        today = now.strftime(DATE_FORMAT)
+        for (i, raw), value in zip(absolute, normalized):
+            if value is not None and value > today and _MONTH_DAY.match(values[i].strip()):
+                # sem ano e no futuro: é do ano passado
+                value = _previous_year(value)
+            result[i] = value
+    return result
+
+
+def _previous_year(value: str) -> str:
+    d = datetime.strptime(value, DATE_FORMAT).date()
+    # 29 de fevereiro vira 28 no ano anterior
+    day = min(d.day, 28) if d.month == 2 else d.day
+    return d.replace(year=d.year - 1, day=day).strftime(DATE_FORMAT)
+
+
+def earliest_date(*values: str | None) -> str | None:
+    """A data mais antiga entre as válidas, já normalizada, ou None se nenhuma for."""
+    dates = [d for d in normalize_dates(list(values)) if d is not None]
+    return min(dates) if dates else None
+
+
+def _format_seconds(total: float) -> str:
+    total = int(total)
+    return f"{total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}"
+
+
+def parse_duration(raw: str | None) -> str | None:
+    """Caminho rápido de uma duração ("PT2H16M", "2h 16m") como "HH:MM:SS"."""
+    if not raw:
+        return None
+    raw = raw.strip()
+    match = _ISO_DURATION.match(raw)
+    if match and any(match.groups()):
+        days, hours, minutes, seconds = (float(g) if g else 0 for g in match.groups())
+        return _format_seconds(days * 86400 + hours * 3600 + minutes * 60 + seconds)
+    match = _TEXT_DURATION.match(raw)
+    if match and any(match.groups()):
+        hours, minutes = (int(g) if g else 0 for g in match.groups())
+        return _format_seconds(hours * 3600 + minutes * 60)
+    return None
+
+
+def normalize_durations(values: list[str | None]) -> list[str | None]:
+    """Durações como "HH:MM:SS", na mesma ordem; None onde não foi possível converter."""
+    result = []
+    pending = []
+    for i, raw in enumerate(values):
+        parsed = parse_duration(raw)
+        if parsed is None and raw and raw.strip():
+            pending.append(i)
+        result.append(parsed)
+
+    if pending:
+        import pandas as pd
+        parsed = pd.to_timedelta([values[i].strip() for i in pending], errors="coerce")
+        for i, value in zip(pending, parsed):
+            if not pd.isna(value):
+                result[i] = _format_seconds(value.total_seconds())
+    return result
+
+
+def normalize_duration(raw: str | None) -> str | None:
+    return normalize_durations([raw])[0]
@@ -0,0 +1,202 @@
+"""
+Pool de processos para o parsing das páginas de filme.
+
+Buscar as páginas é I/O, mas montar a árvore do BeautifulSoup e rodar os
+extratores é CPU e, nas threads dos scrapers, disputa o GIL. Com o pool, as
+threads (ou tarefas do motor asyncio) só buscam os bytes e entregam a página
+principal de cada filme para `Scraper.extract_page()` rodar num processo
+separado, que devolve o Movie já preenchido e os campos do schema.
+
+As páginas são agrupadas em lotes para amortizar a ida e volta entre os
+processos: enquanto todos os processos estão ocupados, as páginas que chegam
+esperam na fila e seguem juntas no próximo lote.
+"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from queue import Empty, Queue
+
+from src.config import DEFAULT_BACKEND
+from src.data_structures.url import URLType
+
+
+# Estado de cada processo do pool: um scraper por site, usado só para extrair
+_settings = {}
+_extractors = {}
+
+
+def _init_process(parser_backend: str, targeted_parsing: bool) -> None:
+    _settings["parser_backend"] = parser_backend
+    _settings["targeted_parsing"] = targeted_parsing
+
+
+def _extractor(site: URLType):
+    extractor = _extractors.get(site)
+    if extractor is None:
+        from src.data_structures.periodic_queue import PeriodicQueue
+        from src.scrapers import registry
+        extractor = registry.scraper_class(site)(PeriodicQueue(0), None)
+        extractor.parser_backend = _settings["parser_backend"]
+        extractor.targeted_parsing = _settings["targeted_parsing"]
+        _extractors[site] = extractor
+    return extractor
+
+
+def _extract_batch(batch: list[tuple[URLType, str, bytes]]):
+    """Roda num processo do pool. Retorna, por página, o resultado e as métricas do scraper."""
+    t0 = time.perf_counter()
+    results = []
+    for site, url_str, body in batch:
+        extractor = _extractor(site)
+        try:
+            page = extractor.extract_page(url_str, body)
+        except Exception as e:
+            extractor._errors += 1
+            print(f"[ERROR] Falha ao extrair a página {url_str} no pool de parsing. Erro: {e}")
+            page = None
+        results.append((page, extractor.take_metrics()))
+    return results, time.perf_counter() - t0
+
+
+class ParsePool:
+    """
+    Processos que extraem as páginas de filme enviadas pelos scrapers.
+
+    `extract()` bloqueia só a thread que chamou. Um lote sai quando há um
+    processo livre, com até `batch_size` páginas da fila; `batch_wait` é o
+    tempo que um lote incompleto ainda espera por mais páginas.
+    """
+
+    def __init__(self, processes: int = 2, batch_size: int = 8, batch_wait: float = 0.005,
+                 parser_backend: str = DEFAULT_BACKEND, targeted_parsing: bool = True) -> None:
+        if processes < 1 or batch_size < 1:
+            raise ValueError("O pool de parsing precisa de pelo menos 1 processo e lotes de pelo menos 1 página")
+        self.processes = processes
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        # "spawn": o fork de um processo cheio de threads pode herdar locks presos
+        self._executor = ProcessPoolExecutor(max_workers=processes,
+                                             mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=_init_process,
+                                             initargs=(parser_backend, targeted_parsing))
+        self._queue = Queue()
+        # um lote por processo; o resto espera na fila e forma lotes maiores
+        self._slots = threading.Semaphore(processes)
+        self._lock = threading.Lock()
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+        # Métricas
+        self._queued = 0
+        self._in_flight = 0
+        self._pages = 0
+        self._batches = 0
+        self._depth_sum = 0
+        self._depth_max = 0
+        self._busy_time = 0.0
+        self._round_trip_time = 0.0
+        self._first_submit = None
+        self._last_done = None
+
+    def extract(self, site: URLType, url_str: str, body: bytes):
+        """Extrai a página num processo do pool. Retorna (página, métricas do scraper)."""
+        future = Future()
+        with self._lock:
+            if self._first_submit is None:
+                self._first_submit = time.perf_counter()
+            self._queued += 1
+            # profundidade vista por quem chega: páginas esperando e em extração
+            depth = self._queued + self._in_flight
+            self._depth_sum += depth
+            self._depth_max = max(self._depth_max, depth)
+        self._queue.put((site, url_str, body, future))
+        return future.result()
+
+    def _dispatch(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._slots.acquire()
+            batch = [item]
+            closing = False
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            self._submit(batch)
+            if closing:
+                return
+
+    def _submit(self, batch: list) -> None:
+        with self._lock:
+            self._queued -= len(batch)
+            self._in_flight += len(batch)
+            self._batches += 1
+        t0 = time.perf_counter()
+        try:
+            pending = self._executor.submit(_extract_batch, [(site, url_str, body) for site, url_str, body, _ in batch])
+        except Exception as e:
+            self._deliver_error(batch, e)
+            return
+        pending.add_done_callback(lambda done: self._deliver(done, batch, t0))
+
+    def _deliver(self, done, batch: list, t0: float) -> None:
+        try:
+            results, busy = done.result()
+        except Exception as e:
+            self._deliver_error(batch, e)
+            return
+        with self._lock:
+            self._in_flight -= len(batch)
+            self._pages += len(batch)
+            self._busy_time += busy
+            self._round_trip_time += time.perf_counter() - t0
+            self._last_done = time.perf_counter()
+        self._slots.release()
+        for (_, _, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _deliver_error(self, batch: list, error: Exception) -> None:
+        # p.ex. um processo morreu: quem chamou extrai na própria thread
+        with self._lock:
+            self._in_flight -= len(batch)
+        self._slots.release()
+        for _, _, _, future in batch:
+            future.set_exception(error)
+
+    def print_metrics(self) -> None:
+        with self._lock:
+            pages = self._pages
+            batches = self._batches
+            submits = pages + self._queued + self._in_flight
+            depth_avg = self._depth_sum / submits if submits else 0.0
+            depth_max = self._depth_max
+            busy = self._busy_time
+            round_trip = self._round_trip_time
+            elapsed = (self._last_done - self._first_submit) if self._last_done is not None else 0.0
+
+        print("\n========== MÉTRICAS DO POOL DE PARSING ==========")
+        print(f"Processos:                {self.processes}")
+        if pages > 0:
+            print(f"Páginas extraídas:        {pages} em {batches} lotes ({pages / batches:.1f} páginas/lote)")
+            print(f"Fila de parsing:          {depth_avg:.1f} páginas em média, máximo {depth_max}")
+            if elapsed > 0:
+                print(f"Utilização dos processos: {busy / (self.processes * elapsed) * 100:.1f}%")
+            print(f"Extração média/página:    {busy / pages * 1000:.1f} ms")
+            print(f"Ida e volta média/lote:   {round_trip / batches * 1000:.1f} ms")
+        else:
+            print("Nenhuma página extraída.")
+        print("==========================================\n")
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True, cancel_futures=True)
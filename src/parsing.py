@@ -0,0 +1,103 @@
+import json
+import re
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+# Tree builders do BeautifulSoup aceitos pelos scrapers. O lxml é um parser
+# em C, bem mais rápido que o html.parser puro em Python e que segura o GIL
+# por menos tempo; o html.parser fica como alternativa sem dependências.
+from src.config import PARSER_BACKENDS, DEFAULT_BACKEND
+
+
+_SCRIPT_OPEN = re.compile(rb"<script\b([^>]*)>", re.IGNORECASE)
+_SCRIPT_CLOSE = re.compile(rb"</script\s*>", re.IGNORECASE)
+
+
+class ParseTarget:
+    """
+    Nó de uma página que um extrator precisa: nome da tag e atributos.
+
+    Os valores dos atributos podem ser uma string (para `class`, basta ser
+    uma das classes do elemento), uma regex ou True (atributo presente).
+    """
+
+    def __init__(self, name: str, attrs: dict | None = None) -> None:
+        self.name = name
+        self.attrs = attrs or {}
+
+    def matches(self, name: str, attrs: dict) -> bool:
+        if name != self.name:
+            return False
+        for key, expected in self.attrs.items():
+            value = attrs.get(key)
+            if value is None:
+                return False
+            if isinstance(value, list):
+                value = " ".join(value)
+            if expected is True:
+                continue
+            if isinstance(expected, re.Pattern):
+                if not expected.search(value):
+                    return False
+            elif key == "class":
+                if expected not in value.split():
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+
+class TargetFilter(ElementFilter):
+    """
+    Filtro de parsing que só cria as subárvores que casam com algum alvo.
+
+    O resto da página é descartado ainda no parser, então a árvore montada
+    contém apenas os pedaços declarados pelos extratores, lado a lado.
+    """
+
+    def __init__(self, targets) -> None:
+        self.targets = tuple(targets)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        return any(target.matches(name, attrs) for target in self.targets)
+
+    def allow_string_creation(self, string: str) -> bool:
+        # texto solto fora dos alvos não interessa a nenhum extrator
+        return False
+
+
+def make_soup(markup, backend: str = DEFAULT_BACKEND, targets: TargetFilter | None = None) -> BeautifulSoup:
+    """
+    Monta a árvore de `markup` (bytes ou str) com o backend escolhido. Com
+    `targets`, só os nós declarados são montados.
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Parser desconhecido: {backend}. Opções: {', '.join(PARSER_BACKENDS)}")
+    return BeautifulSoup(markup, backend, parse_only=targets)
+
+
+def extract_script_json(body, attr: str, value: str):
+    """
+    Decodifica o JSON do primeiro `<script>` com `attr="value"` direto dos
+    bytes da resposta, sem montar árvore nenhuma. Retorna None se o script
+    não existir ou o conteúdo não for JSON válido.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    wanted = re.compile(
+        rb"(?:^|\s)" + re.escape(attr.encode()) + rb"\s*=\s*([\"']?)" + re.escape(value.encode()) + rb"\1(?:\s|/|$)",
+        re.IGNORECASE,
+    )
+    for opening in _SCRIPT_OPEN.finditer(body):
+        if not wanted.search(opening.group(1)):
+            continue
+        closing = _SCRIPT_CLOSE.search(body, opening.end())
+        if closing is None:
+            return None
+        try:
+            return json.loads(body[opening.end():closing.start()])
+        except ValueError:
+            return None
+    return None
@@ -0,0 +1,109 @@
+"""
+Prioridade das URLs nas filas.
+
+O crawl termina quando o Storage chega ao limite de filmes, então a ordem em
+que as URLs são buscadas decide quantos filmes saem unidos dos três sites.
+Cada URL recebe uma nota:
+
+- `cross_site` por site em que um filme com o mesmo título já foi coletado;
+- `popularity` vezes log10(1 + avaliações do filme onde o link apareceu);
+- menos `depth` por nível de distância até as sementes.
+
+O título vem do texto do link (IMDB) ou do slug da URL (Rotten Tomatoes e
+Letterboxd). Quando um filme é armazenado, as URLs com o mesmo título que
+estão nas filas dos outros sites são reavaliadas e sobem na fila.
+"""
+import math
+import re
+import threading
+import unicodedata
+
+from src.data_structures.url import URL, URLType
+
+
+DEFAULT_WEIGHTS = {"cross_site": 4.0, "popularity": 0.5, "depth": 1.0}
+
+_ARTICLES = ("the", "a", "an")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_TRAILING_YEAR = re.compile(r"^(.*\S) (19\d\d|20\d\d)$")
+_SLUG = {
+    URLType.ROTT: re.compile(r"/m/([^/?#]+)"),
+    URLType.LTTR: re.compile(r"/film/([^/?#]+)"),
+}
+
+
+def title_key(title: str | None) -> str | None:
+    """Título normalizado para comparação entre sites: sem acentos, pontuação, caixa e artigo inicial."""
+    if not title:
+        return None
+    text = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode().lower()
+    words = _NON_ALNUM.sub(" ", text).split()
+    if len(words) > 1 and words[0] in _ARTICLES:
+        words = words[1:]
+    return " ".join(words) or None
+
+
+def slug_keys(url: URL) -> set[str]:
+    """
+    Chaves de título tiradas do slug da URL. Os sites desambiguam títulos
+    repetidos com o ano ("the_matrix_1999", "dune-2021"), então a chave sem o
+    ano também entra.
+    """
+    pattern = _SLUG.get(url.get_type())
+    match = pattern.search(url.get_url()) if pattern else None
+    if not match:
+        return set()
+    key = title_key(match.group(1).replace("_", " ").replace("-", " "))
+    if key is None:
+        return set()
+    keys = {key}
+    year = _TRAILING_YEAR.match(key)
+    if year:
+        keys.add(year.group(1))
+    return keys
+
+
+class PriorityScorer:
+
+    def __init__(self, storage, weights: dict[str, float] | None = None) -> None:
+        self.storage = storage
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+        # Filas de cada site, reavaliadas quando um filme é armazenado
+        self.queues = {}
+
+        # Métricas
+        self._lock = threading.Lock()
+        self._rescored = 0
+
+    def keys(self, url: URL) -> set[str]:
+        key = title_key(url.title)
+        if key is not None:
+            return {key}
+        return slug_keys(url)
+
+    def score(self, url: URL) -> float:
+        sites = set()
+        for key in self.keys(url):
+            sites |= self.storage.sites_with_title(key)
+        sites.discard(url.get_type())
+        score = self.weights["cross_site"] * len(sites) - self.weights["depth"] * url.depth
+        if url.popularity:
+            score += self.weights["popularity"] * math.log10(1 + url.popularity)
+        return score
+
+    def movie_stored(self, title: str | None, site: URLType) -> None:
+        """Reavalia as URLs dos outros sites que têm o título do filme armazenado."""
+        key = title_key(title)
+        if key is None:
+            return
+        for queue_site, queue in self.queues.items():
+            if queue_site != site:
+                rescored = queue.rescore(key, self.score)
+                with self._lock:
+                    self._rescored += rescored
+
+    def rescored_count(self) -> int:
+        with self._lock:
+            return self._rescored
@@ -0,0 +1,59 @@
+import json
+import os
+from threading import Lock
+
+from src.data_structures.review import Review
+
+
+class ReviewSink:
+    """
+    Destino das reviews coletadas, gravadas em JSON Lines à medida que saem das
+    páginas. Cada linha tem o filme (URL da página do site), o tipo da review
+    e os mesmos campos usados em movies.json. Assim os filmes só guardam uma
+    amostra das reviews e a memória não cresce com a paginação.
+    """
+
+    KINDS = {"usr": "usuário", "crit": "crítico"}
+
+    def __init__(self, path: str = "reviews.jsonl", flush_every: int = 200) -> None:
+        self.path = path
+        self.flush_every = flush_every
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = Lock()
+        self._pending = 0
+
+        # Métricas
+        self._written = {kind: 0 for kind in self.KINDS}
+
+    def write(self, movie_url: str, kind: str, review: Review) -> None:
+        line = json.dumps({
+            "filme": movie_url,
+            "tipo": self.KINDS[kind],
+            "avaliação (nota até 10)": review.get_rating(),
+            "texto": review.get_text(),
+            "data": review.get_date(),
+        }, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._written[kind] += 1
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
+
+    def print_metrics(self) -> None:
+        with self._lock:
+            written = dict(self._written)
+
+        print("\n========== MÉTRICAS DAS REVIEWS ==========")
+        print(f"Arquivo:                  {self.path}")
+        for kind, label in self.KINDS.items():
+            print(f"Reviews de {label + ':':15s} {written[kind]}")
+        print("==========================================\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
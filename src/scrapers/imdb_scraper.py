@@ -1,7 +1,5 @@
-import requests
 from bs4 import BeautifulSoup
 import json
-from urllib.parse import urlparse, urlunparse
 
 from src.scrapers.scraper import Scraper
 from src.data_structures.periodic_queue import PeriodicQueue
@@ -13,20 +11,40 @@ from src.data_structures.review import Review
 from src.data_structures.plataform import Plataform
 import re
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from src.network.driver_pool import WebDriverPool
+from src.network.http_client import HttpClient
+from src.parsing import ParseTarget, extract_script_json
+from src.scrapers import schemas
 import time
-from queue import Empty
-import pandas as pd
+from src.normalization import normalize_dates
 
 
 class IMDBScraper(Scraper):
 
-    def __init__(self, periodic_queue: PeriodicQueue, storage: Storage) -> None:
-        super().__init__(periodic_queue, storage)
+    # Links "Watch on <serviço>" renderizados depois do carregamento da página
+    WATCH_ON_XPATH = "//a[contains(@class, 'ipc-lockup-overlay') and contains(@class, 'ipc-focusable') and contains(@aria-label, 'Watch on')]"
+
+    SITE = URLType.IMDB
+
+    # Campos lidos direto da página principal (ver src/scrapers/schemas.py)
+    SCHEMA = schemas.IMDB
+
+    PAGE_TARGETS = {
+        "json-ld": (ParseTarget("script", {"type": "application/ld+json"}),),
+        "poster": (ParseTarget("div", {"class": "ipc-poster__poster-image"}),),
+        # o rótulo "Director(s)" e os nomes ficam no mesmo item dos créditos principais
+        "scrapDirector": (ParseTarget("li", {"data-testid": "title-pc-principal-credit"}),),
+        "cast": (ParseTarget("a", {"data-testid": "title-cast-item__actor"}),),
+        "new_movies": (ParseTarget("section", {"data-testid": "MoreLikeThis"}),),
+    }
+
+    def __init__(self, periodic_queue: PeriodicQueue, storage: Storage, driver_pool: WebDriverPool | None = None,
+                 http_client: HttpClient | None = None) -> None:
+        super().__init__(periodic_queue, storage, http_client)
+        self.driver_pool = driver_pool if driver_pool is not None else WebDriverPool(max_drivers=1)
+        # Tempo máximo esperando os links de streaming e folga depois do load sem eles
+        self.platforms_wait_timeout = 8
+        self.platforms_settle_time = 1.0
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -38,115 +56,6 @@ class IMDBScraper(Scraper):
         self.count = 0
         self.name = "IMDB"
 
-
-    def scrapJSONLD(self, site: BeautifulSoup, movie: Movie):
-        """
-        Scraps:
-        - Title
-        - Genre
-        - Release Date
-        - Synopsis
-        - Duration
-        - User average rating
-        - User rating count
-        """
-        url_str = movie.get_url()
-        try:
-            script_tag = site.find("script", type="application/ld+json")
-            if script_tag:
-
-                data = json.loads(script_tag.string)
-
-                # Extracting details from JSON-LD
-                try:
-                    title = (data.get("name")).strip()
-                    if not title:
-                        return 1
-                    movie.set_title(str(title))
-                except Exception:
-                    return 1
-                
-                try:
-                    genres = data.get("genre", [])
-                    if genres:
-                        movie.set_genres([g.strip() for g in genres])
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter os gêneros na URL {url_str}. Erro: {e}")
-
-                try:
-                    date = data.get("datePublished")
-                    if date:
-                        movie.set_release_date(date.strip())
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter data de lançamento na URL {url_str}. Erro: {e}")
-
-                try:
-                    synopsis = data.get("description")
-                    if synopsis:
-                        movie.set_synopsis(synopsis.strip())
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter sinopse na URL {url_str}. Erro: {e}")
-
-                try:
-                    duration = data.get("duration")
-                    if duration:
-                            pd_duration = pd.to_timedelta(duration)
-                            formatted = str(pd_duration).split()[-1]
-                            movie.set_length(formatted.strip())
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter duração do filme na URL {url_str}. Erro: {e}")
-
-                # Extracting content rating
-                try:
-                    contentrating = data.get("contentRating")
-                    if contentrating:
-                        movie.set_content_rating(contentrating.strip())
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter a classificação indicativa na URL {url_str}. Erro: {e}")
-
-                # Extracting user ratings
-                aggregate_rating = data.get("aggregateRating", {})
-                if aggregate_rating:
-                    try:
-                        ratingValue = aggregate_rating.get("ratingValue")
-                        if ratingValue:
-                            movie.set_usr_avr_rating(float(ratingValue))
-                    except Exception as e:
-                        self._errors += 1
-                        print(f"[ERROR] Falha ao obter nota média de reviews usuários na URL {url_str}. Erro: {e}")
-
-                    try:
-                        ratingCount = aggregate_rating.get("ratingCount")
-                        if ratingCount:
-                            movie.set_usr_rev_count(int(ratingCount))
-                    except Exception as e:
-                        self._errors += 1
-                        print(f"[ERROR] Falha ao obter quantidade de reviews de usuários na URL {url_str}. Erro: {e}")
-                
-                return 0
-            else:
-                return 1
-        except Exception as e:
-            print(f"[ERROR] Falha ao obter JSON-LD da URL {url_str}. Erro: {e}")
-            return 1
-
-    def scrapPoster(self, site: BeautifulSoup, movie: Movie):
-        try:
-            poster_div = site.find('div', class_='ipc-media ipc-media--poster-27x40 ipc-image-media-ratio--poster-27x40 ipc-media--media-radius ipc-media--baseAlt ipc-media--poster-l ipc-poster__poster-image ipc-media__img')
-        
-            if poster_div:
-                img_tag = poster_div.find('img')
-                if img_tag and 'src' in img_tag.attrs:
-                    movie.set_poster_link(img_tag['src'].strip())
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter link do poster na URL {movie.get_url()}. Erro: {e}")
-        
     def scrapDirector(self, site: BeautifulSoup, movie: Movie):
         try:
             # Encontra o bloco onde o rótulo é "Directors"
@@ -167,73 +76,100 @@ class IMDBScraper(Scraper):
             self._errors += 1
             print(f"[ERROR] Falha ao obter os diretores na URL {movie.get_url()}. Erro: {e}")
 
-    def scrapCast(self, site: BeautifulSoup, movie: Movie):
-        try:
-            # Extrai membros do cast
-            cast_tags = site.find_all("a", {"data-testid": "title-cast-item__actor"})
-            cast = [a.get_text(strip=True) for a in cast_tags if a.get_text(strip=True)]
-            if cast:
-                movie.set_cast(cast)
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter o elenco na URL {movie.get_url()}. Erro: {e}")
-
     def scrapUsrReviews(self, url: URL, movie: Movie):
         # Usr reviews
-        usr_review_url = url.get_url() + "reviews"
-        resp = requests.get(usr_review_url, headers=self.headers)
+        self.collect_reviews(movie, "usr", url.get_url(), self.iter_usr_reviews(url))
 
-        if not resp.ok:
-            print(f"Nao foi possivel obter o html de {usr_review_url}")
-            print(f"Conteudo retornado:")
-            print(resp.content)
-            return
-        
-        try:
-            reviews_site = BeautifulSoup(resp.text, "html.parser")
-            if reviews_site:
-                # encontra todos os containers de reviews
-                review_divs = reviews_site.find_all("article")
-                if not review_divs:
-                    # talvez a nova classe
-                    review_divs = reviews_site.find_all(
-                        "div", class_="lister-item mode-detail imdb-user-review"
-                    )
-                
-                if review_divs:
-                    for div in review_divs:
-                        try:
-                            rating = None
-                            # extrai a nota
-                            rating_span = div.find("span", class_="ipc-rating-star--rating")
-                            if rating_span:
-                                rating = float(rating_span.get_text(strip=True))
-
-                            # extrai o texto do review
-                            text_div = div.find("div", class_="ipc-html-content-inner-div")
-                            comment = text_div.get_text(strip=True) if text_div else None
-
-                            # data da review
-                            date_span = div.find("li", class_="ipc-inline-list__item review-date")
-                            date = date_span.get_text(strip=True) if date_span else None
-                            datetime = pd.to_datetime(date, format="%b %d, %Y") if date else None
-                            data_formatada = (datetime.strftime("%Y-%m-%d")).strip() if datetime else None
-                            usr_review = Review()
-                            usr_review.set_date(data_formatada)
-                            usr_review.set_rating(rating)
-                            usr_review.set_text(comment)
-                            movie.add_user_review(usr_review)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar uma review de usuário na URL {usr_review_url}. Erro: {e}")
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter ou processar reviews de usuários na URL {usr_review_url}. Erro: {e}")
+    def iter_usr_reviews(self, url: URL):
+        """Reviews de usuários, página a página, enquanto houver próxima."""
+        usr_review_url = url.get_url() + "reviews"
+        visited = set()
+        while usr_review_url and usr_review_url not in visited:
+            visited.add(usr_review_url)
+            try:
+                resp = self.fetch(usr_review_url)
+                if not resp.ok:
+                    print(f"Nao foi possivel obter o html de {usr_review_url}")
+                    print(f"Conteudo retornado:")
+                    print(resp.content)
+                    return
+                reviews_site = self.parse(resp.content)
+                reviews = self.parse_usr_reviews(reviews_site, usr_review_url)
+                next_url = self.next_usr_reviews_url(reviews_site, resp.content, url)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao obter ou processar reviews de usuários na URL {usr_review_url}. Erro: {e}")
+                return
+            # uma página sem nenhuma review aproveitável não encerra a paginação
+            yield from reviews
+            usr_review_url = next_url
+
+    def parse_usr_reviews(self, reviews_site, usr_review_url) -> list[Review]:
+        reviews = []
+        raw_dates = []
+        # encontra todos os containers de reviews
+        review_divs = reviews_site.find_all("article")
+        if not review_divs:
+            # talvez a nova classe
+            review_divs = reviews_site.find_all(
+                "div", class_="lister-item mode-detail imdb-user-review"
+            )
+
+        for div in review_divs:
+            try:
+                rating = None
+                # extrai a nota
+                rating_span = div.find("span", class_="ipc-rating-star--rating")
+                if rating_span:
+                    rating = float(rating_span.get_text(strip=True))
+
+                # extrai o texto do review
+                text_div = div.find("div", class_="ipc-html-content-inner-div")
+                comment = text_div.get_text(strip=True) if text_div else None
+
+                # data da review, normalizada junto com as demais da página
+                date_span = div.find("li", class_="ipc-inline-list__item review-date")
+                raw_dates.append(date_span.get_text(strip=True) if date_span else None)
+                usr_review = Review()
+                usr_review.set_rating(rating)
+                usr_review.set_text(comment)
+                reviews.append(usr_review)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar uma review de usuário na URL {usr_review_url}. Erro: {e}")
+
+        for review, date in zip(reviews, normalize_dates(raw_dates, ("%b %d, %Y",))):
+            review.set_date(date)
+        return reviews
+
+    def next_usr_reviews_url(self, reviews_site, body: bytes, url: URL) -> str | None:
+        """URL da próxima página de reviews, ou None na última."""
+        # página antiga: a chave do "Load More" fica num div escondido
+        load_more = reviews_site.find("div", class_="load-more-data")
+        if load_more is not None and load_more.get("data-key"):
+            return f"{url.get_url()}reviews/_ajax?paginationKey={load_more['data-key']}"
+        # página nova: o cursor da próxima página vem no payload do Next.js
+        data = extract_script_json(body, "id", "__NEXT_DATA__")
+        page_info = self.get_reviews_page_info(data) if data else None
+        if page_info and page_info.get("hasNextPage") and page_info.get("endCursor"):
+            return f"{url.get_url()}reviews/?paginationKey={page_info['endCursor']}"
+        return None
+
+    def get_reviews_page_info(self, data: dict) -> dict:
+        return (
+            data.get('props', {})
+                .get('pageProps', {})
+                .get('contentData', {})
+                .get('data', {})
+                .get('title', {})
+                .get('reviews', {})
+                .get('pageInfo', {})
+        )
 
     def scrapCritReviews(self, url: URL, movie: Movie):
         # Crit reviews
         crit_review_url = url.get_url() + "criticreviews"
-        resp = requests.get(crit_review_url, headers=self.headers)
+        resp = self.fetch(crit_review_url)
 
         if not resp.ok:
             print(f"Nao foi possivel obter o html de {crit_review_url}")
@@ -241,7 +177,22 @@ class IMDBScraper(Scraper):
             print(resp.content)
             return
         try:
-            reviews_site = BeautifulSoup(resp.text, "html.parser")
+            # caminho rápido: payload do Next.js lido direto dos bytes, sem montar a árvore
+            metacritic = self.embedded_json("reviews de críticos", resp.content, "type", "application/json",
+                                            self.get_metacritic)
+            # {} é um filme sem bloco do Metacritic: o DOM não teria nada a mais
+            if metacritic is not None:
+                try:
+                    score = (metacritic.get('metascore') or {}).get('score')
+                    if score:
+                        movie.set_crit_avr_rating(int(score)/10)
+                except Exception as e:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao obter nota média de reviews de crítico na URL {crit_review_url}. Erro: {e}")
+                self.scrapMetacritic(metacritic, movie, crit_review_url)
+                return
+
+            reviews_site = self.parse(resp.text)
             if reviews_site:
 
                 try:
@@ -258,119 +209,120 @@ class IMDBScraper(Scraper):
                 if script_tag:
                     data = json.loads(script_tag.string)
                     if data:
-                        try:
-                            metacritic = (
-                                data.get('props', {})
-                                    .get('pageProps', {})
-                                    .get('contentData', {})
-                                    .get('data', {})
-                                    .get('title', {})
-                                    .get('metacritic', {})
-                            )
-                            reviewCount = metacritic.get('metascore', {}).get('reviewCount') if metacritic else None
-                            if reviewCount:
-                                int_review_count = int(reviewCount)
-                                movie.set_crit_rev_count(int_review_count)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao obter quantidade de reviews de crítico na URL {crit_review_url}. Erro: {e}")
-                        
-                        try:
-                            metacritic = (
-                                data.get('props', {})
-                                    .get('pageProps', {})
-                                    .get('contentData', {})
-                                    .get('data', {})
-                                    .get('title', {})
-                                    .get('metacritic', {})
-                            )
-                            reviews = metacritic.get('reviews', {}).get('edges') if metacritic else None
-                            if reviews:
-                                for reviewContainer in reviews:
-                                    try:
-                                        review = reviewContainer.get("node")
-                                        if review:
-                                            # nota do crítico (pode estar em um span, strong ou outro elemento)
-                                            rating = review["score"]
-                                            rating_formatted = int(rating)/10 if rating else None
-                                            text = (review["quote"]["value"]).strip() if review["quote"]["value"] else None
-                                            if text or rating_formatted:
-                                                rev = Review()
-                                                rev.set_rating(rating_formatted)
-                                                rev.set_text(text)
-                                                movie.add_critic_review(rev)
-                                    except Exception as e:
-                                        self._errors += 1
-                                        print(f"[ERROR] Falha ao obter uma review de crítico na URL {crit_review_url}. Erro: {e}")
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao obter reviews de crítico na URL {crit_review_url}. Erro: {e}")
+                        self.scrapMetacritic(self.get_metacritic(data), movie, crit_review_url)
         except Exception as e:
             self._errors += 1
             print(f"[ERROR] Falha ao obter ou processar reviews de críticos na URL {crit_review_url}. Erro: {e}")
-           
 
-    def scrapNewMovies(self, site: BeautifulSoup, url_str: str):
+    def get_metacritic(self, data: dict) -> dict:
+        """Bloco do Metacritic dentro do payload do Next.js da página de críticas."""
+        return (
+            data.get('props', {})
+                .get('pageProps', {})
+                .get('contentData', {})
+                .get('data', {})
+                .get('title', {})
+                .get('metacritic')
+        ) or {}
+
+    def scrapMetacritic(self, metacritic: dict, movie: Movie, crit_review_url: str):
         try:
-            section = site.find("section", {"data-testid": "MoreLikeThis"})
-            if section:
-                movies = section.find_all(
-                    "div",
-                    class_="ipc-poster-card ipc-poster-card--base ipc-poster-card--media-radius ipc-poster-card--dynamic-width ipc-sub-grid-item ipc-sub-grid-item--span-2",
-                )
-                if movies:
-                    for new_movie in movies:
-                        a_tag = new_movie.find("a", class_="ipc-poster-card__title ipc-poster-card__title--clamp-2 ipc-poster-card__title--clickable")
-                        new_url = "https://www.imdb.com" + a_tag["href"]
-                        parsed_url = urlparse(new_url)
-                        clean_url = urlunparse(parsed_url._replace(query=""))
-                        self._new_urls_count += 1
-                        self.periodic_queue.put(URL(clean_url, URLType.IMDB))
+            reviewCount = metacritic.get('metascore', {}).get('reviewCount') if metacritic else None
+            if reviewCount:
+                int_review_count = int(reviewCount)
+                movie.set_crit_rev_count(int_review_count)
         except Exception as e:
             self._errors += 1
-            print(f"[ERROR] Falha ao processar seção 'more like this' em {url_str}. Erro: {e}")
-    
-    def scrapStreamingPlataforms(self, url:URL, movie: Movie):
-        options = Options()
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) "
-                  "Chrome/120.0.0.0 Safari/537.36")
-        options.add_argument("--lang=en-US")
-        options.add_argument("--headless")  # roda sem abrir janela
+            print(f"[ERROR] Falha ao obter quantidade de reviews de crítico na URL {crit_review_url}. Erro: {e}")
+        
+        self.collect_reviews(movie, "crit", movie.get_url()[0], self.iter_metacritic_reviews(metacritic, crit_review_url))
 
-        plataform_names = []
+    def iter_metacritic_reviews(self, metacritic: dict, crit_review_url: str):
         try:
-            service = Service()
-            service.startup_timeout = 20
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(30) 
-            try:
-                driver.get(url.get_url())
-                time.sleep(2)  # espera carregar o conteúdo dinâmico
-                # encontra todos os <a> com essa classe
-                stream_links = driver.find_elements(
-                    By.XPATH,
-                    "//a[contains(@class, 'ipc-lockup-overlay') and contains(@class, 'ipc-focusable') and contains(@aria-label, 'Watch on')]"
-                )
-
-                for link in stream_links:
-                    label = link.get_attribute("aria-label") # geralmente diz "Watch on <servico>"
-                    href = link.get_attribute("href")  # URL do streaming
-                    
+            reviews = metacritic.get('reviews', {}).get('edges') if metacritic else None
+            if reviews:
+                for reviewContainer in reviews:
                     try:
-                        name = label[label.find("on") + 3:]
-                        if name and name not in plataform_names:
-                            plat = Plataform(plataform=name, link=href)
-                            movie.add_platform(plat)
-                            plataform_names.append(name)
+                        review = reviewContainer.get("node")
+                        if review:
+                            # nota do crítico (pode estar em um span, strong ou outro elemento)
+                            rating = review["score"]
+                            rating_formatted = int(rating)/10 if rating else None
+                            text = (review["quote"]["value"]).strip() if review["quote"]["value"] else None
+                            if text or rating_formatted:
+                                rev = Review()
+                                rev.set_rating(rating_formatted)
+                                rev.set_text(text)
+                                yield rev
                     except Exception as e:
                         self._errors += 1
-                        print(f"[ERROR] Falha ao processar uma plataforma de streaming da URL {url.get_url()}. Erro: {e}")
-            except Exception as e:
-                self._errors += 1
-                print(f"[ERROR] Falha ao coletar plataformas de streaming da URL {url.get_url()}. Erro: {e}")
-            finally:   
-                driver.quit()
+                        print(f"[ERROR] Falha ao obter uma review de crítico na URL {crit_review_url}. Erro: {e}")
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao obter reviews de crítico na URL {crit_review_url}. Erro: {e}")
+
+    @override
+    def sub_resources(self, url: URL) -> list[str]:
+        return [url.get_url() + "reviews", url.get_url() + "criticreviews"]
+
+    def _stream_links_ready(self):
+        # Retorna os links assim que aparecem, ou True se a página terminou de
+        # carregar e ficou `platforms_settle_time` segundos sem eles.
+        from selenium.webdriver.common.by import By
+
+        complete_since = [None]
+
+        def condition(driver):
+            links = driver.find_elements(By.XPATH, self.WATCH_ON_XPATH)
+            if links:
+                return links
+            if driver.execute_script("return document.readyState") == "complete":
+                if complete_since[0] is None:
+                    complete_since[0] = time.monotonic()
+                elif time.monotonic() - complete_since[0] >= self.platforms_settle_time:
+                    return True
+            return False
+
+        return condition
+
+    def scrapStreamingPlataforms(self, url:URL, movie: Movie):
+        # o Selenium só é carregado por quem usa o driver (ver driver_pool.py)
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
+        plataform_names = []
+        try:
+            t0 = time.time()
+            with self.driver_pool.borrow() as driver:
+                self.end_phase("Espera do pool de drivers", t0)
+                try:
+                    self.throttle(url.get_url())
+                    self.driver_pool.navigate(driver, url.get_url())
+                    try:
+                        found = WebDriverWait(driver, self.platforms_wait_timeout, poll_frequency=0.2).until(
+                            self._stream_links_ready()
+                        )
+                        stream_links = found if found is not True else []
+                    except TimeoutException:
+                        stream_links = []  # título sem opções de streaming
+                    self.driver_pool.snapshot(driver, url.get_url())
+
+                    for link in stream_links:
+                        label = link.get_attribute("aria-label") # geralmente diz "Watch on <servico>"
+                        href = link.get_attribute("href")  # URL do streaming
+                        
+                        try:
+                            name = label[label.find("on") + 3:]
+                            if name and name not in plataform_names:
+                                plat = Plataform(plataform=name, link=href)
+                                movie.add_platform(plat)
+                                plataform_names.append(name)
+                        except Exception as e:
+                            self._errors += 1
+                            print(f"[ERROR] Falha ao processar uma plataforma de streaming da URL {url.get_url()}. Erro: {e}")
+                except Exception as e:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao coletar plataformas de streaming da URL {url.get_url()}. Erro: {e}")
         except TimeoutException as e:
             self._errors += 1
             print(f"[TIMEOUT] ChromeDriver excedeu o tempo limite ao inicializar. URL: {url.get_url()}. Erro: {e}")
@@ -379,17 +331,32 @@ class IMDBScraper(Scraper):
             print(f"[ERROR] Falha ao coletar plataformas de streaming da URL {url.get_url()}. Erro: {e}")
 
     @override
-    def scrap(self):
-        try:
-            url = self.periodic_queue.get(timeout=5)
-        except Empty:
-            return  1
-        
-        if url.get_type() == URLType.END:
-            return 1
+    def extract_page(self, url_str: str, body: bytes):
+        site = self.parse(body, self.page_filter)
+        if not site:
+            return None
+        print(f"[INFO] Iniciando web scraping da URL: {url_str}")
+        movie = Movie()
+        movie.set_url(url=url_str)
 
         t0 = time.time()
-        response = requests.get(url.get_url(), headers=self.headers)
+        fields = self.extract_fields(self.SCHEMA, site, movie, url_str)
+        if fields is None:
+            self._errors += 1
+            print(f"[ERROR] Nenhum título foi encontrado na URL: {url_str}. O scraping desta página será interrompido.")
+            self.end_phase("Campos da página", t0)
+            return None
+        self.end_phase("Campos da página", t0)
+
+        t0 = time.time()
+        self.scrapDirector(site, movie)
+        self.end_phase("Diretores", t0)
+        return movie, fields
+
+    @override
+    def scrap_movie(self, url: URL) -> int:
+        t0 = time.time()
+        response = self.fetch(url.get_url())
         self.end_phase("Request", t0)
 
         if not response.ok:
@@ -399,32 +366,12 @@ class IMDBScraper(Scraper):
             self._errors += 1
             return 1
 
-        site = BeautifulSoup(response.content, "html.parser")
-        if site:
-            print(f"[INFO] Iniciando web scraping da URL: {url.get_url()}")
-            movie = Movie()
-            movie.set_url(url=url.get_url())
-            
+        page = self.extract_main_page(url.get_url(), response.content)
+        if page is not None:
+            movie, fields = page
 
-            t0 = time.time()
-            if self.scrapJSONLD(site, movie) == 1:
-                self._errors += 1
-                print(f"[ERROR] Nenhum título foi encontrado na URL: {url.get_url()}. O scraping desta página será interrompido.")
-                self.end_phase("JsonLd", t0)
-                return 1
-            self.end_phase("JsonLd", t0)
-            
-            t0 = time.time()
-            self.scrapPoster(site, movie)
-            self.end_phase("Poster", t0)
-
-            t0 = time.time()
-            self.scrapDirector(site, movie)
-            self.end_phase("Diretores", t0)
-
-            t0 = time.time()
-            self.scrapCast(site, movie)
-            self.end_phase("Cast", t0)
+            # o Selenium é a etapa mais lenta; roda enquanto o resto é coletado
+            platforms = self.submit_phase("Plataformas", self.scrapStreamingPlataforms, url, movie)
 
             t0 = time.time()
             self.scrapUsrReviews(url, movie)
@@ -435,12 +382,10 @@ class IMDBScraper(Scraper):
             self.end_phase("Reviews de críticos", t0)
 
             t0 = time.time()
-            self.scrapNewMovies(site, url.get_url())
+            self.enqueue_new_movies(fields["new_movies"], URLType.IMDB, url, movie)
             self.end_phase("Novos filmes", t0)
 
-            t0 = time.time()
-            self.scrapStreamingPlataforms(url, movie)
-            self.end_phase("Plataformas", t0)
+            platforms.result()
 
             t0 = time.time()
             self.storage.store_movie(movie, URLType.IMDB)
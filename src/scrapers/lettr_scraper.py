@@ -5,21 +5,51 @@ from src.data_structures.url import URL, URLType
 from src.data_structures.plataform import Plataform
 from typing import override
 from src.storage import Storage
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
-import requests
-from datetime import datetime
+from src.network.browser_pool import BrowserPool
+from src.network.http_client import HttpClient
+from src.network.request_policy import RequestPolicy
+from src.parsing import ParseTarget
+from src.normalization import normalize_dates
+from src.scrapers import schemas
 import re
-import json
 import time
-from dateutil.parser import parse
-from queue import Empty
+import asyncio
+from urllib.parse import urlsplit
 
 
 class LettrScraper(Scraper):
 
-    def __init__(self, periodic_queue, storage: Storage):
-        super().__init__(periodic_queue, storage)
+    # Hosts que as páginas precisam: o próprio site e os scripts em s.ltrbxd.com
+    ALLOWED_HOSTS = ("letterboxd.com", "ltrbxd.com")
+
+    SITE = URLType.LTTR
+
+    # Campos lidos direto da página principal (ver src/scrapers/schemas.py)
+    SCHEMA = schemas.LETTERBOXD
+
+    PAGE_TARGETS = {
+        "details": (ParseTarget("div", {"class": "details"}),),
+        "json-ld": (ParseTarget("script", {"type": "application/ld+json"}),),
+        "synopsis": (ParseTarget("section", {"class": "production-synopsis"}),),
+        # elenco, datas de lançamento e gêneros ficam nas abas
+        "tabbed-content": (ParseTarget("div", {"id": "tabbed-content"}),),
+        "length": (ParseTarget("p", {"class": "text-footer"}),),
+        "reviews_url": (ParseTarget("section", {"class": "js-popular-reviews"}),),
+    }
+
+    # A página do filme carrega nota, plataformas e similares depois, por
+    # JavaScript; esses fragmentos HTML servem o mesmo conteúdo sem navegador
+    FRAGMENTS = {
+        "ratings": "https://letterboxd.com/csi/film/{slug}/rating-histogram/",
+        "services": "https://letterboxd.com/csi/film/{slug}/availability/",
+        "similar": "https://letterboxd.com/film/{slug}/similar/",
+    }
+
+    def __init__(self, periodic_queue, storage: Storage, browser_pool: BrowserPool | None = None,
+                 http_client: HttpClient | None = None, request_policy: RequestPolicy | None = None):
+        super().__init__(periodic_queue, storage, http_client)
+        self.browser_pool = browser_pool if browser_pool is not None else BrowserPool()
+        self.request_policy = request_policy if request_policy is not None else RequestPolicy(self.ALLOWED_HOSTS)
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -32,18 +62,128 @@ class LettrScraper(Scraper):
         self.name = "Letterboxd"
 
     @override
-    def scrap(self):
-        try:
-            url = self.periodic_queue.get(timeout=5)
-        except Empty:
-            return  1
+    def scrap_movie(self, url: URL) -> int:
+        movie = self.scrap_static(url)
+        if movie is None:
+            return 1
+        # o navegador só sobe se algum fragmento falhar
+        if not self.scrapFragments(url, movie):
+            self.scrapDynamicData(url, movie)
+        return self.finish_movie(url, movie)
 
-        if url.get_type() == URLType.END:
+    @override
+    async def scrap_movie_async(self, url: URL, context) -> int:
+        movie = await asyncio.to_thread(self.scrap_static, url)
+        if movie is None:
             return 1
+        if not await asyncio.to_thread(self.scrapFragments, url, movie):
+            await self.scrapDynamicDataAsync(context, url, movie)
+        return self.finish_movie(url, movie)
 
+    @override
+    def sub_resources(self, url: URL) -> list[str]:
+        # os fragmentos começam a ser buscados junto com a página principal
+        fragments = self.fragment_urls(url.get_url())
+        return list(fragments.values()) if fragments else []
+
+    def fragment_urls(self, url_str: str) -> dict[str, str] | None:
+        parts = urlsplit(url_str).path.strip("/").split("/")
+        if len(parts) < 2 or parts[0] != "film":
+            return None
+        return {name: template.format(slug=parts[1]) for name, template in self.FRAGMENTS.items()}
+
+    def scrapFragments(self, url: URL, movie: Movie) -> bool:
+        """
+        Nota média, filmes similares e plataformas pelos fragmentos HTML, sem
+        navegador. Só altera o filme se os três fragmentos vierem; retorna False
+        para o chamador cair no Playwright.
+        """
+        url_str = url.get_url()
+        fragments = self.fragment_urls(url_str)
+        if fragments is None:
+            self.record_fast_path("fragmentos", False)
+            return False
+
+        try:
+            t0 = time.time()
+            ratings = self.fetch(fragments["ratings"])
+            stats = None
+            if ratings.ok:
+                stats = self.parse_ratings_fragment(self.parse(ratings.content), url_str)
+            self.end_phase("Nota média e quantidade de reviews de usuários", t0)
+
+            t0 = time.time()
+            similar = self.fetch(fragments["similar"])
+            links = self.parse_similar_fragment(self.parse(similar.content)) if similar.ok else None
+            self.end_phase("Novos filmes", t0)
+
+            t0 = time.time()
+            services = self.fetch(fragments["services"])
+            plataforms = self.parse_services_fragment(self.parse(services.content), url_str) if services.ok else None
+            self.end_phase("Plataformas", t0)
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao buscar os fragmentos de {url_str}. Erro: {e}")
+            self.record_fast_path("fragmentos", False)
+            return False
+
+        if stats is None or links is None or plataforms is None:
+            self.record_fast_path("fragmentos", False)
+            return False
+
+        movie.set_usr_avr_rating(stats[0])
+        movie.set_usr_rev_count(stats[1])
+        self.enqueue_new_movies(links, URLType.LTTR, url, movie)
+        movie.set_platforms(plataforms)
+        self.record_fast_path("fragmentos", True)
+        return True
+
+    def parse_ratings_fragment(self, site, url_str):
+        """(nota até 10, quantidade), ou None se o fragmento não tem o histograma."""
+        section = site.find("section", class_="ratings-histogram-chart")
+        if section is None:
+            return None
+        link = section.select_one("span.average-rating a")
+        if link is None:
+            return None, None  # filme ainda sem notas suficientes
+        # o tooltip só vira data-original-title depois do JavaScript da página
+        tooltip = link.get("data-original-title") or link.get("title")
+        return self.parse_rating_tooltip(tooltip, url_str)
+
+    def parse_similar_fragment(self, site):
+        links = []
+        for poster in site.select("ul.poster-list [data-item-link], ul.poster-list [data-target-link]"):
+            link = poster.get("data-item-link") or poster.get("data-target-link")
+            if link and link.startswith("/film/"):
+                full_link = "https://letterboxd.com" + link
+                if full_link not in links:
+                    links.append(full_link)
+        return links
+
+    def parse_services_fragment(self, site, url_str):
+        plataform_names = []
+        plataforms = []
+        for service in site.select("p.service"):
+            try:
+                name_tag = service.select_one(".label .name")
+                link_tag = service.select_one("a.label")
+                if name_tag is None or link_tag is None or not link_tag.get("href"):
+                    continue
+                platform_name = self.normalize_platform_name(name_tag.get_text())
+                platform_link = link_tag["href"].strip()
+                if platform_name and platform_link and platform_name not in plataform_names:
+                    plataforms.append(Plataform(platform_name, platform_link))
+                    plataform_names.append(platform_name)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar uma plataforma de streaming em {url_str}. Erro: {e}")
+        return plataforms
+
+    def scrap_static(self, url: URL) -> Movie | None:
+        """Etapas que usam só HTTP. Retorna None se a página não serve."""
         url_str = url.get_url()
         t0 = time.time()
-        response = requests.get(url_str, headers=self.headers)
+        response = self.fetch(url_str)
         self.end_phase("Request", t0)
 
         if not response.ok:
@@ -51,173 +191,125 @@ class LettrScraper(Scraper):
             print(f"Conteudo retornado:")
             print(response.content)
             self._errors += 1
-            return 1
+            return None
 
-        site = BeautifulSoup(response.content, "html.parser")
+        page = self.extract_main_page(url_str, response.content)
+        if page is None:
+            return None
+        movie, fields = page
 
-        if site:
-            print(f"[INFO] Iniciando web scraping da URL: {url_str}")
-            movie = Movie()
-            movie.set_url(url=url_str)
-
-            t0 = time.time()
-            title, directors = self.get_details(site, url_str)
-            if not title:
-                self._errors += 1
-                print(f"[ERROR] Nenhum título foi encontrado na URL: {url_str}. O scraping desta página será interrompido.")
-                self.end_phase("Título e diretores", t0)
-                return 1
-            movie.set_title(title)
-            movie.set_directors(directors)
-            self.end_phase("Título e diretores", t0)
+        t0 = time.time()
+        if fields["reviews_url"]:
+            self.collect_reviews(movie, "usr", url_str, self.iter_reviews(fields["reviews_url"]))
+        self.end_phase("Reviews de usuários", t0)
+        return movie
 
-            t0 = time.time()
-            poster = self.get_poster(site, url_str)
-            movie.set_poster_link(poster)
-            self.end_phase("Poster", t0)
-            
-            t0 = time.time()
-            synopsis = self.get_synopsis(site, url_str)
-            movie.set_synopsis(synopsis)
-            self.end_phase("Sinopse", t0)
+    @override
+    def extract_page(self, url_str: str, body: bytes):
+        site = self.parse(body, self.page_filter)
+        if not site:
+            return None
+        print(f"[INFO] Iniciando web scraping da URL: {url_str}")
+        movie = Movie()
+        movie.set_url(url=url_str)
 
-            section = site.find("div", {"id": "tabbed-content"})
-            if section:
-                t0 = time.time()
-                movie.set_cast(self.get_cast(section, url_str))
-                self.end_phase("Cast", t0)
-                
-                t0 = time.time()
-                movie.set_release_date(self.get_release_date(section, url_str))
-                self.end_phase("Data de lançamento", t0)
-                
-                t0 = time.time()
-                movie.set_genres(self.get_genres(section, url_str))
-                self.end_phase("Generos", t0)
+        t0 = time.time()
+        fields = self.extract_fields(self.SCHEMA, site, movie, url_str)
+        if fields is None:
+            self._errors += 1
+            print(f"[ERROR] Nenhum título foi encontrado na URL: {url_str}. O scraping desta página será interrompido.")
+            self.end_phase("Campos da página", t0)
+            return None
+        self.end_phase("Campos da página", t0)
 
+        section = site.find("div", {"id": "tabbed-content"})
+        if section:
             t0 = time.time()
-            movie.set_length(self.get_length(site, url_str))
-            self.end_phase("Duração", t0)
+            movie.set_release_date(self.get_release_date(section, url_str))
+            self.end_phase("Data de lançamento", t0)
+        return movie, fields
 
+    def scrapDynamicData(self, url: URL, movie: Movie):
+        url_str = url.get_url()
+        try:
             t0 = time.time()
-            self.scrap_reviews(site, movie)
-            self.end_phase("Reviews de usuários", t0)
+            with self.browser_pool.lease_page(self.headers, self.request_policy) as page:
+                self.end_phase("Espera do pool de navegadores", t0)
 
-            try:
-                with sync_playwright() as p:
+                try:
+                    self.load_page(page, url_str)
+
+                    t0 = time.time()
+                    avr, count = self.get_ratings_stats(page, url_str)
+                    movie.set_usr_avr_rating(avr)
+                    movie.set_usr_rev_count(count) 
+                    self.end_phase("Nota média e quantidade de reviews de usuários", t0)   
+
+                    t0 = time.time()
+                    links = self.get_similar_movies(page, url_str)            
+                    self.enqueue_new_movies(links, URLType.LTTR, url, movie)
+                    self.end_phase("Novos filmes", t0)
+                    
+                    t0 = time.time()
+                    movie.set_platforms(self.get_plataforms(page, url_str))
+                    self.end_phase("Plataformas", t0)
+                    
+                except Exception as e:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao processar URL {url_str} no Playright. Erro: {e}")
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao iniciar Playright ou navegador para URL {url_str}. Erro: {e}")
 
-                    browser = p.chromium.launch(headless=True)
-                    context = browser.new_context(extra_http_headers=self.headers)
-                    page = context.new_page()
+    async def scrapDynamicDataAsync(self, context, url: URL, movie: Movie):
+        url_str = url.get_url()
+        page = None
+        try:
+            page = await context.new_page()
+            await self.goto_async(page, url_str)
 
-                    try:
-                        page.goto(url.get_url(), wait_until="domcontentloaded")
-
-                        t0 = time.time()
-                        avr, count = self.get_ratings_stats(page, url_str)
-                        movie.set_usr_avr_rating(avr)
-                        movie.set_usr_rev_count(count) 
-                        self.end_phase("Nota média e quantidade de reviews de usuários", t0)   
-
-                        t0 = time.time()
-                        links = self.get_similar_movies(page, url_str)            
-                        for link in links:
-                            self.periodic_queue.put(URL(link, URLType.LTTR))
-                            self._new_urls_count += 1
-                        self.end_phase("Novos filmes", t0)
-                        
-                        t0 = time.time()
-                        movie.set_platforms(self.get_plataforms(page, url_str))
-                        self.end_phase("Plataformas", t0)
-                        
-                    except Exception as e:
-                        self._errors += 1
-                        print(f"[ERROR] Falha ao processar URL {url_str} no Playright. Erro: {e}")
-                    finally:
-                        browser.close()
-            except Exception as e:
-                self._errors += 1
-                print(f"[ERROR] Falha ao iniciar Playright ou navegador para URL {url_str}. Erro: {e}")
-                            
             t0 = time.time()
-            self.storage.store_movie(movie, URLType.LTTR)
-            self.end_phase("Armazenamento", t0)
-            
-            self.count += 1
-            print(f"[INFO] Concluída a coleta de dados da URL: {url_str}. Quantidade de filmes coletados do Letterboxd: {self.count}")
-            return 0
-        else:
-            return 1
+            avr, count = await self.get_ratings_stats_async(page, url_str)
+            movie.set_usr_avr_rating(avr)
+            movie.set_usr_rev_count(count)
+            self.end_phase("Nota média e quantidade de reviews de usuários", t0)
 
-    def get_details(self, site, url_str):
-        title = None
-        director_names = []
-        details = site.find("div", {"class": "details"})
-        if details:
-            try:
-                title = details.find("span", {"class": "name js-widont prettify"}).text
-            except Exception:
-                return title, director_names
-            try:
-                directors = details.find_all("a", class_="contributor")
-                if directors:
-                    director_names = [a.text.strip() for a in directors]
-            except Exception as e:
-                self._errors += 1
-                print(f"[ERROR] Falha ao obter os diretores na URL {url_str}. Erro: {e}")
-        return title, director_names
-    
-    def get_poster(self, site, url_str):
-        link = None
-        try:
-            script_tag = site.find("script", type="application/ld+json")
-            if script_tag and script_tag.string:
-
-                raw = script_tag.string.strip()
-                if raw:
-                    # Remove comentários CDATA
-                    without_cdata = raw.replace("/* <![CDATA[ */", "").replace("/* ]]> */", "").strip()
-                    if without_cdata:
-                        data = json.loads(without_cdata)
-                        if data:
-                            img = data.get("image")
-                            if img:
-                                link = img.strip()
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter o link do poster na URL {url_str}. Erro: {e}")
-        return link
+            t0 = time.time()
+            links = await self.get_similar_movies_async(page, url_str)
+            self.enqueue_new_movies(links, URLType.LTTR, url, movie)
+            self.end_phase("Novos filmes", t0)
 
-    def get_synopsis(self, site, url_str):
-        synopsis = None
-        try:
-            synopsis_section = site.find("section", {"class": "production-synopsis"})
-            if synopsis_section:
-                synopsis_p = synopsis_section.find("p")
-                if synopsis_p:
-                    synopsis_text = synopsis_p.text
-                    if synopsis_text:
-                        synopsis = synopsis_text.strip()
+            t0 = time.time()
+            movie.set_platforms(await self.get_plataforms_async(page, url_str))
+            self.end_phase("Plataformas", t0)
         except Exception as e:
             self._errors += 1
-            print(f"[ERROR] Falha ao obter a sinopse na URL {url_str}. Erro: {e}")
-        return synopsis
+            print(f"[ERROR] Falha ao processar URL {url_str} no Playright. Erro: {e}")
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
-    def get_cast(self, site, url_str):
-        cast = []
-        try:
-            details = site.find("div", {"class": "cast-list text-sluglist"})
-            if details:
-                cast_tags = details.find_all("a", class_="text-slug tooltip")
-                if cast_tags:
-                    cast = [a.text.strip() for a in cast_tags]
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter a sinopse na URL {url_str}. Erro: {e}")
-        return cast
+    def finish_movie(self, url: URL, movie: Movie) -> int:
+        url_str = url.get_url()
+        t0 = time.time()
+        self.storage.store_movie(movie, URLType.LTTR)
+        self.end_phase("Armazenamento", t0)
+        
+        self.count += 1
+        print(f"[INFO] Concluída a coleta de dados da URL: {url_str}. Quantidade de filmes coletados do Letterboxd: {self.count}")
+        return 0
+
+    @override
+    def close(self) -> None:
+        super().close()
+        self.browser_pool.close_thread()
 
     def get_release_date(self, site, url_str):
         release_date_final = None
+        raw_dates = []
         try:
             div_dates = site.find("section", {"class": "release-table-group"})
             if div_dates:
@@ -228,57 +320,21 @@ class LettrScraper(Scraper):
                         if country_names:
                             country_names_list = [a.text.strip() for a in country_names]
                             if "Brazil" in country_names_list:
-                                release_date = list_item.find("h5").text
-                                try:
-                                    release_date_format = datetime.strptime(release_date, "%d %b %Y").strftime("%Y-%m-%d")
-                                    
-                                    if not release_date_final:
-                                        release_date_final = release_date_format
-                                    else:
-                                        if release_date_format < release_date_final:
-                                            release_date_final = release_date_format
-                                except Exception as e:
-                                    self._errors += 1
-                                    print(f"[ERROR] Falha ao processar data de lançamento na URL {url_str}. Erro: {e}")
+                                raw_dates.append(list_item.find("h5").text)
         except Exception as e:
             self._errors += 1
             print(f"[ERROR] Falha ao obter data de lançamento na URL {url_str}. Erro: {e}")
-        return release_date_final
-                           
-                
 
-    def get_genres(self, site, url_str):
-        genres = []
-        try:
-            genre_div = site.find("div", class_="text-sluglist capitalize")
-            if genre_div:
-                genre_tags = genre_div.find_all("a")
-                if genre_tags:
-                    genres = [
-                        "Sci-Fi" if a.text.strip().lower() == "science fiction" else a.text.strip()
-                        for a in genre_tags
-                    ] # troca para sci-fi para deixar igual aos outros sites
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter generos na URL {url_str}. Erro: {e}")
-        return genres
+        # as datas do Brasil são normalizadas juntas e fica a mais antiga
+        dates = normalize_dates(raw_dates, ("%d %b %Y",))
+        for raw, date in zip(raw_dates, dates):
+            if date is None:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar data de lançamento na URL {url_str}. Data: {raw}")
+            elif not release_date_final or date < release_date_final:
+                release_date_final = date
+        return release_date_final
 
-    def get_length(self, site, url_str):
-        lenght_format = None
-        try:
-            footer_text = site.find("p", {"class": "text-link text-footer"}).text
-            if footer_text:
-                footer_parts = footer_text.split()
-                lenght = footer_parts[0] + " " + footer_parts[1]
-                lenght = int(footer_parts[0])
-                hour = lenght // 60
-                mins = lenght % 60
-                lenght_format = f"{hour:02d}:{mins:02d}:00"
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter duração na URL {url_str}. Erro: {e}")
-        return lenght_format
-    
     # Dinamico
     def get_similar_movies(self, page, url_str):
         links = []
@@ -298,6 +354,25 @@ class LettrScraper(Scraper):
             print(f"[ERROR] Falha ao obter filmes similares na URL {url_str}. Erro: {e}")
         return links
 
+    def parse_rating_tooltip(self, avg_rating, url_str):
+        # "Weighted average of 4.21 based on 1,234 ratings" -> (nota até 10, quantidade)
+        num_average_format = None
+        num_ratings = None
+        if avg_rating:
+            numbers = re.findall(r"[\d,]+\.\d+|[\d,]+", avg_rating)
+            try:
+                num_ratings = int(numbers[1].replace(",", ""))
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar quantidade de reviews de usuários em {url_str}. Erro: {e}")
+            try:
+                num_average = float(numbers[0])
+                num_average_format = (num_average * 10)/5
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar a nota média de usuários em {url_str}. Erro: {e}")
+        return num_average_format, num_ratings
+
     # --> Dinâmico
     def get_ratings_stats(self, page, url_str):
         num_average_format = None
@@ -309,20 +384,7 @@ class LettrScraper(Scraper):
                 try:
                     avg_rating_sec.wait_for(timeout=5000)  # espera até 5s
                     avg_rating = avg_rating_sec.get_attribute("data-original-title")
-                
-                    if avg_rating:
-                        numbers = re.findall(r"[\d,]+\.\d+|[\d,]+", avg_rating)
-                        try:
-                            num_ratings = int(numbers[1].replace(",", ""))
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar quantidade de reviews de usuários em {url_str}. Erro: {e}")
-                        try:
-                            num_average = float(numbers[0])
-                            num_average_format = (num_average * 10)/5
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar a nota média de usuários em {url_str}. Erro: {e}")
+                    num_average_format, num_ratings = self.parse_rating_tooltip(avg_rating, url_str)
                 except Exception:
                     pass # nao tem ou nao carregou em 5s
         except Exception as e:
@@ -331,6 +393,19 @@ class LettrScraper(Scraper):
                         
         return num_average_format, num_ratings
         
+    def normalize_platform_name(self, platform_name):
+        platform_name = platform_name.strip()
+        # deixando nomes das plataformas iguais aos outros scrappers
+        if platform_name == "Amazon" or platform_name == "Amazon Video":
+            platform_name = "Prime Video"
+        elif platform_name == "Apple TV Store":
+            platform_name = "Apple TV"
+        elif platform_name == "Google Play Movies":
+            platform_name = "Google Play"
+        elif platform_name == "Paramount+ MTV Amazon Channel":
+            platform_name = "Paramount+"
+        return platform_name
+
     # --> Dinâmico
     def get_plataforms(self, page, url_str):
         plataform_names = []
@@ -344,17 +419,7 @@ class LettrScraper(Scraper):
                         try:
                             service = services.nth(i)
 
-                            platform_name = service.locator(".label .name").inner_text().strip()
-                            
-                            # deixando nomes das plataformas iguais aos outros scrappers
-                            if platform_name == "Amazon" or platform_name == "Amazon Video":
-                                platform_name = "Prime Video"
-                            elif platform_name == "Apple TV Store":
-                                platform_name = "Apple TV"
-                            elif platform_name == "Google Play Movies":
-                                platform_name = "Google Play"
-                            elif platform_name == "Paramount+ MTV Amazon Channel":
-                                platform_name = "Paramount+"
+                            platform_name = self.normalize_platform_name(service.locator(".label .name").inner_text())
                                 
                             platform_link = service.locator("a.label").get_attribute("href").strip()
                             if platform_name and platform_link and platform_name not in plataform_names:
@@ -369,51 +434,110 @@ class LettrScraper(Scraper):
             print(f"[ERROR] Falha ao obter plataformas de streaming em {url_str}. Erro: {e}")
         return plataforms
 
-    def scrap_reviews(self, site, movie):
+    # --> Versões assíncronas das etapas dinâmicas, usadas pelo motor asyncio
+
+    async def get_similar_movies_async(self, page, url_str):
+        links = []
         try:
-            reviews_section = site.find("section", {"class": "film-reviews section js-popular-reviews"})
-            if reviews_section:
-                url_reviews_tag = reviews_section.find("a")
-                if url_reviews_tag:
-                    url_reviews = "https://letterboxd.com" + url_reviews_tag["href"]
-
-                    response = requests.get(url_reviews, headers=self.headers)
-                    if not response.ok:
-                        print(f"Nao foi possivel obter o html de {url_reviews}")
-                        print(f"Conteudo retornado:")
-                        print(response.content)
-                        return
-                    
-                    soup = BeautifulSoup(response.content, "html.parser")
-                    if soup:
-                        reviews_list = soup.select("div.viewing-list.-marginblockstart div.listitem")
-                        add_review = movie.add_user_review
-                        if reviews_list:
-                            for i, review_tag in enumerate(reviews_list, 1):
-                                try:
-                                    span = review_tag.find("span", class_=re.compile(r"^rating"))
-                                    if not span:
-                                        continue
-                                    s = span.text.strip()
-                                    rating = s.count("★") + 0.5 * s.count("½")
-                                    rating_format = (rating * 10) / 5
-                                    date_raw = review_tag.time["datetime"]
-                                    date_obj = parse(date_raw)
-                                    date_format = date_obj.strftime("%Y-%m-%d")
-                                    review_div = review_tag.select_one("div.body-text.-prose.-reset.js-review-body.js-collapsible-text p")
-                                    if not review_div:
-                                        continue
-                                    r = Review()
-                                    r.set_date(date_format)
-                                    r.set_rating(rating_format)
-                                    r.set_text(review_div.text)
-                                    add_review(r)
-                                except Exception as e:
-                                    self._errors += 1
-                                    print(f"[ERROR] Falha ao processar uma review de usuário na URL {url_reviews}. Erro: {e}")
+            items = page.locator("ul.poster-list.-p110.-horizontal.-scaled104").locator("li")
+            for i in range(await items.count()):
+                try:
+                    link = await items.nth(i).locator("div.react-component").get_attribute("data-item-link")
+                    links.append("https://letterboxd.com" + link)
+                except Exception as e:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao obter um filme similar na URL {url_str}. Erro: {e}")
         except Exception as e:
             self._errors += 1
-            print(f"[ERROR] Falha ao obter reviews de usuários na URL {url_reviews}. Erro: {e}")
+            print(f"[ERROR] Falha ao obter filmes similares na URL {url_str}. Erro: {e}")
+        return links
+
+    async def get_ratings_stats_async(self, page, url_str):
+        try:
+            avg_rating_sec = page.locator("section.ratings-histogram-chart").locator("span.average-rating a")
+            try:
+                await avg_rating_sec.wait_for(timeout=5000)  # espera até 5s
+                avg_rating = await avg_rating_sec.get_attribute("data-original-title")
+                return self.parse_rating_tooltip(avg_rating, url_str)
+            except Exception:
+                pass # nao tem ou nao carregou em 5s
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao obter quantidade e nota média das reviews usuários em {url_str}. Erro: {e}")
+        return None, None
+
+    async def get_plataforms_async(self, page, url_str):
+        plataform_names = []
+        plataforms = []
+        try:
+            services = page.locator("section.services.-showall").locator("p.service")
+            for i in range(await services.count()):
+                try:
+                    service = services.nth(i)
+                    platform_name = self.normalize_platform_name(await service.locator(".label .name").inner_text())
+                    platform_link = (await service.locator("a.label").get_attribute("href")).strip()
+                    if platform_name and platform_link and platform_name not in plataform_names:
+                        plataforms.append(Plataform(platform_name, platform_link))
+                        plataform_names.append(platform_name)
+                except Exception as e:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao processar uma plataforma de streaming em {url_str}. Erro: {e}")
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao obter plataformas de streaming em {url_str}. Erro: {e}")
+        return plataforms
+
+    def iter_reviews(self, url_reviews):
+        """Reviews de usuários, seguindo o link "próxima" da paginação."""
+        visited = set()
+        while url_reviews and url_reviews not in visited:
+            visited.add(url_reviews)
+            try:
+                response = self.fetch(url_reviews)
+                if not response.ok:
+                    print(f"Nao foi possivel obter o html de {url_reviews}")
+                    print(f"Conteudo retornado:")
+                    print(response.content)
+                    return
+                soup = self.parse(response.content)
+                reviews = self.parse_reviews(soup, url_reviews)
+                next_tag = soup.select_one("div.paginate-nextprev a.next")
+                next_url = "https://letterboxd.com" + next_tag["href"] if next_tag and next_tag.get("href") else None
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao obter reviews de usuários na URL {url_reviews}. Erro: {e}")
+                return
+            # uma página sem nenhuma review aproveitável não encerra a paginação
+            yield from reviews
+            url_reviews = next_url
+
+    def parse_reviews(self, soup, url_reviews) -> list[Review]:
+        reviews = []
+        raw_dates = []
+        for review_tag in soup.select("div.viewing-list.-marginblockstart div.listitem"):
+            try:
+                span = review_tag.find("span", class_=re.compile(r"^rating"))
+                if not span:
+                    continue
+                s = span.text.strip()
+                rating = s.count("★") + 0.5 * s.count("½")
+                rating_format = (rating * 10) / 5
+                date_raw = review_tag.time["datetime"]
+                review_div = review_tag.select_one("div.body-text.-prose.-reset.js-review-body.js-collapsible-text p")
+                if not review_div:
+                    continue
+                r = Review()
+                r.set_rating(rating_format)
+                r.set_text(review_div.text)
+                reviews.append(r)
+                raw_dates.append(date_raw)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar uma review de usuário na URL {url_reviews}. Erro: {e}")
+
+        for review, date in zip(reviews, normalize_dates(raw_dates)):
+            review.set_date(date)
+        return reviews
             
 
 # Lista de infos:
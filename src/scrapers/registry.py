@@ -0,0 +1,54 @@
+"""
+Registro dos scrapers por site.
+
+Cada site é registrado pelo seu URLType com o caminho da classe do scraper,
+e o módulo só é importado quando a classe é pedida pela primeira vez. Assim
+quem só lê o Storage ou junta filmes já coletados não paga a importação do
+bs4, do Selenium e do Playwright que os scrapers trazem.
+"""
+import importlib
+from threading import Lock
+
+from src.data_structures.url import URLType
+
+
+_registry: dict[URLType, str] = {}
+_loaded: dict[URLType, type] = {}
+_lock = Lock()
+
+
+def register(site: URLType, path: str) -> None:
+    """Registra o scraper de `site`; `path` é "módulo:Classe"."""
+    with _lock:
+        _registry[site] = path
+        _loaded.pop(site, None)
+
+
+def registered_sites() -> list[URLType]:
+    with _lock:
+        return list(_registry)
+
+
+def is_loaded(site: URLType) -> bool:
+    with _lock:
+        return site in _loaded
+
+
+def scraper_class(site: URLType) -> type:
+    """Classe do scraper de `site`, importando o módulo na primeira chamada."""
+    with _lock:
+        cls = _loaded.get(site)
+        if cls is not None:
+            return cls
+        path = _registry.get(site)
+        if path is None:
+            raise KeyError(f"Nenhum scraper registrado para {site.name}")
+        module_name, class_name = path.split(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _loaded[site] = cls
+        return cls
+
+
+register(URLType.IMDB, "src.scrapers.imdb_scraper:IMDBScraper")
+register(URLType.LTTR, "src.scrapers.lettr_scraper:LettrScraper")
+register(URLType.ROTT, "src.scrapers.rott_scraper:RottScraper")
@@ -4,29 +4,71 @@ from src.data_structures.url import URLType, URL
 from src.data_structures.movie import Movie
 from src.data_structures.review import Review
 from src.data_structures.plataform import Plataform
-import requests
 from bs4 import BeautifulSoup
 from src.storage import Storage
 import json
-import pandas as pd
 import re
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
-from selenium.webdriver.chrome.service import Service
-from playwright.sync_api import sync_playwright
+from src.network.browser_pool import BrowserPool
+from src.network.http_client import HttpClient
+from src.network.request_policy import RequestPolicy
+from src.parsing import ParseTarget, TargetFilter
+from src.normalization import earliest_date, normalize_duration, normalize_relative_dates
+from src.scrapers import schemas
 import urllib.parse
-from queue import Empty
+import asyncio
 
 
 class RottScraper(Scraper):
+
+    # Hosts que as páginas precisam: o próprio site, seus assets e o widget do JustWatch
+    ALLOWED_HOSTS = ("rottentomatoes.com", "flixster.com", "justwatch.com")
+
+    SITE = URLType.ROTT
+
+    # Campos lidos direto da página principal (ver src/scrapers/schemas.py)
+    SCHEMA = schemas.ROTTEN
+
+    PAGE_TARGETS = {
+        "json-ld": (ParseTarget("script", {"type": "application/ld+json"}),),
+        "scrapMovieInfo": (ParseTarget("section", {"class": "media-info"}),),
+        "scrapRevData": (ParseTarget("script", {"id": "media-scorecard-json"}),),
+        "new_movies": (ParseTarget("section", {"data-qa": "section:more-like-this"}),),
+    }
+    # Da página de elenco, scrapCast só lê o JSON-LD
+    CAST_FILTER = TargetFilter([ParseTarget("script", {"type": "application/ld+json"})])
+
+    # Lê os review-cards a partir do índice `skip` numa única ida ao navegador.
+    # Os campos ficam em filhos com slot; procura no light DOM e, se não
+    # achar, no shadow root.
+    REVIEW_CARDS_JS = """
+    (cards, skip) => cards.slice(skip).map(card => {
+        const find = (root, selector) => root
+            ? (root.querySelector(selector) || (root.shadowRoot && root.shadowRoot.querySelector(selector)))
+            : null;
+        const text = el => el ? el.innerText : null;
+        const drawer = find(card, "drawer-more");
+        const content = find(drawer, "[slot='review']") || find(drawer, "span[slot='content']")
+            || find(card, "span[slot='content']");
+        const stars = find(card, "rating-stars-group");
+        return {
+            text: text(content),
+            score: stars ? stars.getAttribute("score") : null,
+            rating: text(find(card, "span[slot='rating'] > span")),
+            timestamp: text(find(card, "span[slot='timestamp']")),
+        };
+    })
+    """
+
+    # Botão que carrega a próxima página de reviews na mesma página
+    LOAD_MORE_SELECTOR = "rt-button[data-qa='load-more-btn'], button[data-qa='load-more-btn']"
+    REVIEW_COUNT_JS = "count => document.querySelectorAll('review-card').length > count"
     
-    def __init__(self, periodic_queue, storage: Storage):
-        super().__init__(periodic_queue, storage)
+    def __init__(self, periodic_queue, storage: Storage, browser_pool: BrowserPool | None = None,
+                 http_client: HttpClient | None = None, request_policy: RequestPolicy | None = None):
+        super().__init__(periodic_queue, storage, http_client)
+        self.browser_pool = browser_pool if browser_pool is not None else BrowserPool()
+        self.request_policy = request_policy if request_policy is not None else RequestPolicy(self.ALLOWED_HOSTS)
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -38,72 +80,10 @@ class RottScraper(Scraper):
         self.count = 0
         self.name = "Rotten Tomatoes"
     
-    def scrapJSONLD(self, site: BeautifulSoup, movie: Movie) -> int:
-        try:
-            url_str = movie.get_url()
-            script_tag = site.find("script", type="application/ld+json")
-            if script_tag:
-
-                data = json.loads(script_tag.string)
-                
-                try:
-                    title = (data.get("name")).strip()
-                    if not title:
-                        self._errors += 1
-                        return 1
-                    movie.set_title(str(title))
-                except Exception:
-                    self._errors += 1
-                    return 1
-                
-                try:
-                    directors = data.get("director", [])
-                    if directors:
-                        director_names = [(d["name"]).strip() for d in directors]
-                        movie.set_directors(director_names)
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter os diretores na URL {url_str}. Erro: {e}")
-
-                try:
-                    genres = data.get("genre", [])
-                    if genres:
-                        genre_list = [g.strip() for genre in genres for g in genre.split("&")]
-                        movie.set_genres(genre_list)
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter os gêneros na URL {url_str}. Erro: {e}")
-
-                try:
-                    content_rating = data.get("contentRating")
-                    if content_rating:
-                        content_rating = content_rating.strip()
-                        movie.set_content_rating(content_rating)
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao obter a classificação indicativa na URL {url_str}. Erro: {e}")
-                return 0
-            else:
-                self._errors += 1
-                return 1
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao obter JSON-LD da URL {url_str}. Erro: {e}")
-            return 1
-    
     def scrapMovieInfo(self, site: BeautifulSoup, movie: Movie):
         url_str = movie.get_url()
         section = site.find("section", {"class": "media-info"})
         if section:
-            try:
-                synopsis_tag = section.find("rt-text", {"data-qa": "synopsis-value"})
-                if synopsis_tag:
-                    synopsis = synopsis_tag.get_text(strip=True)
-                    movie.set_synopsis(synopsis)
-            except Exception as e:
-                self._errors += 1
-                print(f"[ERROR] Falha ao obter a sinopse na URL {url_str}. Erro: {e}")
-            
             dates = []
             wraps = section.find_all("div", {"class": "category-wrap", "data-qa": "item"})
             if wraps:
@@ -122,8 +102,7 @@ class RottScraper(Scraper):
                                     else:
                                         cleaned = raw
 
-                                    dt = pd.to_datetime(cleaned).strftime("%Y-%m-%d").strip()
-                                    dates.append(dt)
+                                    dates.append(cleaned)
                             except Exception as e:
                                 self._errors += 1
                                 print(f"[ERROR] Falha ao processar a data de lançamento na URL {url_str}. Erro: {e}")
@@ -134,10 +113,7 @@ class RottScraper(Scraper):
                                 if val:
                                     length = val.text
                                     if length:
-                                        length = length.strip()
-                                        pd_length = pd.to_timedelta(length)
-                                        length_formatted = str(pd_length).split()[-1]
-                                        movie.set_length(length_formatted)
+                                        movie.set_length(normalize_duration(length))
                             except Exception as e:
                                 self._errors += 1
                                 print(f"[ERROR] Falha ao processar a duração do filme na URL {url_str}. Erro: {e}")
@@ -146,13 +122,17 @@ class RottScraper(Scraper):
                         print(f"[ERROR] Falha ao processar uma informação de categoria na URL {movie.url}. Erro: {e}")
 
             if dates:
-                oldest_date = min(dates)
+                # todas as datas de lançamento do filme normalizadas de uma vez
+                oldest_date = earliest_date(*dates)
+                if oldest_date is None:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao processar a data de lançamento na URL {url_str}. Datas: {dates}")
                 movie.set_release_date(oldest_date)
      
     def scrapCast(self, movie: Movie, url: str):
         url_cast = f"{url}/cast-and-crew"
 
-        response = requests.get(url_cast, headers=self.headers)
+        response = self.fetch(url_cast)
         if not response.ok:
             print(f"Nao foi possivel obter o html de {url_cast}")
             print(f"Conteudo retornado:")
@@ -160,7 +140,7 @@ class RottScraper(Scraper):
             return
         
         try:
-            cast_site = BeautifulSoup(response.content, "html.parser")
+            cast_site = self.parse(response.content, self.CAST_FILTER)
             script_tag = cast_site.find("script", type="application/ld+json")
             if script_tag:
 
@@ -184,250 +164,185 @@ class RottScraper(Scraper):
             self._errors += 1
             print(f"[ERROR] Falha ao obter ou processar o cast na URL {url_cast}. Erro: {e}")
 
-    def scrapRevData(self, site: BeautifulSoup, movie: Movie):
+    def scrapRevData(self, site: BeautifulSoup, movie: Movie, body: bytes | None = None):
         url_str = movie.get_url()
-        script_tag = site.find("script", id="media-scorecard-json")
+        # caminho rápido: JSON do scorecard lido direto dos bytes da página, sem o DOM
+        data = None
+        if body is not None:
+            data = self.embedded_json("scorecard", body, "id", "media-scorecard-json")
+        script_tag = site.find("script", id="media-scorecard-json") if data is None else None
 
         try:
             if script_tag:
                 raw_json = script_tag.text.strip()
                 data = json.loads(raw_json)
-                
-                if data:
-                    aud = data["audienceScore"]
-                    crit = data["criticsScore"]
+            
+            if data:
+                aud = data["audienceScore"]
+                crit = data["criticsScore"]
 
-                    if aud:
-                        try:
-                            if aud["reviewCount"]:
-                                aud_review_count = int(aud["reviewCount"])
-                                movie.set_usr_rev_count(aud_review_count)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar review de usuário (quantidade) na URL {url_str}. Erro: {e}")
+                if aud:
+                    try:
+                        if aud["reviewCount"]:
+                            aud_review_count = int(aud["reviewCount"])
+                            movie.set_usr_rev_count(aud_review_count)
+                    except Exception as e:
+                        self._errors += 1
+                        print(f"[ERROR] Falha ao processar review de usuário (quantidade) na URL {url_str}. Erro: {e}")
 
-                        try:
-                            if aud["scorePercent"]:
-                                aud_score_percent = int(aud["scorePercent"].replace("%", ""))
-                                movie.set_usr_avr_recommendation(aud_score_percent)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar review de usuário (percentual de recomendação) na URL {url_str}. Erro: {e}")
+                    try:
+                        if aud["scorePercent"]:
+                            aud_score_percent = int(aud["scorePercent"].replace("%", ""))
+                            movie.set_usr_avr_recommendation(aud_score_percent)
+                    except Exception as e:
+                        self._errors += 1
+                        print(f"[ERROR] Falha ao processar review de usuário (percentual de recomendação) na URL {url_str}. Erro: {e}")
 
-                        try:
-                            if aud["averageRating"]:
-                                aud_avg_rating = float(aud["averageRating"])*2   # *2 pra transformar nota até 5 em até 10
-                                movie.set_usr_avr_rating(aud_avg_rating)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar review de usuário (nota média) na URL {url_str}. Erro: {e}")
+                    try:
+                        if aud["averageRating"]:
+                            aud_avg_rating = float(aud["averageRating"])*2   # *2 pra transformar nota até 5 em até 10
+                            movie.set_usr_avr_rating(aud_avg_rating)
+                    except Exception as e:
+                        self._errors += 1
+                        print(f"[ERROR] Falha ao processar review de usuário (nota média) na URL {url_str}. Erro: {e}")
 
-                    if crit:
-                        try:
-                            if crit["reviewCount"]:
-                                crit_review_count = int(crit["reviewCount"])
-                                movie.set_crit_rev_count(crit_review_count)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar review de crítico (quantidade) na URL {url_str}. Erro: {e}")
+                if crit:
+                    try:
+                        if crit["reviewCount"]:
+                            crit_review_count = int(crit["reviewCount"])
+                            movie.set_crit_rev_count(crit_review_count)
+                    except Exception as e:
+                        self._errors += 1
+                        print(f"[ERROR] Falha ao processar review de crítico (quantidade) na URL {url_str}. Erro: {e}")
 
-                        try:
-                            if crit["scorePercent"]:
-                                crit_score_percent = int(crit["scorePercent"].replace("%", ""))
-                                movie.set_crit_avr_recommendation(crit_score_percent)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar review de crítico (percentual de recomendação) na URL {url_str}. Erro: {e}")
+                    try:
+                        if crit["scorePercent"]:
+                            crit_score_percent = int(crit["scorePercent"].replace("%", ""))
+                            movie.set_crit_avr_recommendation(crit_score_percent)
+                    except Exception as e:
+                        self._errors += 1
+                        print(f"[ERROR] Falha ao processar review de crítico (percentual de recomendação) na URL {url_str}. Erro: {e}")
 
-                        try:
-                            if crit["averageRating"]:
-                                crit_avg_rating = float(crit["averageRating"])
-                                movie.set_crit_avr_rating(crit_avg_rating)
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"[ERROR] Falha ao processar review de crítico (nota média) na URL {url_str}. Erro: {e}")
-                    poster = data["primaryImageUrl"]
-                    if poster:
-                        movie.set_poster_link(poster)
-                    
+                    try:
+                        if crit["averageRating"]:
+                            crit_avg_rating = float(crit["averageRating"])
+                            movie.set_crit_avr_rating(crit_avg_rating)
+                    except Exception as e:
+                        self._errors += 1
+                        print(f"[ERROR] Falha ao processar review de crítico (nota média) na URL {url_str}. Erro: {e}")
+                poster = data["primaryImageUrl"]
+                if poster:
+                    movie.set_poster_link(poster)
+                
         except Exception as e:
             self._errors += 1
             print(f"[ERROR] Falha ao processar os dados de reviews na URL {url_str}. Erro: {e}")
 
-    def parse_rotten_date(self, date_str, url_rev):
-        # Converte datas do tipo '47m', '2h', '1d', 'Nov 27', '09/27/2024'
-        if not date_str:
+    def parse_critic_rating(self, raw: str | None) -> float | None:
+        # Converte notas de crítico ('3/4', '8', 'B+') para a escala até 10
+        if not raw:
             return None
 
-        s = date_str.lower().strip()
-        now = pd.Timestamp.now()
-
-        # minutos
-        if s.endswith("m") and s[:-1].isdigit():
-            minutes = int(s[:-1])
-            dt = now - pd.Timedelta(minutes=minutes)
-            return dt.strftime("%Y-%m-%d")
-
-        # horas
-        if s.endswith("h") and s[:-1].isdigit():
-            hours = int(s[:-1])
-            dt = now - pd.Timedelta(hours=hours)
-            return dt.strftime("%Y-%m-%d")
-
-        # dias
-        if s.endswith("d") and s[:-1].isdigit():
-            days = int(s[:-1])
-            dt = now - pd.Timedelta(days=days)
-            return dt.strftime("%Y-%m-%d")
-
-        # semanas
-        if s.endswith("w") and s[:-1].isdigit():
-            weeks = int(s[:-1])
-            dt = now - pd.Timedelta(weeks=weeks)
-            return dt.strftime("%Y-%m-%d")
-
-        # datas
-        try:
-            # Se não tem ano, adiciona o ano atual
-            if re.match(r"^[a-z]{3} \d{1,2}$", s):
-                dt = pd.to_datetime(f"{s}, {now.year}")
-                # Se a data resultante for no futuro, subtrai 1 ano
-                if dt > now:
-                    dt = dt - pd.DateOffset(years=1)
-                return dt.strftime("%Y-%m-%d")
-            else:
-                dt = pd.to_datetime(s)
-                return dt.strftime("%Y-%m-%d")
-        except:
-            self._errors += 1
-            print(f"[ERROR] Falha ao processar data de uma reviews na URL {url_rev} no Playright. Erro: {e}")
-        
-    def scrapUsrReviews(self, page, movie: Movie, url: str):
-        url_rev = f"{url}/reviews/all-audience"
+        # 1) IGNORAR notas em letra
+        if re.match(r"^[A-F][+-]?$", raw):
+            return None
 
-        try:
-            page.goto(url_rev, wait_until="domcontentloaded")
-            page.wait_for_selector("review-card", timeout=10000)
+        # 2) Frações (3/4, 9/10 etc.)
+        if "/" in raw and re.match(r"^\d+(\.\d+)?/\d+(\.\d+)?$", raw):
+            num, den = raw.split("/")
+            num = float(num)
+            den = float(den)
+            if den == 0:
+                return None
+            return round((num / den) * 10, 2)
+
+        # 3) Número direto (0–10)
+        if re.match(r"^\d+(\.\d+)?$", raw):
+            value = float(raw)
+            if value <= 10:
+                return value
+            # caso improvável (nota tipo 80/100 sem barra)
+            return round((value / 100) * 10, 2)
+        return None
+
+    def build_reviews(self, records: list[dict], url_rev: str, critic: bool) -> list[Review]:
+        """Normaliza os registros lidos de uma vez dos review-cards da página."""
+        reviews = []
+        raw_dates = []
+        for record in records:
+            try:
+                texto = record["text"].strip() if record["text"] else None
+
+                # Nota: críticos têm texto livre ("3/5", "B+"); usuários, estrelas até 5
+                if critic:
+                    raw = record["rating"].strip() if record["rating"] else None
+                    nota = self.parse_critic_rating(raw)
+                else:
+                    nota = float(record["score"]) * 2 if record["score"] else None
+
+                if (texto or nota):
+                    review = Review()
+                    review.set_text(texto)
+                    review.set_rating(nota)
+                    reviews.append(review)
+                    raw_dates.append(record["timestamp"])
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar uma review na URL {url_rev} no Playright. Erro: {e}")
 
-            cards = page.locator("review-card")
-            count = cards.count()
-            for i in range(count):
-                try:
-                    card = cards.nth(i)
-
-                    # Texto do review
-                    loc = card.locator("drawer-more >> [slot='review'], span[slot='content']")
-                    if loc.count() > 0:
-                        texto = loc.inner_text(timeout=2000).strip()
-                    else:
-                        texto = None
-                    
-                    # Nota
-                    score_el = card.locator("rating-stars-group")
-                    nota = None
-                    if score_el.count() > 0:
-                        score = score_el.get_attribute("score")
-                        nota = float(score) * 2 if score else None
-                    
-                    # Data 
-                    data_el = card.locator("span[slot='timestamp']")
-                    date_raw = data_el.inner_text() if data_el.count() > 0 else None
-                    date_formatted = self.parse_rotten_date(date_raw, url_rev)
-                    
-                    if (texto or nota):
-                        review = Review()
-                        review.set_text(texto)
-                        review.set_rating(nota)
-                        review.set_date(date_formatted)
-                        movie.add_user_review(review)
-                    
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao processar uma review na URL {url_rev} no Playright. Erro: {e}")
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao processar URL {url_rev} no Playright. Erro: {e}")
+        # "47m", "2h", "Nov 27", "09/27/2024": todas as datas da leva de uma vez
+        for review, raw, date in zip(reviews, raw_dates, normalize_relative_dates(raw_dates)):
+            if raw and date is None:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar data de uma reviews na URL {url_rev} no Playright. Data: {raw}")
+            review.set_date(date)
+        return reviews
 
+    def scrapUsrReviews(self, page, movie: Movie, url: str):
+        url_rev = f"{url}/reviews/all-audience"
+        self.collect_reviews(movie, "usr", url, self.iter_reviews(page, url_rev, critic=False))
 
     def scrapCritReviews(self, page, movie: Movie, url: str):
         url_rev = f"{url}/reviews/all-critics"
+        self.collect_reviews(movie, "crit", url, self.iter_reviews(page, url_rev, critic=True))
 
-
+    def iter_reviews(self, page, url_rev: str, critic: bool):
+        """Reviews da página, clicando em "Load More" só quando o consumidor pede mais."""
         try:
-            page.goto(url_rev, wait_until="domcontentloaded")
+            self.load_page(page, url_rev)
             page.wait_for_selector("review-card", timeout=10000)
-
-            cards = page.locator("review-card")
-            count = cards.count()
-            for i in range(count):
-                try:
-                    card = cards.nth(i)
-
-                    # Texto do review
-                    loc = card.locator("drawer-more >> [slot='review'], span[slot='content']")
-                    if loc.count() > 0:
-                        texto = loc.inner_text(timeout=2000).strip()
-                    else:
-                        texto = None
-                    # Nota
-                    rating_span = card.locator("span[slot='rating'] > span")
-                    raw = rating_span.inner_text(timeout=1000).strip() if rating_span.count() > 0 else None
-                    if raw:
-                        # 1) IGNORAR notas em letra
-                        if re.match(r"^[A-F][+-]?$", raw):
-                            nota = None
-
-                        # 2) Frações (3/4, 9/10 etc.)
-                        elif "/" in raw and re.match(r"^\d+(\.\d+)?/\d+(\.\d+)?$", raw):
-                            num, den = raw.split("/")
-                            num = float(num)
-                            den = float(den)
-                            if den == 0:
-                                nota = None
-                            nota = round((num / den) * 10, 2)
-
-                        # 3) Número direto (0–10)
-                        elif re.match(r"^\d+(\.\d+)?$", raw):
-                            value = float(raw)
-                            if value <= 10:
-                                nota = value
-                            else:
-                            # caso improvável (nota tipo 80/100 sem barra)
-                                nota = round((value / 100) * 10, 2)
-                    else:
-                        nota = None
-                    # Data 
-                    data_el = card.locator("span[slot='timestamp']")
-                    date_raw = data_el.inner_text() if data_el.count() > 0 else None
-                    date_formatted = self.parse_rotten_date(date_raw, url_rev)
-                    if (texto or nota):
-                        review = Review()
-                        review.set_text(texto)
-                        review.set_rating(nota)
-                        review.set_date(date_formatted)
-                        movie.add_critic_review(review)
-                    
-                except Exception as e:
-                    self._errors += 1
-                    print(f"[ERROR] Falha ao processar uma review na URL {url_rev} no Playright. Erro: {e}")
         except Exception as e:
             self._errors += 1
             print(f"[ERROR] Falha ao processar URL {url_rev} no Playright. Erro: {e}")
+            return
 
+        seen = 0
+        while True:
+            try:
+                # só os cards novos saem do navegador, numa única avaliação
+                records = page.eval_on_selector_all("review-card", self.REVIEW_CARDS_JS, seen)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar URL {url_rev} no Playright. Erro: {e}")
+                return
+            if not records:
+                return
+            seen += len(records)
+            yield from self.build_reviews(records, url_rev, critic)
+            if not self.load_more_reviews(page, url_rev, seen):
+                return
 
-    def scrapNewMovies(self, site: BeautifulSoup, url_str: str):
+    def load_more_reviews(self, page, url_rev: str, seen: int) -> bool:
         try:
-            more_like_this = site.find("section", {"data-qa": "section:more-like-this"})
-            if more_like_this:
-                # Dentro dela, procura todos os <rt-link> que tenham o slot "primaryImage"
-                for link_tag in more_like_this.select('rt-link[slot="primaryImage"]'):
-                    href = link_tag.get("href")
-                    if href and href.startswith("/m/"):  # garante que é link de filme
-                        self.periodic_queue.put(URL("https://www.rottentomatoes.com" + href.strip(), URLType.ROTT))
-                        self._new_urls_count += 1
-        except Exception as e:
-            self._errors += 1
-            print(f"[ERROR] Falha ao processar seção 'more like this' em {url_str}. Erro: {e}")
+            button = page.query_selector(self.LOAD_MORE_SELECTOR)
+            if button is None or not button.is_visible():
+                return False
+            self.throttle(url_rev)
+            button.click()
+            page.wait_for_function(self.REVIEW_COUNT_JS, arg=seen, timeout=10000)
+            return True
+        except Exception:
+            return False  # sem mais páginas ou o botão não carregou nada
 
     # Pega o link do click.justwatch.com e tenta identificar a plataforma com base no domínio final (param 'r=' do redirect).
     def normalize_platform_from_url(self, link: str) -> str | None:
@@ -469,7 +384,7 @@ class RottScraper(Scraper):
     
     def scrapPlataforms(self, page, movie: Movie, url: str):
         try:
-            page.goto(url, wait_until="domcontentloaded")
+            self.load_page(page, url)
             
             iframe_locator = page.locator(
                 "div[data-wheretowatchmanager='jwContainer'] >> iframe.jw-widget-iframe"
@@ -516,48 +431,183 @@ class RottScraper(Scraper):
         
     def scrapDynamicData(self, url: URL, movie: Movie):
         url_str = url.get_url()
+        # (extrator, página que ele lê, nome da etapa)
+        # com limite 0 a etapa de reviews nem abre a página
+        steps = []
+        if self.review_caps.get("crit", 0) > 0:
+            steps.append((self.scrapCritReviews, f"{url_str}/reviews/all-critics", "Reviews de críticos"))
+        if self.review_caps.get("usr", 0) > 0:
+            steps.append((self.scrapUsrReviews, f"{url_str}/reviews/all-audience", "Reviews de usuários"))
+        steps.append((self.scrapPlataforms, url_str, "Plataformas"))
         try:
-            browser = None
-            with sync_playwright() as p:
+            t0 = time.time()
+            with self.browser_pool.lease_pages(len(steps), self.headers, self.request_policy) as pages:
+                self.end_phase("Espera do pool de navegadores", t0)
                 try:
-                    browser = p.chromium.launch(headless=True)
-                    context = browser.new_context(extra_http_headers=self.headers)
-                    page = context.new_page()
-                
-                    t0 = time.time()
-                    self.scrapCritReviews(page, movie, url_str)
-                    self.end_phase("Reviews de críticos", t0)
-                    
-                    t0 = time.time()
-                    self.scrapUsrReviews(page, movie, url_str)
-                    self.end_phase("Reviews de usuários", t0)
-                    
-                    t0 = time.time()
-                    self.scrapPlataforms(page, movie, url_str)
-                    self.end_phase("Plataformas", t0)
+                    # as três páginas carregam em paralelo no navegador
+                    for page, (_, page_url, _) in zip(pages, steps):
+                        self.start_navigation(page, page_url)
+
+                    for page, (extractor, _, phase) in zip(pages, steps):
+                        t0 = time.time()
+                        extractor(page, movie, url_str)
+                        self.end_phase(phase, t0)
                 except Exception as e:
                     print(f"[ERROR] Falha durante a coleta dinâmica no Rotten Tomatoes. Erro: {e}")
                     self._errors += 1
                 finally:
-                    if browser:
-                        browser.close()
+                    # navegações não esperadas (etapa que falhou ou parou antes) saem da política
+                    self.abandon_navigations()
         except Exception as e:
             self._errors += 1
             print(f"[ERROR] Falha ao iniciar Playright ou navegador no Rotten Tomatoes scraper. Erro: {e}")
 
-    @override
-    def scrap(self):
+    # --> Versões assíncronas das etapas dinâmicas, usadas pelo motor asyncio
+
+    async def scrapUsrReviewsAsync(self, page, movie: Movie, url: str):
+        url_rev = f"{url}/reviews/all-audience"
+        await self.collect_reviews_async(movie, "usr", url, self.iter_reviews_async(page, url_rev, critic=False))
+
+    async def scrapCritReviewsAsync(self, page, movie: Movie, url: str):
+        url_rev = f"{url}/reviews/all-critics"
+        await self.collect_reviews_async(movie, "crit", url, self.iter_reviews_async(page, url_rev, critic=True))
+
+    async def iter_reviews_async(self, page, url_rev: str, critic: bool):
         try:
-            url = self.periodic_queue.get(timeout=5)
-        except Empty:
-            return  1
-        
-        if (url.get_type() == URLType.END):
+            await self.goto_async(page, url_rev)
+            await page.wait_for_selector("review-card", timeout=10000)
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao processar URL {url_rev} no Playright. Erro: {e}")
+            return
+
+        seen = 0
+        while True:
+            try:
+                records = await page.eval_on_selector_all("review-card", self.REVIEW_CARDS_JS, seen)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao processar URL {url_rev} no Playright. Erro: {e}")
+                return
+            if not records:
+                return
+            seen += len(records)
+            for review in self.build_reviews(records, url_rev, critic):
+                yield review
+            if not await self.load_more_reviews_async(page, url_rev, seen):
+                return
+
+    async def load_more_reviews_async(self, page, url_rev: str, seen: int) -> bool:
+        try:
+            button = await page.query_selector(self.LOAD_MORE_SELECTOR)
+            if button is None or not await button.is_visible():
+                return False
+            if self.http.rate_limiter is not None:
+                await self.http.rate_limiter.acquire_async(url_rev)
+            await button.click()
+            await page.wait_for_function(self.REVIEW_COUNT_JS, arg=seen, timeout=10000)
+            return True
+        except Exception:
+            return False
+
+    async def scrapPlataformsAsync(self, page, movie: Movie, url: str):
+        try:
+            await self.goto_async(page, url)
+
+            iframe_locator = page.locator(
+                "div[data-wheretowatchmanager='jwContainer'] >> iframe.jw-widget-iframe"
+            )
+            try:
+                await iframe_locator.wait_for(timeout=5000)
+            except Exception:
+                # não existe para esse filme
+                return
+
+            iframe_element = await iframe_locator.element_handle()
+            frame = await iframe_element.content_frame() if iframe_element else None
+            if not frame:
+                return
+
+            try:
+                await frame.wait_for_selector("div.jw-offer a", timeout=5000)
+                offers = frame.locator("div.jw-offer a")
+            except Exception:
+                # nao existe para esse filme
+                return
+
+            count = await offers.count()
+            plataform_names = []
+            for i in range(count):
+                try:
+                    link = await offers.nth(i).get_attribute("href")
+                    plataform_name = self.normalize_platform_from_url(link)
+
+                    if plataform_name and plataform_name not in plataform_names:
+                        plataform_names.append(plataform_name)
+                        movie.add_platform(Plataform(plataform_name, link))
+                except Exception as e:
+                    self._errors += 1
+                    print(f"[ERROR] Falha ao ler plataforma em {url}. Erro: {e}")
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao processar URL {url} no Playright. Erro: {e}")
+
+    async def scrapDynamicDataAsync(self, context, url: URL, movie: Movie):
+        url_str = url.get_url()
+        steps = [
+            (self.scrapCritReviewsAsync, "Reviews de críticos"),
+            (self.scrapUsrReviewsAsync, "Reviews de usuários"),
+            (self.scrapPlataformsAsync, "Plataformas"),
+        ]
+        pages = []
+        try:
+            pages = [await context.new_page() for _ in steps]
+            await asyncio.gather(*(
+                self.run_phase_async(phase, extractor(page, movie, url_str))
+                for page, (extractor, phase) in zip(pages, steps)
+            ))
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha durante a coleta dinâmica no Rotten Tomatoes. Erro: {e}")
+        finally:
+            for page in pages:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    @override
+    def sub_resources(self, url: URL) -> list[str]:
+        return [f"{url.get_url()}/cast-and-crew"]
+
+    @override
+    def close(self) -> None:
+        super().close()
+        self.browser_pool.close_thread()
+
+    @override
+    def scrap_movie(self, url: URL) -> int:
+        result = self.scrap_static(url)
+        if result is None:
             return 1
-        
+        fields, movie = result
+        self.scrapDynamicData(url, movie)
+        return self.finish_movie(url, fields, movie)
+
+    @override
+    async def scrap_movie_async(self, url: URL, context) -> int:
+        result = await asyncio.to_thread(self.scrap_static, url)
+        if result is None:
+            return 1
+        fields, movie = result
+        await self.scrapDynamicDataAsync(context, url, movie)
+        return self.finish_movie(url, fields, movie)
+
+    def scrap_static(self, url: URL):
+        """Etapas que usam só HTTP. Retorna (campos, movie) ou None se a página não serve."""
         url_str = url.get_url()
         t0 = time.time()
-        response = requests.get(url_str, headers=self.headers)
+        response = self.fetch(url_str)
         self.end_phase("Request", t0)
 
         if not response.ok:
@@ -565,45 +615,56 @@ class RottScraper(Scraper):
             print(f"Conteudo retornado:")
             print(response.content)
             self._errors += 1
-            return 1
+            return None
         
         
-        site = BeautifulSoup(response.content, "html.parser")
-        if site:
-            print(f"[INFO] Iniciando web scraping da URL: {url_str}")
-            movie = Movie()
-            movie.set_url(url=url_str)
-            
-            t0 = time.time()
-            if self.scrapJSONLD(site, movie) == 1:
-                print(f"[ERROR] Nenhum título foi encontrado na URL: {url_str}. O scraping desta página será interrompido.")
-                self.end_phase("JsonLd", t0)
-                return 1
-            self.end_phase("JsonLd", t0)
-            
-            t0 = time.time()
-            self.scrapMovieInfo(site, movie)
-            self.end_phase("Principais informações do filme", t0)
-            
-            t0 = time.time()
-            self.scrapCast(movie, url_str)
-            self.end_phase("Cast", t0)
-            
-            t0 = time.time()
-            self.scrapRevData(site, movie)
-            self.end_phase("Dados sobre reviews", t0)
-            
-            self.scrapDynamicData(url, movie)
-            
-            t0 = time.time()
-            self.scrapNewMovies(site, url_str)
-            self.end_phase("Novos filmes", t0)
+        page = self.extract_main_page(url_str, response.content)
+        if page is None:
+            return None
+        movie, fields = page
 
-            t0 = time.time()
-            self.storage.store_movie(movie, URLType.ROTT)
-            self.end_phase("Armazenamento", t0)
-                        
-            self.count += 1
-            print(f"[INFO] Concluída a coleta de dados da URL: {url_str}. Quantidade de filmes coletados do Rotten Tomatoes: {self.count}")
-            return 0
-        return 1
\ No newline at end of file
+        t0 = time.time()
+        self.scrapCast(movie, url_str)
+        self.end_phase("Cast", t0)
+        return fields, movie
+
+    @override
+    def extract_page(self, url_str: str, body: bytes):
+        site = self.parse(body, self.page_filter)
+        if not site:
+            return None
+        print(f"[INFO] Iniciando web scraping da URL: {url_str}")
+        movie = Movie()
+        movie.set_url(url=url_str)
+
+        t0 = time.time()
+        fields = self.extract_fields(self.SCHEMA, site, movie, url_str)
+        if fields is None:
+            self._errors += 1
+            print(f"[ERROR] Nenhum título foi encontrado na URL: {url_str}. O scraping desta página será interrompido.")
+            self.end_phase("Campos da página", t0)
+            return None
+        self.end_phase("Campos da página", t0)
+
+        t0 = time.time()
+        self.scrapMovieInfo(site, movie)
+        self.end_phase("Principais informações do filme", t0)
+
+        t0 = time.time()
+        self.scrapRevData(site, movie, body)
+        self.end_phase("Dados sobre reviews", t0)
+        return movie, fields
+
+    def finish_movie(self, url: URL, fields: dict, movie: Movie) -> int:
+        url_str = url.get_url()
+        t0 = time.time()
+        self.enqueue_new_movies(fields["new_movies"], URLType.ROTT, url, movie)
+        self.end_phase("Novos filmes", t0)
+
+        t0 = time.time()
+        self.storage.store_movie(movie, URLType.ROTT)
+        self.end_phase("Armazenamento", t0)
+                    
+        self.count += 1
+        print(f"[INFO] Concluída a coleta de dados da URL: {url_str}. Quantidade de filmes coletados do Rotten Tomatoes: {self.count}")
+        return 0
@@ -0,0 +1,96 @@
+"""
+Schemas de extração das páginas de filme de cada site (ver src/extraction.py).
+
+Os seletores precisam cair dentro dos nós declarados em PAGE_TARGETS de cada
+scraper, que são os únicos montados quando o parsing é direcionado.
+"""
+from src.extraction import Field, Schema
+from src.normalization import normalize_duration
+
+
+LD_JSON = "script[type='application/ld+json']"
+
+
+def imdb_title_link(tag) -> tuple[str, str | None] | None:
+    # o texto do link é o título, usado para priorizar filmes já coletados
+    # nos outros sites; os parâmetros de rastreamento saem na URL canônica
+    href = tag.get("href")
+    if not href:
+        return None
+    return "https://www.imdb.com" + href.strip(), tag.get_text(strip=True) or None
+
+
+def rott_movie_url(href: str) -> str | None:
+    # só links de filme; séries e outras páginas ficam de fora
+    return "https://www.rottentomatoes.com" + href if href.startswith("/m/") else None
+
+
+def rott_genres(genre: str) -> list[str]:
+    # "Action & Adventure" são dois gêneros
+    return [g.strip() for g in genre.split("&")]
+
+
+def lettr_genre(genre: str) -> str:
+    # deixa igual aos outros sites
+    return "Sci-Fi" if genre.lower() == "science fiction" else genre
+
+
+def lettr_url(href: str) -> str:
+    return "https://letterboxd.com" + href
+
+
+def lettr_length(footer: str) -> str | None:
+    # "136 mins  More at IMDb TMDb"
+    return normalize_duration(" ".join(footer.split()[:2]))
+
+
+IMDB = Schema([
+    Field("title", json="name", setter="set_title", required=True, label="título"),
+    Field("genres", json="genre", many=True, setter="set_genres", label="os gêneros"),
+    Field("release_date", json="datePublished", setter="set_release_date", label="data de lançamento"),
+    Field("synopsis", json="description", setter="set_synopsis", label="sinopse"),
+    Field("length", json="duration", normalize=normalize_duration, setter="set_length",
+          label="duração do filme"),
+    Field("content_rating", json="contentRating", setter="set_content_rating",
+          label="a classificação indicativa"),
+    Field("usr_avr_rating", json="aggregateRating.ratingValue", normalize=float, setter="set_usr_avr_rating",
+          label="nota média de reviews usuários"),
+    Field("usr_rev_count", json="aggregateRating.ratingCount", normalize=int, setter="set_usr_rev_count",
+          label="quantidade de reviews de usuários"),
+    Field("poster", css="div.ipc-poster__poster-image img", attr="src", setter="set_poster_link",
+          label="link do poster"),
+    Field("cast", css="a[data-testid='title-cast-item__actor']", many=True, setter="set_cast",
+          label="o elenco"),
+    Field("new_movies", css="section[data-testid='MoreLikeThis'] a.ipc-poster-card__title", getter=imdb_title_link,
+          many=True, label="seção 'more like this'"),
+], json_script=LD_JSON)
+
+
+ROTTEN = Schema([
+    Field("title", json="name", setter="set_title", required=True, label="título"),
+    Field("directors", json="director.name", many=True, setter="set_directors", label="os diretores"),
+    Field("genres", json="genre", many=True, normalize=rott_genres, setter="set_genres", label="os gêneros"),
+    Field("content_rating", json="contentRating", setter="set_content_rating",
+          label="a classificação indicativa"),
+    Field("synopsis", css="section.media-info rt-text[data-qa='synopsis-value']", setter="set_synopsis",
+          label="a sinopse"),
+    Field("new_movies", css="section[data-qa='section:more-like-this'] rt-link[slot='primaryImage']",
+          attr="href", many=True, normalize=rott_movie_url, label="seção 'more like this'"),
+], json_script=LD_JSON)
+
+
+LETTERBOXD = Schema([
+    Field("title", css="div.details span.name", setter="set_title", required=True, label="título"),
+    Field("directors", css="div.details a.contributor", many=True, setter="set_directors",
+          label="os diretores"),
+    Field("poster", json="image", setter="set_poster_link", label="o link do poster"),
+    Field("synopsis", css="section.production-synopsis p", setter="set_synopsis", label="a sinopse"),
+    Field("cast", scope="#tabbed-content div.cast-list", css="a.text-slug.tooltip", many=True,
+          setter="set_cast", label="o elenco"),
+    # a primeira lista da aba é a de gêneros; as seguintes são temas
+    Field("genres", scope="#tabbed-content div.text-sluglist.capitalize", css="a", many=True,
+          normalize=lettr_genre, setter="set_genres", label="generos"),
+    Field("length", css="p.text-footer", normalize=lettr_length, setter="set_length", label="duração"),
+    Field("reviews_url", css="section.js-popular-reviews a", attr="href", normalize=lettr_url,
+          label="reviews de usuários"),
+], json_script=LD_JSON)
@@ -1,18 +1,73 @@
+import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from itertools import islice
+from queue import Empty
 from threading import Lock
 from src.data_structures.periodic_queue import PeriodicQueue
 from src.data_structures.url import URL, URLType
+from src.data_structures.movie import Movie
+from src.data_structures.review import Review
 from src.storage import Storage
+from src.review_sink import ReviewSink
+from src.parse_pool import ParsePool
+from src.network.http_client import HttpClient
+from src.network.fetch_plan import FetchPlan
+from src.extraction import Schema
+from src.parsing import make_soup, extract_script_json, DEFAULT_BACKEND, ParseTarget, TargetFilter
+
+
+# Plano de requisições do filme em andamento. Cada thread e cada tarefa do
+# motor asyncio enxergam o seu próprio plano.
+_current_plan: ContextVar[FetchPlan | None] = ContextVar("current_plan", default=None)
 
 
 class Scraper(ABC):
+
+    # Nós da página principal do filme que cada extrator lê. Quando declarados,
+    # a página é parseada só nesses pedaços em vez de na árvore inteira.
+    PAGE_TARGETS: dict[str, tuple[ParseTarget, ...]] = {}
+
+    # Máximo de reviews lidas por filme, por tipo ("usr" e "crit")
+    REVIEW_CAPS = {"usr": 100, "crit": 100}
+
+    # Site do scraper no registro (src/scrapers/registry.py)
+    SITE: URLType | None = None
     
-    def __init__(self, periodic_queue: PeriodicQueue, storage: Storage) -> None:
+    def __init__(self, periodic_queue: PeriodicQueue, storage: Storage, http_client: HttpClient | None = None) -> None:
         self.periodic_queue = periodic_queue
         self.storage = storage
         self.running = True
         self._lock = Lock()
+        self.headers = {}
+        # Sessões HTTP com keep-alive por host, usadas por todas as requisições do scraper
+        self.http = http_client if http_client is not None else HttpClient()
+        # Subpáginas de um filme são buscadas em paralelo por este executor
+        self._fetch_executor = ThreadPoolExecutor(max_workers=4)
+        self._started_navigations = {}
+        # Política de bloqueio de requisições dos contextos do Playwright, se o site usar
+        self.request_policy = None
+        # Backend do BeautifulSoup usado em todas as páginas (ver src/parsing.py)
+        self.parser_backend = DEFAULT_BACKEND
+        # Parsing só dos nós declarados pelos extratores; False monta a árvore inteira
+        self.targeted_parsing = True
+        self.page_filter = None
+        if self.PAGE_TARGETS:
+            self.page_filter = TargetFilter(t for targets in self.PAGE_TARGETS.values() for t in targets)
+        # As reviews seguem a paginação até o limite do tipo e vão para o
+        # `review_sink`; o filme guarda só as `review_sample` primeiras.
+        # Sem destino, o filme guarda todas até o limite.
+        self.review_caps = dict(self.REVIEW_CAPS)
+        self.review_sample = 10
+        self.review_sink: ReviewSink | None = None
+        # Pool de processos que extrai a página principal; None extrai na própria thread
+        self.parse_pool: ParsePool | None = None
+        # Links de "more like this" enfileirados por filme enquanto a fila
+        # do site sinaliza backpressure (janela cheia, URLs indo para o disco)
+        self.backpressure_links = 4
 
         # Métricas
         self.name = ""
@@ -21,16 +76,25 @@ class Scraper(ABC):
         self._end_time = None
         self._phase_times = {}
         self._new_urls_count = 0
+        self._dropped_links = 0
         self._errors = 0
+        # Caminhos rápidos de extração: nome -> [acertos, quedas para o caminho lento]
+        self._fast_path = {}
+        # Reviews lidas por tipo
+        self._reviews_collected = {}
+        # Campos dos schemas: nome -> tempos de extração, e quantas vezes vieram vazios
+        self._field_times = {}
+        self._field_empty = {}
     
     def stop(self) -> None:
         with self._lock:
             self.running = False
-        self.periodic_queue.put(URL("ScraperEnded!", URLType.END))
+        # um marcador por worker acorda quem estiver bloqueado na fila compartilhada
+        self.periodic_queue.put_marker(URL("ScraperEnded!", URLType.END))
     
     def run(self) -> None:
         # Marca o início do crawler
-        self._start_time = time.perf_counter()
+        self.mark_started()
 
         while True:
             with self._lock:
@@ -40,17 +104,30 @@ class Scraper(ABC):
             # mede tempo por filme
             start = time.perf_counter()
             resposta = self.scrap()
+            self.finish_fetch_plan()
             if resposta == 0:
                 end = time.perf_counter()
-                elapsed = end - start
-
-                # salva o tempo do filme atual
-                with self._lock:
-                    self._scrap_times.append(elapsed)
+                self.record_scrap_time(end - start)
 
         # fim do crawler
+        self.mark_finished()
+        self.close()
+
+    def mark_started(self) -> None:
+        self._start_time = time.perf_counter()
+
+    def mark_finished(self) -> None:
         self._end_time = time.perf_counter()
 
+    def record_scrap_time(self, elapsed: float) -> None:
+        """Salva o tempo gasto no filme atual."""
+        with self._lock:
+            self._scrap_times.append(elapsed)
+
+    def close(self) -> None:
+        """Libera recursos presos à thread do scraper. Chamado ao fim de run()."""
+        self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+
     def get_total_runtime(self) -> float:
         """Retorna o tempo total de execução do crawler."""
         if self._start_time is None:
@@ -71,40 +148,452 @@ class Scraper(ABC):
                 return 0.0
             return sum(self._scrap_times) / len(self._scrap_times)
     
+    def sub_resources(self, url: URL) -> list[str]:
+        """Subpáginas que o site precisa para um filme, derivadas da URL principal."""
+        return []
+
+    def resize_fetch_executor(self, max_workers: int) -> None:
+        """Troca o executor das subpáginas, p.ex. quando vários filmes correm juntos."""
+        old = self._fetch_executor
+        self._fetch_executor = ThreadPoolExecutor(max_workers=max_workers)
+        old.shutdown(wait=False)
+
+    def start_fetch_plan(self, url: URL) -> None:
+        """Dispara em paralelo as subpáginas declaradas em sub_resources()."""
+        self.finish_fetch_plan()
+        plan = FetchPlan(self._fetch_executor)
+        for sub_url in self.sub_resources(url):
+            plan.add(sub_url, self.http.get, sub_url, headers=self.headers)
+        _current_plan.set(plan)
+
+    def finish_fetch_plan(self) -> None:
+        """Descarta as subpáginas planejadas que não foram usadas."""
+        plan = _current_plan.get()
+        if plan is not None:
+            plan.cancel()
+            _current_plan.set(None)
+        self.abandon_navigations()
+
+    def abandon_navigations(self) -> None:
+        """Libera na política as navegações disparadas e nunca esperadas por load_page()."""
+        for page, _ in self._started_navigations.values():
+            self._abandon_page(page)
+        self._started_navigations = {}
+
+    def fetch(self, url: str):
+        """Faz um GET pelo pool de sessões do scraper, usando o plano do filme se houver."""
+        plan = _current_plan.get()
+        if plan is not None:
+            planned = plan.take(url)
+            if planned is not None:
+                return planned.result()
+        return self.http.get(url, headers=self.headers)
+
+    def parse(self, markup, targets: TargetFilter | None = None):
+        """Monta a árvore de uma página com o backend configurado, só com `targets` se dados."""
+        t0 = time.time()
+        try:
+            return make_soup(markup, self.parser_backend, targets if self.targeted_parsing else None)
+        finally:
+            self.end_phase("Parse do HTML", t0)
+
+    def embedded_json(self, name: str, body, attr: str, value: str, extract=None):
+        """
+        Caminho rápido: JSON de um `<script attr="value">` lido direto dos bytes
+        da resposta, sem montar a árvore. `extract` recorta do JSON a parte que
+        interessa. Retorna None quando falha, e quem chamou usa o DOM; um
+        resultado vazio ({} ou []) é um acerto, e cabe a quem chamou tratá-lo.
+        """
+        data = extract_script_json(body, attr, value)
+        if data is not None and extract is not None:
+            try:
+                data = extract(data)
+            except Exception:
+                data = None
+        self.record_fast_path(name, data is not None)
+        return data
+
+    @abstractmethod
+    def extract_page(self, url_str: str, body: bytes) -> tuple[Movie, dict] | None:
+        """
+        Etapas da página principal do filme que só leem o HTML: parse, campos
+        do schema e o que mais sair da árvore. Não acessa a rede nem as filas,
+        para poder rodar num processo do pool de parsing. Retorna o filme e os
+        campos do schema, ou None se a página não é de um filme.
+        """
+        pass
+
+    def extract_main_page(self, url_str: str, body: bytes) -> tuple[Movie, dict] | None:
+        """extract_page() num processo do pool de parsing, se houver, ou na própria thread."""
+        if self.parse_pool is None:
+            return self.extract_page(url_str, body)
+        t0 = time.time()
+        try:
+            page, metrics = self.parse_pool.extract(self.SITE, url_str, body)
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha no pool de parsing na URL {url_str}; extraindo na thread. Erro: {e}")
+            return self.extract_page(url_str, body)
+        finally:
+            self.end_phase("Pool de parsing (ida e volta)", t0)
+        self.merge_metrics(metrics)
+        return page
+
+    def take_metrics(self) -> dict:
+        """Métricas de extração acumuladas desde a última chamada, zerando-as."""
+        with self._lock:
+            metrics = {
+                "errors": self._errors,
+                "phases": self._phase_times,
+                "fields": self._field_times,
+                "empty": self._field_empty,
+                "fast_path": self._fast_path,
+            }
+            self._errors = 0
+            self._phase_times = {}
+            self._field_times = {}
+            self._field_empty = {}
+            self._fast_path = {}
+        return metrics
+
+    def merge_metrics(self, metrics: dict) -> None:
+        """Soma as métricas que um processo do pool de parsing devolveu com a página."""
+        with self._lock:
+            self._errors += metrics["errors"]
+            for phase, times in metrics["phases"].items():
+                self._phase_times.setdefault(phase, []).extend(times)
+            for name, times in metrics["fields"].items():
+                self._field_times.setdefault(name, []).extend(times)
+            for name, empty in metrics["empty"].items():
+                self._field_empty[name] = self._field_empty.get(name, 0) + empty
+            for name, (hits, misses) in metrics["fast_path"].items():
+                counts = self._fast_path.setdefault(name, [0, 0])
+                counts[0] += hits
+                counts[1] += misses
+
+    def extract_fields(self, schema: Schema, site, movie: Movie, url_str: str) -> dict | None:
+        """
+        Roda os campos do schema sobre a página, guardando no filme os que têm
+        setter. Retorna os valores por nome, ou None se faltar um obrigatório.
+        """
+        t0 = time.perf_counter()
+        try:
+            data = schema.load_json(site)
+        except Exception as e:
+            self._errors += 1
+            print(f"[ERROR] Falha ao obter JSON-LD da URL {url_str}. Erro: {e}")
+            data = None
+        self._record_field("JSON-LD", t0, data is not None)
+
+        values = {}
+        for field in schema.fields:
+            t0 = time.perf_counter()
+            try:
+                value = field.extract(site, data)
+            except Exception as e:
+                self._errors += 1
+                print(f"[ERROR] Falha ao obter {field.label} na URL {url_str}. Erro: {e}")
+                value = None
+            filled = value is not None and value != []
+            self._record_field(field.name, t0, filled)
+            if not filled and field.required:
+                return None
+            if filled and field.setter is not None:
+                getattr(movie, field.setter)(value)
+            values[field.name] = value
+        return values
+
+    def enqueue_new_movies(self, links: list, url_type: URLType, parent: URL | None = None,
+                           movie: Movie | None = None) -> None:
+        """
+        Coloca na fila do site os filmes encontrados na página. Os links são
+        URLs ou pares (URL, título); a profundidade vem de `parent` e a
+        popularidade, das avaliações de `movie` (ver src/priority.py). Sob
+        backpressure da fila, só os `backpressure_links` primeiros entram.
+        """
+        depth = parent.depth + 1 if parent is not None else 0
+        popularity = self.popularity(movie) if movie is not None else None
+        if self.periodic_queue.backpressure() and len(links) > self.backpressure_links:
+            # os sites listam os mais parecidos primeiro
+            self._dropped_links += len(links) - self.backpressure_links
+            links = links[:self.backpressure_links]
+        for link in links:
+            link, title = link if isinstance(link, tuple) else (link, None)
+            self.periodic_queue.put(URL(link, url_type, depth=depth, title=title, popularity=popularity))
+            self._new_urls_count += 1
+
+    @staticmethod
+    def popularity(movie: Movie) -> int | None:
+        """Maior quantidade de avaliações (usuários ou críticos) do filme."""
+        counts = []
+        for count in (movie.get_usr_reviews_count(), movie.get_crit_reviews_count()):
+            try:
+                counts.append(int(count))
+            except (TypeError, ValueError):
+                pass
+        return max(counts) if counts else None
+
+    def _record_field(self, name: str, t0: float, filled: bool) -> None:
+        self._field_times.setdefault(name, []).append(time.perf_counter() - t0)
+        if not filled:
+            self._field_empty[name] = self._field_empty.get(name, 0) + 1
+
+    def record_fast_path(self, name: str, hit: bool) -> None:
+        """Conta um acerto ou uma queda para o caminho lento de um atalho de extração."""
+        with self._lock:
+            counts = self._fast_path.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def collect_reviews(self, movie: Movie, kind: str, movie_url: str,
+                        reviews: Generator[Review, None, None]) -> int:
+        """
+        Consome o fluxo de reviews de um tipo até o limite configurado. Como os
+        fluxos são geradores, as páginas seguintes só são buscadas se o limite
+        ainda não foi atingido.
+        """
+        count = 0
+        try:
+            for review in islice(reviews, self.review_caps.get(kind, 0)):
+                self._keep_review(movie, kind, movie_url, review, count)
+                count += 1
+        finally:
+            reviews.close()
+            self._count_reviews(kind, count)
+        return count
+
+    async def collect_reviews_async(self, movie: Movie, kind: str, movie_url: str,
+                                    reviews: AsyncGenerator[Review, None]) -> int:
+        """collect_reviews() para fluxos assíncronos."""
+        cap = self.review_caps.get(kind, 0)
+        count = 0
+        try:
+            # como o islice() da versão síncrona, o limite é conferido antes de
+            # pedir a próxima review, que pode custar uma página nova
+            if cap > 0:
+                async for review in reviews:
+                    self._keep_review(movie, kind, movie_url, review, count)
+                    count += 1
+                    if count >= cap:
+                        break
+        finally:
+            await reviews.aclose()
+            self._count_reviews(kind, count)
+        return count
+
+    def _keep_review(self, movie: Movie, kind: str, movie_url: str, review: Review, index: int) -> None:
+        if self.review_sink is not None:
+            self.review_sink.write(movie_url, kind, review)
+            if index >= self.review_sample:
+                return
+        if kind == "crit":
+            movie.add_critic_review(review)
+        else:
+            movie.add_user_review(review)
+
+    def _count_reviews(self, kind: str, count: int) -> None:
+        with self._lock:
+            self._reviews_collected[kind] = self._reviews_collected.get(kind, 0) + count
+
+    def throttle(self, url: str) -> None:
+        """Espera a vez do host de `url` no limitador compartilhado, se houver."""
+        if self.http.rate_limiter is not None:
+            self.http.rate_limiter.acquire(url)
+
+    def start_navigation(self, page, url: str) -> None:
+        """Dispara a navegação e volta assim que a resposta principal chega."""
+        self.throttle(url)
+        if self.request_policy is not None:
+            self.request_policy.start_page(page)
+        t0 = time.perf_counter()
+        try:
+            # o navegador continua carregando a página enquanto as outras são disparadas
+            page.goto(url, wait_until="commit")
+        except Exception:
+            self._abandon_page(page)
+            raise
+        self._started_navigations[url] = (page, t0)
+
+    def load_page(self, page, url: str) -> None:
+        """Garante que `page` está em `url` com o DOM carregado."""
+        started = self._started_navigations.pop(url, None)
+        try:
+            if started is not None and started[0] is page:
+                t0 = started[1]
+                page.wait_for_load_state("domcontentloaded")
+            else:
+                self.throttle(url)
+                if self.request_policy is not None:
+                    self.request_policy.start_page(page)
+                t0 = time.perf_counter()
+                page.goto(url, wait_until="domcontentloaded")
+        except Exception:
+            self._abandon_page(page)
+            raise
+        if self.request_policy is not None:
+            self.request_policy.finish_page(page, time.perf_counter() - t0)
+
+    async def goto_async(self, page, url: str) -> None:
+        """load_page() para páginas da API assíncrona do Playwright."""
+        if self.http.rate_limiter is not None:
+            await self.http.rate_limiter.acquire_async(url)
+        if self.request_policy is not None:
+            self.request_policy.start_page(page)
+        t0 = time.perf_counter()
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+        except Exception:
+            self._abandon_page(page)
+            raise
+        if self.request_policy is not None:
+            self.request_policy.finish_page(page, time.perf_counter() - t0)
+
+    def _abandon_page(self, page) -> None:
+        if self.request_policy is not None:
+            self.request_policy.abandon_page(page)
+
+    def submit_phase(self, name, fn, *args):
+        """Executa uma etapa em paralelo com as demais, registrando o seu tempo."""
+        def task():
+            t0 = time.time()
+            try:
+                return fn(*args)
+            finally:
+                self.end_phase(name, t0)
+        # as threads do executor não herdam o contexto; sem a cópia, os
+        # fetch() da etapa não veriam o plano de subpáginas do filme
+        return self._fetch_executor.submit(copy_context().run, task)
+
+    async def run_phase_async(self, name, coro):
+        """Aguarda a corrotina de uma etapa registrando o seu tempo."""
+        t0 = time.time()
+        try:
+            return await coro
+        finally:
+            self.end_phase(name, t0)
+
     def end_phase(self, name, t0):
         dt = time.time() - t0
         self._phase_times.setdefault(name, []).append(dt)
     
     def print_metrics(self) -> None:
         """Imprime métricas gerais sobre o crawler."""
-        with self._lock:
-            scrap_times = list(self._scrap_times)
+        Scraper.print_site_metrics([self])
+
+    @staticmethod
+    def print_site_metrics(workers: list["Scraper"]) -> None:
+        """Imprime as métricas somadas de todos os workers de um mesmo site."""
+        scrap_times = []
+        phase_times = {}
+        fast_path = {}
+        reviews = {}
+        field_times = {}
+        field_empty = {}
+        new_urls = 0
+        dropped_links = 0
+        errors = 0
+        for worker in workers:
+            scrap_times.extend(worker.get_scrap_times())
+            new_urls += worker._new_urls_count
+            dropped_links += worker._dropped_links
+            errors += worker._errors
+            for name, (hits, misses) in list(worker._fast_path.items()):
+                counts = fast_path.setdefault(name, [0, 0])
+                counts[0] += hits
+                counts[1] += misses
+            for kind, count in list(worker._reviews_collected.items()):
+                reviews[kind] = reviews.get(kind, 0) + count
+            for phase, times in list(worker._phase_times.items()):
+                phase_times.setdefault(phase, []).extend(times)
+            for name, times in list(worker._field_times.items()):
+                field_times.setdefault(name, []).extend(times)
+            for name, empty in list(worker._field_empty.items()):
+                field_empty[name] = field_empty.get(name, 0) + empty
 
-        total_runtime = self.get_total_runtime()
+        # do primeiro worker a começar até o último a terminar
+        starts = [w._start_time for w in workers if w._start_time is not None]
+        ends = [w._end_time if w._end_time is not None else time.perf_counter() for w in workers if w._start_time is not None]
+        total_runtime = max(ends) - min(starts) if starts else 0.0
         total_movies = len(scrap_times)
-        avg = self.get_average_scrap_time() if total_movies > 0 else 0.0
-        
-        new_urls = self._new_urls_count
-        errors = self._errors
-        phase_times = {k: list(v) for k, v in self._phase_times.items()}
+        avg = sum(scrap_times) / total_movies if total_movies > 0 else 0.0
 
-        print(f"\n========== MÉTRICAS DO {self.name} ==========")
+        # workers do mesmo site podem compartilhar o cliente HTTP
+        new_connections = 0
+        reused_connections = 0
+        cache_hits = 0
+        cache_revalidated = 0
+        cache_misses = 0
+        for http in {id(w.http): w.http for w in workers}.values():
+            new, reused = http.connection_stats()
+            new_connections += new
+            reused_connections += reused
+            hits, revalidated, misses = http.cache_stats()
+            cache_hits += hits
+            cache_revalidated += revalidated
+            cache_misses += misses
+        cache_lookups = cache_hits + cache_revalidated + cache_misses
+
+        print(f"\n========== MÉTRICAS DO {workers[0].name} ==========")
         if total_movies > 0:
             print(f"Tempo total executado: {total_runtime:.4f} s")
+            print(f"Workers:                  {len(workers)}")
             print(f"Número de filmes obtidos: {total_movies}")
             print(f"Tempo médio/filme:        {avg:.4f} s")
             print(f"Tempo mínimo:             {min(scrap_times):.4f} s")
             print(f"Tempo máximo:             {max(scrap_times):.4f} s")
             print(f"URLs coletadas:           {new_urls}")
+            if dropped_links > 0:
+                print(f"Links descartados:        {dropped_links} (backpressure da fila)")
             print(f"Erros durante scraping:   {errors}")
+            print(f"Conexões HTTP novas:      {new_connections}")
+            print(f"Conexões reaproveitadas:  {reused_connections}")
+            if cache_lookups > 0:
+                hit_ratio = (cache_hits + cache_revalidated) / cache_lookups * 100
+                print(f"Cache HTTP:               {cache_hits} acertos, {cache_revalidated} revalidados, "
+                      f"{cache_misses} faltas ({hit_ratio:.1f}% servidos do disco)")
+            if reviews:
+                print(f"Reviews coletadas:        {reviews.get('usr', 0)} de usuários, "
+                      f"{reviews.get('crit', 0)} de críticos")
+            for name, (hits, misses) in fast_path.items():
+                print(f"Caminho rápido ({name}): {hits}/{hits + misses} acertos, {misses} pelo caminho lento")
             print("\n--- Tempo médio por etapa ---")
             for phase, times in phase_times.items():
                 print(f"{phase:40s} {sum(times)/len(times):.4f} s (amostras={len(times)})")
+            if field_times:
+                print("\n--- Tempo médio por campo ---")
+                for name, times in field_times.items():
+                    print(f"{name:40s} {sum(times)/len(times) * 1000:.3f} ms "
+                          f"(amostras={len(times)}, vazios={field_empty.get(name, 0)})")
         else:
             print(f"Nenhum filme coletado.")    
         print("==========================================\n")
 
-    @abstractmethod
     def scrap(self):
-        """Implementação do scraping."""
-        pass
\ No newline at end of file
+        """Pega a próxima URL da fila e faz o scraping do filme."""
+        try:
+            url = self.periodic_queue.get(timeout=5)
+        except Empty:
+            return  1
+
+        if url.get_type() == URLType.END:
+            return 1
+
+        # subpáginas do filme começam a ser buscadas junto com a página principal
+        self.start_fetch_plan(url)
+        resposta = 1
+        try:
+            resposta = self.scrap_movie(url)
+        finally:
+            self.periodic_queue.finish(url, resposta == 0)
+        return resposta
+
+    @abstractmethod
+    def scrap_movie(self, url: URL) -> int:
+        """Implementação do scraping de um filme. Retorna 0 em caso de sucesso."""
+        pass
+
+    async def scrap_movie_async(self, url: URL, context) -> int:
+        """
+        Versão usada pelo motor asyncio. `context` é um BrowserContext da API
+        assíncrona do Playwright. Por padrão roda scrap_movie() numa thread.
+        """
+        return await asyncio.to_thread(self.scrap_movie, url)
\ No newline at end of file
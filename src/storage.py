@@ -1,6 +1,7 @@
 from src.data_structures.movie import Movie
 from src.data_structures.url import URLType
 from src.observers import Observed
+from src.priority import title_key
 from threading import Lock
 import json
 from pathlib import Path
@@ -12,6 +13,14 @@ class Storage(Observed):
         self.scrapers = {}
         self.threshold = threshold
         self._lock = Lock()
+        # Fronteira persistente (FrontierStore) onde os filmes também são guardados, se houver
+        self.frontier = None
+        # PriorityScorer avisado a cada filme armazenado, se houver
+        self.scorer = None
+        # CrossSiteSeeder que procura o filme armazenado nos outros sites, se houver
+        self.seeder = None
+        # Título normalizado -> sites em que um filme com esse título foi coletado
+        self._titles = {}
 
     def get_total_movies(self) -> int:
         """Retorna o número total de filmes em todas as listas"""
@@ -19,12 +28,54 @@ class Storage(Observed):
             return sum(len(movies) for movies in self.scrapers.values())
     
     def store_movie(self, movie: Movie, type: URLType) -> None:
+        if self.frontier is not None:
+            self.frontier.save_movie(movie, type)
         with self._lock:
             self.scrapers[type].append(movie)
+            self._index_title(movie, type)
             total_movies = sum(len(movies) for movies in self.scrapers.values())
             
             if total_movies >= self.threshold:
                 self.notify()
+        # fora do lock: o scorer consulta sites_with_title
+        if self.scorer is not None:
+            self.scorer.movie_stored(movie.get_title(), type)
+        if self.seeder is not None:
+            self.seeder.movie_stored(movie, type)
+
+    def restore(self, movies: list[tuple[URLType, Movie]]) -> None:
+        """Recoloca os filmes de uma execução anterior, sem gravá-los de novo."""
+        with self._lock:
+            for type, movie in movies:
+                self.scrapers.setdefault(type, []).append(movie)
+                self._index_title(movie, type)
+            total_movies = sum(len(movies) for movies in self.scrapers.values())
+
+        if movies and total_movies >= self.threshold:
+            self.notify()
+
+    def _index_title(self, movie: Movie, type: URLType) -> None:
+        key = title_key(movie.get_title())
+        if key is not None:
+            self._titles.setdefault(key, set()).add(type)
+
+    def sites_with_title(self, key: str) -> frozenset[URLType]:
+        """Sites em que já há um filme com o título normalizado `key` (ver src/priority.py)."""
+        with self._lock:
+            return frozenset(self._titles.get(key, ()))
+
+    def print_overlap_metrics(self) -> None:
+        with self._lock:
+            sites_per_title = [len(sites) for sites in self._titles.values()]
+        sites = len(self.scrapers)
+
+        print("\n========== MÉTRICAS DE SOBREPOSIÇÃO ==========")
+        print(f"Títulos distintos:        {len(sites_per_title)}")
+        for count in range(sites, 0, -1):
+            print(f"Em {count} site(s):             {sites_per_title.count(count)}")
+        if self.scorer is not None:
+            print(f"URLs reavaliadas:         {self.scorer.rescored_count()}")
+        print("==========================================\n")
 
     def enroll_new_scraper(self, type: URLType) -> None:
         with self._lock:
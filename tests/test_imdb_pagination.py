@@ -0,0 +1,83 @@
+"""
+Paginação das reviews de usuários do IMDB a partir de uma gravação.
+
+As páginas em `tests/fixtures/` entram num ReplayStore como se tivessem sido
+gravadas numa coleta e o scraper as lê de volta no modo replay, sem rede.
+
+    python -m unittest discover tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.data_structures.periodic_queue import PeriodicQueue
+from src.data_structures.url import URL, URLType
+from src.network.http_client import HttpClient
+from src.network.replay import ReplayStore
+from src.scrapers.imdb_scraper import IMDBScraper
+from src.storage import Storage
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+MOVIE_URL = "https://www.imdb.com/title/tt1160419/"
+CURSOR = "g4wp7crmqizdeyyf72ux5z3x"
+PAGES = {
+    MOVIE_URL + "reviews": "imdb_reviews_1.html",
+    MOVIE_URL + "reviews/?paginationKey=" + CURSOR: "imdb_reviews_2.html",
+}
+
+
+def _response(url: str, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = CaseInsensitiveDict({"Content-Type": "text/html; charset=utf-8"})
+    response._content = body
+    return response
+
+
+class IMDBPaginationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+        recorder = ReplayStore(self.directory, "record")
+        for url, name in PAGES.items():
+            with open(os.path.join(FIXTURES, name), "rb") as f:
+                recorder.record_http(url, _response(url, f.read()))
+        recorder.close()
+
+        self.replay = ReplayStore(self.directory, "replay")
+        self.addCleanup(self.replay.close)
+        self.scraper = IMDBScraper(PeriodicQueue(0), Storage(), http_client=HttpClient(replay=self.replay))
+        self.addCleanup(self.scraper.close)
+
+    def test_cursor_da_primeira_pagina_leva_a_segunda(self):
+        reviews = list(self.scraper.iter_usr_reviews(URL(MOVIE_URL, URLType.IMDB)))
+
+        self.assertEqual([review.get_rating() for review in reviews], [9.0, 6.0, 7.0])
+        self.assertEqual(reviews[2].get_text(), "Slow in places, worth it on a big screen.")
+        self.assertIsNotNone(reviews[2].get_date())
+        # as duas páginas vieram da gravação e a segunda não tem próxima
+        self.assertEqual(self.replay._served, 2)
+        self.assertEqual(self.replay._misses, 0)
+        self.assertEqual(self.scraper._errors, 0)
+
+    def test_url_da_proxima_pagina_vem_do_end_cursor(self):
+        url = URL(MOVIE_URL, URLType.IMDB)
+        with open(os.path.join(FIXTURES, "imdb_reviews_1.html"), "rb") as f:
+            body = f.read()
+
+        next_url = self.scraper.next_usr_reviews_url(self.scraper.parse(body), body, url)
+
+        self.assertEqual(next_url, MOVIE_URL + "reviews/?paginationKey=" + CURSOR)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Paridade dos backends de parsing: extract_page() de cada site dá o mesmo
+filme com cada backend, com a árvore inteira e só com os nós de PAGE_TARGETS.
+A referência é o primeiro backend com a árvore inteira, como no benchmark
+benchmarks/parser_backends.py, que faz a mesma conferência sobre uma gravação.
+
+    python -m unittest discover tests
+"""
+import contextlib
+import io
+import os
+import unittest
+
+from src.config import PARSER_BACKENDS
+from src.data_structures.periodic_queue import PeriodicQueue
+from src.scrapers.imdb_scraper import IMDBScraper
+from src.scrapers.lettr_scraper import LettrScraper
+from src.scrapers.rott_scraper import RottScraper
+from src.storage import Storage
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# (scraper, URL da página, arquivo em fixtures/)
+PAGES = [
+    (IMDBScraper, "https://www.imdb.com/title/tt0133093/", "imdb_movie.html"),
+    (RottScraper, "https://www.rottentomatoes.com/m/the_matrix", "rott_movie.html"),
+    (LettrScraper, "https://letterboxd.com/film/the-matrix/", "lettr_movie.html"),
+]
+
+
+def movie_fields(movie) -> dict:
+    fields = {}
+    for name, value in vars(movie).items():
+        if isinstance(value, list):
+            value = [vars(item) if hasattr(item, "__dict__") else item for item in value]
+        fields[name] = value
+    return fields
+
+
+class ParserParityTest(unittest.TestCase):
+
+    def extract(self, scraper_class, url: str, body: bytes, backend: str, targeted: bool):
+        scraper = scraper_class(PeriodicQueue(0), Storage())
+        self.addCleanup(scraper.close)
+        scraper.parser_backend = backend
+        scraper.targeted_parsing = targeted
+        with contextlib.redirect_stdout(io.StringIO()):
+            page = scraper.extract_page(url, body)
+        self.assertIsNotNone(page)
+        self.assertEqual(scraper._errors, 0)
+        movie, fields = page
+        return movie_fields(movie), fields
+
+    def test_backends_extraem_o_mesmo_filme(self):
+        modes = [(backend, targeted) for backend in PARSER_BACKENDS for targeted in (False, True)]
+        for scraper_class, url, name in PAGES:
+            with open(os.path.join(FIXTURES, name), "rb") as f:
+                body = f.read()
+            reference = self.extract(scraper_class, url, body, *modes[0])
+            self.assertEqual(reference[0]["title"], "The Matrix")
+            for mode in modes[1:]:
+                with self.subTest(page=name, backend=mode[0], targeted=mode[1]):
+                    self.assertEqual(self.extract(scraper_class, url, body, *mode), reference)
+
+
+if __name__ == "__main__":
+    unittest.main()
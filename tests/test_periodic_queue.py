@@ -0,0 +1,79 @@
+"""
+Janela em memória da PeriodicQueue: as URLs que descem para o disco voltam
+na ordem certa.
+
+    python -m unittest discover tests
+"""
+import shutil
+import tempfile
+import unittest
+
+from src.data_structures.periodic_queue import PeriodicQueue
+from src.data_structures.url import URL, URLType
+
+
+def lettr_url(name: str) -> URL:
+    return URL(f"https://letterboxd.com/film/{name}/", URLType.LTTR)
+
+
+def film(url: URL) -> str:
+    return url.get_url().rstrip("/").rsplit("/", 1)[1]
+
+
+class _HotScorer:
+    """Prioridade 10 para os filmes "hot-*", 0 para os demais."""
+
+    def keys(self, url):
+        return set()
+
+    def score(self, url):
+        return 10 if film(url).startswith("hot") else 0
+
+
+class PeriodicQueueWindowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.spill_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spill_dir, True)
+
+    def queue(self, scorer=None) -> PeriodicQueue:
+        queue = PeriodicQueue(0, window=8, spill_dir=self.spill_dir)
+        queue.scorer = scorer
+        self.addCleanup(queue.close)
+        return queue
+
+    def drain(self, queue: PeriodicQueue) -> list[str]:
+        names = []
+        while queue.qsize():
+            names.append(film(queue.get()))
+        return names
+
+    def test_fifo_entre_iguais_passando_pelo_disco(self):
+        queue = self.queue()
+        names = [f"f{i}" for i in range(40)]
+        out = []
+        # retiradas no meio das inserções: URLs chegam enquanto outras estão em disco
+        for i, name in enumerate(names):
+            queue.put(lettr_url(name))
+            if i % 3 == 0:
+                out.append(film(queue.get()))
+        self.assertTrue(queue.backpressure())
+        out += self.drain(queue)
+
+        self.assertEqual(out, names)
+        self.assertFalse(queue.backpressure())
+
+    def test_prioridade_maior_passa_na_frente_das_urls_em_disco(self):
+        queue = self.queue(_HotScorer())
+        for i in range(20):
+            queue.put(lettr_url(f"f{i}"))
+        self.assertTrue(queue.backpressure())
+        queue.put(lettr_url("hot-1"))
+        queue.put(lettr_url("f20"))
+        queue.put(lettr_url("hot-2"))
+
+        self.assertEqual(self.drain(queue), ["hot-1", "hot-2"] + [f"f{i}" for i in range(21)])
+
+
+if __name__ == "__main__":
+    unittest.main()
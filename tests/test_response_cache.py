@@ -0,0 +1,142 @@
+"""
+Cache de respostas contra um servidor HTTP local.
+
+    python -m unittest discover tests
+"""
+import http.server
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from src.network.http_client import HttpClient
+from src.network.response_cache import ResponseCache
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """
+    /etag/<n> responde com ETag e /modified/<n> só com Last-Modified; ambos
+    devolvem 304 a uma requisição condicional que bate com o validador.
+    /plain/<n> não tem validadores. Todas as requisições ficam em `requests`.
+    """
+
+    LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        kind = self.path.split("/")[1]
+        body = f"corpo de {self.path}".encode() * 20
+        headers = {"Content-Type": "text/html"}
+        if kind == "etag":
+            headers["ETag"] = '"v1"'
+            not_modified = self.headers.get("If-None-Match") == '"v1"'
+        elif kind == "modified":
+            headers["Last-Modified"] = self.LAST_MODIFIED
+            not_modified = self.headers.get("If-Modified-Since") == self.LAST_MODIFIED
+        else:
+            not_modified = False
+
+        self.send_response(304 if not_modified else 200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0" if not_modified else str(len(body)))
+        self.end_headers()
+        if not not_modified:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def client(self, ttl: float = 3600, max_bytes: int = 1024 * 1024) -> tuple[HttpClient, ResponseCache]:
+        cache = ResponseCache(self.directory, max_bytes, ttls={kind: ttl for kind in ResponseCache.DEFAULT_TTLS})
+        self.addCleanup(cache.close)
+        return HttpClient(cache=cache), cache
+
+    def test_acerto_nao_vai_a_rede(self):
+        http, _ = self.client()
+        first = http.get(self.base + "/plain/1")
+        second = http.get(self.base + "/plain/1")
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(http.cache_stats(), (1, 0, 1))
+
+    def test_entrada_vencida_sem_validadores_busca_de_novo(self):
+        http, _ = self.client(ttl=0.2)
+        http.get(self.base + "/plain/1")
+        time.sleep(0.3)
+        http.get(self.base + "/plain/1")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertNotIn("If-None-Match", self.server.requests[1][1])
+        self.assertEqual(http.cache_stats(), (0, 0, 2))
+
+    def test_revalidacao_por_etag(self):
+        http, _ = self.client(ttl=0.2)
+        first = http.get(self.base + "/etag/1")
+        time.sleep(0.3)
+        second = http.get(self.base + "/etag/1")
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(self.server.requests[1][1].get("If-None-Match"), '"v1"')
+        self.assertEqual(http.cache_stats(), (0, 1, 1))
+
+        # a resposta 304 renova a validade
+        http.get(self.base + "/etag/1")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_revalidacao_por_if_modified_since(self):
+        http, _ = self.client(ttl=0.2)
+        first = http.get(self.base + "/modified/1")
+        time.sleep(0.3)
+        second = http.get(self.base + "/modified/1")
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(self.server.requests[1][1].get("If-Modified-Since"), _Handler.LAST_MODIFIED)
+        self.assertEqual(http.cache_stats(), (0, 1, 1))
+
+    def test_descarta_a_menos_usada_recentemente(self):
+        size = len(b"corpo de /plain/1" * 20)
+        http, cache = self.client(max_bytes=size * 2)
+        http.get(self.base + "/plain/1")
+        time.sleep(0.01)
+        http.get(self.base + "/plain/2")
+        time.sleep(0.01)
+        # o acesso a /plain/1 faz de /plain/2 a menos usada recentemente
+        http.get(self.base + "/plain/1")
+        time.sleep(0.01)
+        http.get(self.base + "/plain/3")
+
+        self.assertEqual(cache.evictions(), 1)
+        self.assertIsNone(cache.lookup(self.base + "/plain/2"))
+        self.assertIsNotNone(cache.lookup(self.base + "/plain/1"))
+        self.assertIsNotNone(cache.lookup(self.base + "/plain/3"))
+        self.assertLessEqual(cache.total_bytes(), size * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Conjunto de URLs vistas: o filtro de Bloom nunca descarta uma URL nova.
+
+    python -m unittest discover tests
+"""
+import os
+import unittest
+
+from src.data_structures.seen_set import SeenSet
+
+
+def imdb_urls(start: int, count: int) -> list[str]:
+    return [f"https://www.imdb.com/title/tt{i:07d}/" for i in range(start, start + count)]
+
+
+class SeenSetTest(unittest.TestCase):
+
+    def test_sem_fronteira_falsos_positivos_vao_para_a_tabela_de_chaves(self):
+        # filtro pequeno e com taxa alta para forçar falsos positivos
+        seen = SeenSet(capacity=500, error_rate=0.05)
+        self.addCleanup(seen.close)
+        urls = imdb_urls(0, 5000)
+
+        self.assertTrue(all(seen.add(url) for url in urls))
+        self.assertGreater(seen._false_positives, 0)
+        self.assertFalse(any(seen.add(url) for url in urls))
+        self.assertNotIn(imdb_urls(5000, 1)[0], seen)
+
+    def test_close_apaga_a_tabela_de_chaves(self):
+        seen = SeenSet()
+        seen.add(imdb_urls(0, 1)[0])
+        path = seen._keys.path
+        seen.close()
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_com_confirmacao_externa_nao_grava_chaves(self):
+        known = set(imdb_urls(0, 100))
+        seen = SeenSet(capacity=50, error_rate=0.05, exact=known.__contains__)
+        for url in known:
+            seen.add(url)
+
+        self.assertIsNone(seen._keys)
+        self.assertIn(imdb_urls(0, 1)[0], seen)
+
+
+if __name__ == "__main__":
+    unittest.main()